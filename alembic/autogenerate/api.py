@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from collections.abc import Iterator
 from collections.abc import Sequence
 import contextlib
@@ -8,9 +9,15 @@ from typing import Any
 from typing import TYPE_CHECKING
 
 from sqlalchemy import inspect
+from sqlalchemy.engine import Engine
 
 from . import compare
 from . import render
+from .fingerprint import read_fingerprints
+from .fingerprint import table_fingerprint
+from .fingerprint import write_fingerprints
+from .profile import AutogenProfile
+from .snapshot import ReflectionSnapshot
 from .. import util
 from ..operations import ops
 from ..runtime.plugins import Plugin
@@ -42,7 +49,12 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
-def compare_metadata(context: MigrationContext, metadata: MetaData) -> Any:
+def compare_metadata(
+    context: MigrationContext,
+    metadata: MetaData,
+    *,
+    snapshot: ReflectionSnapshot | None = None,
+) -> Any:
     """Compare a database schema to that given in a
     :class:`~sqlalchemy.schema.MetaData` instance.
 
@@ -155,6 +167,25 @@ def compare_metadata(context: MigrationContext, metadata: MetaData) -> Any:
      instance.
     :param metadata: a :class:`~sqlalchemy.schema.MetaData`
      instance.
+    :param snapshot: optional :class:`.ReflectionSnapshot`.  When the
+     :class:`.MigrationContext` has no database connection, or is in
+     offline ("as sql") mode, the database schema is read from the snapshot
+     rather than being reflected, so that a model may be compared to a
+     previously reflected database without connecting to it::
+
+        from alembic.autogenerate import ReflectionSnapshot
+
+        context = MigrationContext.configure(dialect_name="postgresql")
+        diffs = compare_metadata(
+            context,
+            metadata,
+            snapshot=ReflectionSnapshot("schema_snapshot.json"),
+        )
+
+     When a connection is present, the snapshot is used as described for
+     :class:`.ReflectionSnapshot`.
+
+     .. versionadded:: 1.19.2
 
     .. seealso::
 
@@ -163,13 +194,16 @@ def compare_metadata(context: MigrationContext, metadata: MetaData) -> Any:
 
     """
 
-    migration_script = produce_migrations(context, metadata)
+    migration_script = produce_migrations(context, metadata, snapshot=snapshot)
     assert migration_script.upgrade_ops is not None
     return migration_script.upgrade_ops.as_diffs()
 
 
 def produce_migrations(
-    context: MigrationContext, metadata: MetaData
+    context: MigrationContext,
+    metadata: MetaData,
+    *,
+    snapshot: ReflectionSnapshot | None = None,
 ) -> MigrationScript:
     """Produce a :class:`.MigrationScript` structure based on schema
     comparison.
@@ -179,6 +213,11 @@ def produce_migrations(
     :class:`.MigrationScript` object.   For an example of what this looks like,
     see the example in :ref:`customizing_revision`.
 
+    :param snapshot: optional :class:`.ReflectionSnapshot` from which the
+     database schema is read; see :paramref:`.compare_metadata.snapshot`.
+
+     .. versionadded:: 1.19.2
+
     .. seealso::
 
         :func:`.compare_metadata` - returns more fundamental "diff"
@@ -186,7 +225,9 @@ def produce_migrations(
 
     """
 
-    autogen_context = AutogenContext(context, metadata=metadata)
+    autogen_context = AutogenContext(
+        context, metadata=metadata, snapshot=snapshot
+    )
 
     migration_script = ops.MigrationScript(
         rev_id=None,
@@ -329,17 +370,71 @@ class AutogenContext:
 
     comparators: PriorityDispatcher
 
+    reflection_bind: Engine | Callable[[], Connection] | None = None
+    """An :class:`~sqlalchemy.engine.Engine`, or a callable returning a new
+    :class:`~sqlalchemy.engine.Connection`, used to reflect the database
+    schema over several connections in parallel.
+
+    This is obtained from the
+    :paramref:`.EnvironmentContext.configure.autogenerate_reflection_bind`
+    parameter.
+
+    .. versionadded:: 1.19.2
+
+    """
+
+    reflection_workers: int = 4
+    """The number of connections used in parallel to reflect the database
+    schema when :attr:`.AutogenContext.reflection_bind` is present.
+
+    .. versionadded:: 1.19.2
+
+    """
+
+    snapshot: ReflectionSnapshot | None = None
+    """A :class:`.ReflectionSnapshot` from which the reflected database
+    schema is restored when its heads match those of the database, and to
+    which it's saved otherwise.  When there's no database connection, the
+    schema is always read from the snapshot.
+
+    .. versionadded:: 1.19.2
+
+    """
+
+    table_fingerprints: dict[str, str] | None = None
+    """Fingerprints of the tables in the model as of the previous revision,
+    keyed on table key, for an incremental autogenerate run.
+
+    Tables in the model whose fingerprint matches are assumed to match the
+    database, and are neither reflected nor compared.
+
+    .. versionadded:: 1.19.2
+
+    """
+
+    profile: AutogenProfile | None = None
+    """An :class:`.AutogenProfile` which records the time taken by the
+    comparison functions and database round trips of this autogenerate run.
+
+    .. versionadded:: 1.19.2
+
+    """
+
     def __init__(
         self,
         migration_context: MigrationContext,
         metadata: MetaData | Sequence[MetaData] | None = None,
         opts: dict[str, Any] | None = None,
         autogenerate: bool = True,
+        snapshot: ReflectionSnapshot | None = None,
+        table_fingerprints: dict[str, str] | None = None,
+        profile: AutogenProfile | None = None,
     ) -> None:
         if (
             autogenerate
             and migration_context is not None
             and migration_context.as_sql
+            and snapshot is None
         ):
             raise util.CommandError(
                 "autogenerate can't use as_sql=True as it prevents querying "
@@ -358,6 +453,8 @@ class AutogenContext:
                     "autogenerate_plugins", ["alembic.autogenerate.*"]
                 ),
             )
+            if profile is not None:
+                self.comparators = profile.instrument(self.comparators)
 
         if opts is None:
             opts = migration_context.opts
@@ -399,15 +496,109 @@ class AutogenContext:
         self.imports = set()
         self.opts: dict[str, Any] = opts
         self._has_batch: bool = False
+        self._compiled_defaults: dict[Any, str] = {}
+        self._server_default_tables: set[tuple[str | None, str]] = set()
+
+        self.snapshot = snapshot
+        self.table_fingerprints = table_fingerprints
+        self.profile = profile
+        self.reflection_bind = opts.get("autogenerate_reflection_bind", None)
+        self.reflection_workers = opts.get(
+            "autogenerate_reflection_workers", self.reflection_workers
+        )
 
     @util.memoized_property
     def inspector(self) -> Inspector:
+        if self.snapshot is not None and (
+            self.connection is None or self.migration_context.as_sql
+        ):
+            return self.snapshot.offline_inspector(self.dialect)
         if self.connection is None:
             raise TypeError(
                 "can't return inspector as this "
                 "AutogenContext has no database connection"
             )
-        return inspect(self.connection)
+        inspector = inspect(self.connection)
+        if self.snapshot is not None:
+            self.snapshot.restore(
+                inspector, self._snapshot_heads, self._snapshot_key
+            )
+        return inspector
+
+    @util.memoized_property
+    def _snapshot_heads(self) -> tuple[str, ...]:
+        return self.migration_context.get_current_heads()
+
+    @property
+    def _snapshot_key(self) -> str:
+        assert self.connection is not None
+        return self.connection.engine.url.render_as_string(hide_password=True)
+
+    def _save_snapshot(self) -> None:
+        if (
+            self.snapshot is not None
+            and not self.snapshot.restored
+            and "inspector" in self.__dict__
+        ):
+            self.snapshot.save(
+                self.inspector, self._snapshot_heads, self._snapshot_key
+            )
+
+    @util.memoized_property
+    def _current_fingerprints(self) -> dict[str, str]:
+        assert self.dialect is not None
+        fingerprints = {}
+        for table in self.sorted_tables:
+            fingerprint = table_fingerprint(table, self.dialect)
+            if fingerprint is not None:
+                fingerprints[table.key] = fingerprint
+        return fingerprints
+
+    @util.memoized_property
+    def _unchanged_tables(self) -> set[tuple[str | None, str]]:
+        """Return the (schema, name) of the tables in the model whose
+        fingerprint matches that of the previous revision."""
+
+        if not self.table_fingerprints:
+            return set()
+        previous = self.table_fingerprints
+        table_key_to_table = self.table_key_to_table
+        return {
+            (table_key_to_table[key].schema, table_key_to_table[key].name)
+            for key, fingerprint in self._current_fingerprints.items()
+            if previous.get(key) == fingerprint
+        }
+
+    @property
+    def _parallel_reflection_workers(self) -> int:
+        if self.reflection_bind is None or not sqla_compat.sqla_2:
+            return 0
+        return self.reflection_workers
+
+    @contextlib.contextmanager
+    def _reflection_connection(self) -> Iterator[Connection]:
+        bind = self.reflection_bind
+        assert bind is not None and self.connection is not None
+        conn = bind.connect() if isinstance(bind, Engine) else bind()
+        try:
+            # carry over options such as schema_translate_map from the
+            # main connection, so that names resolve in the same way
+            conn.execution_options(**self.connection.get_execution_options())
+            if self.profile is not None:
+                with self.profile.track_connection(conn):
+                    yield conn
+            else:
+                yield conn
+        finally:
+            conn.close()
+
+    @contextlib.contextmanager
+    def _profiled(self) -> Iterator[None]:
+        if self.profile is not None:
+            with self.profile.run(self.connection):
+                yield
+        else:
+            yield
 
     @contextlib.contextmanager
     def _within_batch(self) -> Iterator[None]:
@@ -545,6 +736,10 @@ class RevisionContext:
             # e.g. multiple databases
         }
         self.generated_revisions = [self._default_revision()]
+        self._table_fingerprints: dict[str, dict[str, str]] = {}
+        self.profile = (
+            AutogenProfile() if command_args.get("profile") else None
+        )
 
     def _to_script(self, migration_script: MigrationScript) -> Script | None:
         template_args: dict[str, Any] = self.template_args.copy()
@@ -562,7 +757,7 @@ class RevisionContext:
             )
 
         assert migration_script.rev_id is not None
-        return self.script_directory.generate_revision(
+        script = self.script_directory.generate_revision(
             migration_script.rev_id,
             migration_script.message,
             refresh=True,
@@ -573,6 +768,12 @@ class RevisionContext:
             depends_on=migration_script.depends_on,
             **template_args,
         )
+        for upgrade_ops in migration_script.upgrade_ops_list:
+            if isinstance(upgrade_ops.ops, render._StreamedOps):
+                upgrade_ops.ops.close()
+        if script is not None and self._table_fingerprints:
+            write_fingerprints(script.path, self._table_fingerprints)
+        return script
 
     def run_autogenerate(
         self, rev: _GetRevArg, migration_context: MigrationContext
@@ -618,15 +819,46 @@ class RevisionContext:
                 ops.DowngradeOps([], downgrade_token=downgrade_token)
             )
 
+        snapshot_file = self.config.get_alembic_option(
+            "autogenerate_snapshot_file"
+        )
+        if autogenerate and snapshot_file:
+            snapshot = ReflectionSnapshot(
+                snapshot_file,
+                refresh=self.command_args.get("refresh_snapshot", False),
+            )
+        else:
+            snapshot = None
+
+        incremental = autogenerate and self.config.get_alembic_boolean_option(
+            "autogenerate_incremental"
+        )
+        if incremental:
+            table_fingerprints = self._previous_fingerprints(upgrade_token)
+        else:
+            table_fingerprints = None
+
         autogen_context = AutogenContext(
-            migration_context, autogenerate=autogenerate
+            migration_context,
+            autogenerate=autogenerate,
+            snapshot=snapshot,
+            table_fingerprints=table_fingerprints,
+            profile=self.profile if autogenerate else None,
         )
         self._last_autogen_context: AutogenContext = autogen_context
 
         if autogenerate:
+            if self.command_args.get("stream"):
+                self._stream_operations(
+                    migration_context, autogen_context, migration_script
+                )
             compare._populate_migration_script(
                 autogen_context, migration_script
             )
+            if incremental:
+                self._table_fingerprints[upgrade_token] = (
+                    autogen_context._current_fingerprints
+                )
 
         if self.process_revision_directives:
             self.process_revision_directives(
@@ -640,6 +872,55 @@ class RevisionContext:
         for migration_script in self.generated_revisions:
             migration_script._needs_render = True
 
+    def _stream_operations(
+        self,
+        migration_context: MigrationContext,
+        autogen_context: AutogenContext,
+        migration_script: MigrationScript,
+    ) -> None:
+        """Render the operations of the migration script as each table is
+        compared, rather than after the comparison completes."""
+
+        if (
+            self.process_revision_directives
+            or migration_context.opts["process_revision_directives"]
+        ):
+            raise util.CommandError(
+                "Streamed autogenerate can't be used with "
+                "process_revision_directives, as the operations are "
+                "rendered before the directives could be processed"
+            )
+        migration_script.upgrade_ops_list[-1].ops = render._StreamedOps(
+            autogen_context
+        )
+
+    def _previous_fingerprints(
+        self, upgrade_token: str
+    ) -> dict[str, str] | None:
+        """Return the table fingerprints stored alongside the single head
+        revision, if any."""
+
+        heads = self.script_directory.get_revisions("heads")
+        if len(heads) != 1 or heads[0] is None:
+            return None
+        fingerprints = read_fingerprints(heads[0].path)
+        if fingerprints is None:
+            return None
+        return fingerprints.get(upgrade_token)
+
+    def _report_profile(self) -> None:
+        """Print the profile of the autogenerate run, or write it to the
+        file given as the ``profile`` argument."""
+
+        if self.profile is None:
+            return
+        dest = self.command_args["profile"]
+        if dest is True:
+            self.config.print_stdout(self.profile.format())
+        else:
+            self.profile.write(dest)
+            self.config.print_stdout(f"Wrote autogenerate profile to {dest}")
+
     def _default_revision(self) -> MigrationScript:
         command_args: dict[str, Any] = self.command_args
         op = ops.MigrationScript(
@@ -46,9 +46,12 @@ def _produce_net_changes(
 ) -> None:
     assert autogen_context.dialect is not None
 
-    autogen_context.comparators.dispatch(
-        "autogenerate", qualifier=autogen_context.dialect.name
-    )(autogen_context, upgrade_ops)
+    with autogen_context._profiled():
+        autogen_context.comparators.dispatch(
+            "autogenerate", qualifier=autogen_context.dialect.name
+        )(autogen_context, upgrade_ops)
+
+    autogen_context._save_snapshot()
 
 
 Plugin.setup_plugin_from_module(schema, "alembic.autogenerate.schemas")
@@ -5,13 +5,10 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
-from sqlalchemy import inspect
-
+from .util import _InspectorConv
 from ...util import PriorityDispatchResult
 
 if TYPE_CHECKING:
-    from sqlalchemy.engine.reflection import Inspector
-
     from ...autogenerate.api import AutogenContext
     from ...operations.ops import UpgradeOps
     from ...runtime.plugins import Plugin
@@ -23,16 +20,14 @@ log = logging.getLogger(__name__)
 def _produce_net_changes(
     autogen_context: AutogenContext, upgrade_ops: UpgradeOps
 ) -> PriorityDispatchResult:
-    connection = autogen_context.connection
-    assert connection is not None
     include_schemas = autogen_context.opts.get("include_schemas", False)
 
-    inspector: Inspector = inspect(connection)
+    inspector = autogen_context.inspector
 
-    default_schema = connection.dialect.default_schema_name
+    default_schema = inspector.default_schema_name
     schemas: set[str | None]
     if include_schemas:
-        schemas = set(inspector.get_schema_names())
+        schemas = set(_InspectorConv(inspector).get_schema_names())
         # replace default schema name with None
         schemas.discard("information_schema")
         # replace the "default" schema with None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+import functools
 import logging
 import re
 from types import NoneType
@@ -17,8 +18,10 @@ from ...util import PriorityDispatchResult
 from ...util import sqla_compat
 
 if TYPE_CHECKING:
+    from sqlalchemy.sql.elements import ClauseElement
     from sqlalchemy.sql.elements import quoted_name
     from sqlalchemy.sql.schema import Column
+    from sqlalchemy.sql.schema import Table
 
     from ...autogenerate.api import AutogenContext
     from ...operations.ops import AlterColumnOp
@@ -27,6 +30,44 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+def _compile_for_compare(
+    expr: ClauseElement, autogen_context: AutogenContext
+) -> str:
+    """Compile a default expression with literal values rendered inline.
+
+    The string is cached for the duration of the autogenerate run on the
+    structure and values of the expression, so that a default such as
+    ``now()`` used by many columns is compiled once.
+
+    """
+    cache_key = expr._generate_cache_key()
+    if cache_key is not None:
+        try:
+            key: Any = (
+                cache_key.key,
+                tuple(bind.effective_value for bind in cache_key.bindparams),
+            )
+            compiled = autogen_context._compiled_defaults.get(key)
+        except TypeError:
+            # unhashable bound value
+            key = None
+        else:
+            if compiled is not None:
+                return compiled
+    else:
+        key = None
+
+    compiled = str(
+        expr.compile(
+            dialect=autogen_context.dialect,
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+    if key is not None:
+        autogen_context._compiled_defaults[key] = compiled
+    return compiled
+
+
 def _render_server_default_for_compare(
     metadata_default: Any, autogen_context: AutogenContext
 ) -> str | None:
@@ -34,11 +75,8 @@ def _render_server_default_for_compare(
         if isinstance(metadata_default.arg, str):
             metadata_default = metadata_default.arg
         else:
-            metadata_default = str(
-                metadata_default.arg.compile(
-                    dialect=autogen_context.dialect,
-                    compile_kwargs={"literal_binds": True},
-                )
+            metadata_default = _compile_for_compare(
+                metadata_default.arg, autogen_context
             )
     if isinstance(metadata_default, str):
         return metadata_default
@@ -46,6 +84,7 @@ def _render_server_default_for_compare(
         return None
 
 
+@functools.lru_cache(maxsize=1000)
 def _normalize_computed_default(sqltext: str) -> str:
     """we want to warn if a computed sql expression has changed.  however
     we don't want false positives and the warning is not that critical.
@@ -80,11 +119,9 @@ def _compare_computed_default(
     if not sqla_compat._server_default_is_computed(metadata_default):
         return PriorityDispatchResult.CONTINUE
 
-    rendered_metadata_default = str(
-        cast(sa_schema.Computed, metadata_col.server_default).sqltext.compile(
-            dialect=autogen_context.dialect,
-            compile_kwargs={"literal_binds": True},
-        )
+    rendered_metadata_default = _compile_for_compare(
+        cast(sa_schema.Computed, metadata_col.server_default).sqltext,
+        autogen_context,
     )
 
     # since we cannot change computed columns, we do only a crude comparison
@@ -96,11 +133,8 @@ def _compare_computed_default(
     )
 
     if isinstance(conn_col.server_default, sa_schema.Computed):
-        rendered_conn_default = str(
-            conn_col.server_default.sqltext.compile(
-                dialect=autogen_context.dialect,
-                compile_kwargs={"literal_binds": True},
-            )
+        rendered_conn_default = _compile_for_compare(
+            conn_col.server_default.sqltext, autogen_context
         )
         rendered_conn_default = _normalize_computed_default(
             rendered_conn_default
@@ -259,25 +293,28 @@ def _dialect_impl_compare_server_default(
     # _dialect_impl_compare_server_default directly
     alter_column_op.existing_server_default = conn_col_default
 
-    if not isinstance(
-        metadata_default, (DefaultClause, NoneType)
-    ) or not isinstance(conn_col_default, (DefaultClause, NoneType)):
+    comparison = _dialect_impl_comparison(
+        autogen_context, conn_col, metadata_col
+    )
+    if comparison is None:
         return PriorityDispatchResult.CONTINUE
 
     migration_context = autogen_context.migration_context
 
-    rendered_metadata_default = _render_server_default_for_compare(
-        metadata_default, autogen_context
-    )
-    rendered_conn_default = (
-        cast(Any, conn_col_default).arg.text if conn_col_default else None
-    )
+    conn_table = getattr(conn_col, "table", None)
+    metadata_table = getattr(metadata_col, "table", None)
+    if (
+        conn_table is not None
+        and metadata_table is not None
+        and (schema, tname) not in autogen_context._server_default_tables
+    ):
+        autogen_context._server_default_tables.add((schema, tname))
+        _prepare_server_default_comparisons(
+            autogen_context, schema, tname, conn_table, metadata_table
+        )
 
     is_diff = migration_context.impl.compare_server_default(  # type: ignore[no-untyped-call]  # noqa: E501
-        conn_col,
-        metadata_col,
-        rendered_metadata_default,
-        rendered_conn_default,
+        *comparison
     )
     if is_diff:
         alter_column_op.modify_server_default = metadata_default
@@ -291,6 +328,72 @@ def _dialect_impl_compare_server_default(
     return PriorityDispatchResult.CONTINUE
 
 
+def _dialect_impl_comparison(
+    autogen_context: AutogenContext,
+    conn_col: Column[Any],
+    metadata_col: Column[Any],
+) -> tuple[Column[Any], Column[Any], str | None, str | None] | None:
+    """Return the arguments to pass to the dialect impl's
+    ``compare_server_default()`` for a pair of columns, or None if their
+    server defaults are not compared by the dialect impl."""
+
+    metadata_default = metadata_col.server_default
+    conn_col_default = conn_col.server_default
+    if (
+        conn_col_default is None
+        and metadata_default is None
+        or not isinstance(metadata_default, (DefaultClause, NoneType))
+        or not isinstance(conn_col_default, (DefaultClause, NoneType))
+    ):
+        return None
+
+    return (
+        conn_col,
+        metadata_col,
+        _render_server_default_for_compare(metadata_default, autogen_context),
+        cast(Any, conn_col_default).arg.text if conn_col_default else None,
+    )
+
+
+def _prepare_server_default_comparisons(
+    autogen_context: AutogenContext,
+    schema: str | None,
+    tname: quoted_name | str,
+    conn_table: Table,
+    metadata_table: Table,
+) -> None:
+    """Pass the server default comparisons of all the columns of a table
+    to the dialect impl ahead of the first one being made, so that those
+    that are made on the server may be made together."""
+
+    comparisons = []
+    for metadata_col in metadata_table.c:
+        cname = metadata_col.name
+        if (
+            metadata_col.system
+            or cname not in conn_table.c
+            or not autogen_context.run_name_filters(
+                cname, "column", {"table_name": tname, "schema_name": schema}
+            )
+        ):
+            continue
+        conn_col = conn_table.c[cname]
+        if not autogen_context.run_object_filters(
+            metadata_col, cname, "column", False, conn_col
+        ):
+            continue
+        comparison = _dialect_impl_comparison(
+            autogen_context, conn_col, metadata_col
+        )
+        if comparison is not None:
+            comparisons.append(comparison)
+
+    if comparisons:
+        autogen_context.migration_context.impl.prepare_server_default_comparisons(  # noqa: E501
+            comparisons
+        )
+
+
 def _setup_autoincrement(
     autogen_context: AutogenContext,
     alter_column_op: AlterColumnOp,
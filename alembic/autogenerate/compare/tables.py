@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 import contextlib
 import logging
 from typing import TYPE_CHECKING
 
 from sqlalchemy import event
+from sqlalchemy import inspect
 from sqlalchemy import schema as sa_schema
 from sqlalchemy.util import OrderedSet
 
 from .util import _InspectorConv
+from ..render import _StreamedOps
 from ...operations import ops
 from ...util import PriorityDispatchResult
 
@@ -43,8 +47,18 @@ def _autogen_for_tables(
     )
     version_table = autogen_context.migration_context.version_table
 
+    # in an incremental run, tables whose fingerprint is unchanged since
+    # the previous revision are left out of both sides of the comparison
+    unchanged = autogen_context._unchanged_tables
+    conn_unchanged = {
+        (None if schema == inspector.default_schema_name else schema, name)
+        for schema, name in unchanged
+    }
+
     for schema_name in schemas:
-        tables = available = set(inspector.get_table_names(schema=schema_name))
+        tables = available = set(
+            _InspectorConv(inspector).get_table_names(schema_name)
+        )
         if schema_name == version_table_schema:
             tables = tables.difference(
                 [autogen_context.migration_context.version_table]
@@ -53,7 +67,8 @@ def _autogen_for_tables(
         tablenames = [
             tname
             for tname in tables
-            if autogen_context.run_name_filters(
+            if (schema_name, tname) not in conn_unchanged
+            and autogen_context.run_name_filters(
                 tname, "table", {"schema_name": schema_name}
             )
         ]
@@ -61,12 +76,12 @@ def _autogen_for_tables(
         conn_table_names.update((schema_name, tname) for tname in tablenames)
 
         inspector = autogen_context.inspector
-        insp = _InspectorConv(inspector)
-        insp.pre_cache_tables(schema_name, tablenames, available)
+        _pre_cache_tables(autogen_context, schema_name, tablenames, available)
 
     metadata_table_names = OrderedSet(
         [(table.schema, table.name) for table in autogen_context.sorted_tables]
     ).difference([(version_table_schema, version_table)])
+    metadata_table_names = metadata_table_names.difference(unchanged)
 
     _compare_tables(
         conn_table_names,
@@ -79,6 +94,59 @@ def _autogen_for_tables(
     return PriorityDispatchResult.CONTINUE
 
 
+def _pre_cache_tables(
+    autogen_context: AutogenContext,
+    schema_name: str | None,
+    tablenames: list[str],
+    available: Collection[str],
+) -> None:
+    insp = _InspectorConv(autogen_context.inspector)
+    if insp.is_pre_cached(schema_name):
+        return
+
+    workers = autogen_context._parallel_reflection_workers
+    shards = [tablenames[i::workers] for i in range(workers)]
+    shards = [shard for shard in shards if shard]
+
+    if len(shards) < 2:
+        insp.pre_cache_tables(schema_name, tablenames, available)
+        return
+
+    default_schema = autogen_context.inspector.default_schema_name
+
+    # each shard of table names is reflected on its own connection; the
+    # results are merged into the inspector of the main connection, from
+    # which tables are then reflected into the MetaData serially.
+    def pre_cache_shard(shard: list[str]) -> _InspectorConv | None:
+        with autogen_context._reflection_connection() as conn:
+            shard_insp = _InspectorConv(inspect(conn))
+            if (
+                schema_name is None
+                and shard_insp.inspector.default_schema_name != default_schema
+            ):
+                # the connection resolves the default schema differently,
+                # e.g. due to a search_path set up on the main connection
+                return None
+            shard_insp.pre_cache_tables(schema_name, shard, available)
+            return shard_insp
+
+    with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+        shard_insps = list(executor.map(pre_cache_shard, shards))
+
+    if any(shard_insp is None for shard_insp in shard_insps):
+        log.info(
+            "Default schema of reflection connections does not match "
+            "that of the main connection; reflecting default schema "
+            "on the main connection only"
+        )
+        insp.pre_cache_tables(schema_name, tablenames, available)
+        return
+
+    for shard_insp in shard_insps:
+        assert shard_insp is not None
+        insp.merge_pre_cache(shard_insp)
+
+
 def _compare_tables(
     conn_table_names: set[tuple[str | None, str]],
     metadata_table_names: set[tuple[str | None, str]],
@@ -86,7 +154,34 @@ def _compare_tables(
     upgrade_ops: UpgradeOps,
     autogen_context: AutogenContext,
 ) -> None:
-    default_schema = inspector.bind.dialect.default_schema_name
+    upgrade_ops.ops.extend(
+        _iter_compare_tables(
+            conn_table_names,
+            metadata_table_names,
+            inspector,
+            autogen_context,
+            reflect_lazily=isinstance(upgrade_ops.ops, _StreamedOps),
+        )
+    )
+
+
+def _iter_compare_tables(
+    conn_table_names: set[tuple[str | None, str]],
+    metadata_table_names: set[tuple[str | None, str]],
+    inspector: Inspector,
+    autogen_context: AutogenContext,
+    reflect_lazily: bool = False,
+) -> Iterator[ops.MigrateOperation]:
+    """Compare tables, yielding the operations of each table as soon as
+    that table has been compared, so that a streamed revision can render
+    them without holding those of the other tables.
+
+    With ``reflect_lazily``, each existing table is reflected only when it
+    is about to be compared; otherwise, all of them are reflected first.
+
+    """
+
+    default_schema = inspector.default_schema_name
 
     # tables coming from the connection will not have "schema"
     # set if it matches default_schema_name; so we need a list
@@ -119,9 +214,7 @@ def _compare_tables(
         if autogen_context.run_object_filters(
             metadata_table, tname, "table", False, None
         ):
-            upgrade_ops.ops.append(
-                ops.CreateTableOp.from_table(metadata_table)
-            )
+            yield ops.CreateTableOp.from_table(metadata_table)
             log.info("Detected added table %r", name)
             modify_table_ops = ops.ModifyTableOps(tname, [], schema=s)
 
@@ -136,7 +229,7 @@ def _compare_tables(
                 metadata_table,
             )
             if not modify_table_ops.is_empty():
-                upgrade_ops.ops.append(modify_table_ops)
+                yield modify_table_ops
 
     removal_metadata = sa_schema.MetaData()
     for s, tname in conn_table_names.difference(metadata_table_names):
@@ -165,40 +258,63 @@ def _compare_tables(
                 "table", qualifier=autogen_context.dialect.name
             )(autogen_context, modify_table_ops, s, tname, t, None)
             if not modify_table_ops.is_empty():
-                upgrade_ops.ops.append(modify_table_ops)
+                yield modify_table_ops
 
-            upgrade_ops.ops.append(ops.DropTableOp.from_table(t))
+            yield ops.DropTableOp.from_table(t)
             log.info("Detected removed table %r", name)
 
     existing_tables = conn_table_names.intersection(metadata_table_names)
 
     existing_metadata = sa_schema.MetaData()
-    conn_column_info = {}
-    for s, tname in existing_tables:
+
+    def reflect_existing(s: str | None, tname: str) -> Table:
         name = sa_schema._get_table_key(tname, s)
-        exists = name in existing_metadata.tables
 
         # a name might be present already if a previous reflection pulled
-        # this table in via foreign key constraint
-        t = sa_schema.Table(tname, existing_metadata, schema=s)
+        # this table in via foreign key constraint, or as a placeholder
+        # for the referred table of a foreign key compared previously,
+        # which is replaced by the reflected table
+        placeholder = existing_metadata.tables.get(name)
+        if placeholder is not None and placeholder.info.get(
+            "alembic_placeholder"
+        ):
+            existing_metadata.remove(placeholder)
+        exists = name in existing_metadata.tables
+        conn_table = sa_schema.Table(tname, existing_metadata, schema=s)
         if not exists:
             event.listen(
-                t,
+                conn_table,
                 "column_reflect",
                 # fmt: off
                 autogen_context.migration_context.impl.
                 _compat_autogen_column_reflect(inspector),
                 # fmt: on
             )
-            _InspectorConv(inspector).reflect_table(t)
+            _InspectorConv(inspector).reflect_table(conn_table)
+        return conn_table
+
+    existing_tables_sorted = [
+        (s or None, tname)
+        for s, tname in sorted(
+            existing_tables, key=lambda x: (x[0] or "", x[1])
+        )
+    ]
 
-        conn_column_info[(s, tname)] = t
+    # when streaming, each existing table is reflected just before it's
+    # compared, rather than all of them up front
+    if not reflect_lazily:
+        for s, tname in existing_tables_sorted:
+            reflect_existing(s, tname)
 
-    for s, tname in sorted(existing_tables, key=lambda x: (x[0] or "", x[1])):
-        s = s or None
+    for s, tname in existing_tables_sorted:
         name = "%s.%s" % (s, tname) if s else tname
         metadata_table = tname_to_table[(s, tname)]
-        conn_table = existing_metadata.tables[name]
+        if reflect_lazily:
+            conn_table = reflect_existing(s, tname)
+        else:
+            conn_table = existing_metadata.tables[
+                sa_schema._get_table_key(tname, s)
+            ]
 
         if autogen_context.run_object_filters(
             metadata_table, tname, "table", False, conn_table
@@ -225,7 +341,7 @@ def _compare_tables(
                 )
 
             if not modify_table_ops.is_empty():
-                upgrade_ops.ops.append(modify_table_ops)
+                yield modify_table_ops
 
 
 @contextlib.contextmanager
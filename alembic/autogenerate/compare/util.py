@@ -31,6 +31,8 @@ _INSP_KEYS = (
     "check_constraints",
     "table_options",
 )
+_INSP_CACHE_KEYS = frozenset(f"alembic_{key}" for key in _INSP_KEYS)
+_NAMES_CACHE_KEYS = frozenset(["alembic_schema_names", "alembic_table_names"])
 _CONSTRAINT_INSP_KEYS = (
     "pk_constraint",
     "foreign_keys",
@@ -56,6 +58,41 @@ class _InspectorConv:
     def __init__(self, inspector: Inspector):
         self.inspector = inspector
 
+    def get_schema_names(self) -> list[str]:
+        return self._names_from_cache(
+            "alembic_schema_names", None, self.inspector.get_schema_names
+        )
+
+    def get_table_names(self, schema: str | None) -> list[str]:
+        return self._names_from_cache(
+            "alembic_table_names",
+            schema,
+            lambda: self.inspector.get_table_names(schema=schema),
+        )
+
+    def _names_from_cache(
+        self, info_key: str, schema: str | None, inspector_method: Any
+    ) -> list[str]:
+        cache_key = (info_key, schema)
+        if cache_key not in self.inspector.info_cache:
+            self.inspector.info_cache[cache_key] = inspector_method()
+        return self.inspector.info_cache[cache_key]
+
+    def cached_reflection(self) -> dict[Any, Any]:
+        """Return the reflected elements cached by this inspector that
+        are specific to autogenerate, keyed as in the inspector's
+        ``info_cache``."""
+
+        return {
+            cache_key: elements
+            for cache_key, elements in self.inspector.info_cache.items()
+            if isinstance(cache_key, tuple)
+            and (
+                cache_key[0] in _INSP_CACHE_KEYS
+                or cache_key[0] in _NAMES_CACHE_KEYS
+            )
+        }
+
     def pre_cache_tables(
         self,
         schema: str | None,
@@ -64,6 +101,12 @@ class _InspectorConv:
     ) -> None:
         pass
 
+    def is_pre_cached(self, schema: str | None) -> bool:
+        return False
+
+    def merge_pre_cache(self, other: _InspectorConv) -> None:
+        pass
+
     def get_unique_constraints(
         self, tname: str, schema: str | None
     ) -> list[ReflectedUniqueConstraint]:
@@ -154,7 +197,8 @@ class _SQLA2InspectorConv(_InspectorConv):
         inspector_method: Any,
     ) -> None:
 
-        if info_key in self.inspector.info_cache:
+        cache_key = (info_key, schema)
+        if cache_key in self.inspector.info_cache:
             return
 
         # heuristic vendored from SQLAlchemy 2.0
@@ -183,9 +227,9 @@ class _SQLA2InspectorConv(_InspectorConv):
                 schema=schema, filter_names=optimized_filter_names
             )
         except NotImplementedError:
-            self.inspector.info_cache[info_key] = NotImplementedError
+            self.inspector.info_cache[cache_key] = NotImplementedError
         else:
-            self.inspector.info_cache[info_key] = elements
+            self.inspector.info_cache[cache_key] = elements
 
     def _return_from_cache(
         self,
@@ -198,8 +242,9 @@ class _SQLA2InspectorConv(_InspectorConv):
     ) -> Any:
         not_in_cache = object()
 
-        if info_key in self.inspector.info_cache:
-            cache = self.inspector.info_cache[info_key]
+        cache_key = (info_key, schema)
+        if cache_key in self.inspector.info_cache:
+            cache = self.inspector.info_cache[cache_key]
             if cache is NotImplementedError:
                 if optional:
                     return {}
@@ -305,6 +350,30 @@ class _SQLA2InspectorConv(_InspectorConv):
                 meth,
             )
 
+    def is_pre_cached(self, schema: str | None) -> bool:
+        return all(
+            (f"alembic_{key}", schema) in self.inspector.info_cache
+            for key in _INSP_KEYS
+        )
+
+    def merge_pre_cache(self, other: _InspectorConv) -> None:
+        """Merge the elements pre-cached by another inspector, typically
+        one running on a different connection, into this one."""
+
+        info_cache = self.inspector.info_cache
+        for cache_key, elements in other.cached_reflection().items():
+            if cache_key[0] not in _INSP_CACHE_KEYS:
+                continue
+            existing = info_cache.get(cache_key)
+            if elements is NotImplementedError or existing is None:
+                info_cache[cache_key] = (
+                    elements
+                    if elements is NotImplementedError
+                    else dict(elements)
+                )
+            elif existing is not NotImplementedError:
+                existing.update(elements)
+
     def _make_reflection_info(
         self, tname: str, schema: str | None
     ) -> _ReflectionInfo:
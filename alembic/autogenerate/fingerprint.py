@@ -0,0 +1,122 @@
+"""Fingerprints of the tables in a model, used by incremental
+autogenerate to determine which tables have changed since the previous
+revision was generated."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from typing import Any
+from typing import cast
+from typing import TYPE_CHECKING
+
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.schema import CreateIndex
+from sqlalchemy.schema import CreateTable
+
+from .. import util
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Dialect
+    from sqlalchemy.sql.schema import Table
+
+log = logging.getLogger(__name__)
+
+format_version = 1
+
+
+def table_fingerprint(table: Table, dialect: Dialect) -> str | None:
+    """Return a digest of the structure of the given table as it would
+    be rendered by the given dialect.
+
+    The digest covers the CREATE TABLE statement of the table, which
+    includes its columns, types, server defaults and constraints, along
+    with the CREATE INDEX statement of each index and the comments of the
+    table and its columns.  None is returned if the table can't be
+    rendered by the dialect.
+
+    """
+    try:
+        parts = [str(CreateTable(table).compile(dialect=dialect))]
+        parts.extend(
+            sorted(
+                str(CreateIndex(index).compile(dialect=dialect))
+                for index in table.indexes
+            )
+        )
+    except (sa_exc.CompileError, sa_exc.UnsupportedCompilationError):
+        return None
+
+    parts.append(repr(table.comment))
+    parts.extend(f"{col.name}: {col.comment!r}" for col in table.c)
+
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def fingerprint_path(script_path: str | os.PathLike[str]) -> str:
+    """Return the path of the fingerprint file stored alongside the given
+    revision file."""
+
+    base, _ = os.path.splitext(script_path)
+    return f"{base}.fingerprints.json"
+
+
+def read_fingerprints(
+    script_path: str | os.PathLike[str],
+) -> dict[str, dict[str, str]] | None:
+    """Read the table fingerprints stored alongside the given revision
+    file, keyed on upgrade token and then on table key.
+
+    Returns None if there are no fingerprints for the revision.
+
+    """
+    path = fingerprint_path(script_path)
+    try:
+        with open(path, encoding="utf-8") as file_:
+            data = json.load(file_)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as err:
+        util.warn(f"Could not read table fingerprint file {path}: {err}")
+        return None
+
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != format_version
+        or not isinstance(data.get("tables"), dict)
+    ):
+        return None
+    return cast("dict[str, dict[str, str]]", data["tables"])
+
+
+def write_fingerprints(
+    script_path: str | os.PathLike[str],
+    fingerprints: dict[str, dict[str, Any]],
+) -> None:
+    """Write table fingerprints alongside the given revision file."""
+
+    path = fingerprint_path(script_path)
+    directory = os.path.dirname(path) or "."
+    try:
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=directory,
+            prefix=os.path.basename(path),
+            suffix=".tmp",
+            delete=False,
+        ) as file_:
+            json.dump(
+                {"version": format_version, "tables": fingerprints},
+                file_,
+                indent=1,
+                sort_keys=True,
+            )
+        os.replace(file_.name, path)
+    except OSError as err:
+        util.warn(f"Could not write table fingerprint file {path}: {err}")
+    else:
+        log.info("Wrote table fingerprints %s", path)
@@ -0,0 +1,194 @@
+"""Timing of the comparison functions and database round trips of an
+autogenerate run."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Iterator
+import contextlib
+import json
+import os
+import threading
+import time
+from typing import Any
+from typing import TYPE_CHECKING
+
+from sqlalchemy import event
+
+from ..util import PriorityDispatcher
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+
+# targets whose comparison functions receive the schema and table name as
+# their third and fourth arguments; these don't invoke one another, so the
+# time of each is attributed to its table without being counted twice
+_TABLE_TARGETS = frozenset(["table", "column"])
+
+
+class AutogenProfile:
+    """Records the wall time and number of calls of each comparison
+    function invoked during autogenerate, the time spent comparing each
+    table, and the statements emitted to the database, chiefly those used
+    to reflect it.
+
+    A single profile may be shared by the autogenerate runs against each
+    database of a multiple database environment, in which case it
+    accumulates the totals of all of them.
+
+    The times recorded for a comparison function include those of any
+    comparison functions it invokes, such as those of the ``"schema"``
+    target, which compare each table.
+
+    .. versionadded:: 1.19.2
+
+    """
+
+    def __init__(self) -> None:
+        self.total_time = 0.0
+        self.round_trips = 0
+        self.round_trip_time = 0.0
+        self.comparators: dict[tuple[str, str], list[Any]] = {}
+        self.tables: dict[tuple[str | None, str], float] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def instrument(self, dispatcher: PriorityDispatcher) -> PriorityDispatcher:
+        """Return a copy of the given dispatcher with each of its functions
+        wrapped so that its calls are recorded by this profile."""
+
+        instrumented = PriorityDispatcher()
+        for (target, qualifier, priority), fns in dispatcher._registry.items():
+            instrumented._registry[(target, qualifier, priority)].extend(
+                (self._wrap(target, fn), subgroup) for fn, subgroup in fns
+            )
+        return instrumented
+
+    def _wrap(self, target: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+        key = (target, f"{fn.__module__}.{fn.__qualname__}")
+        per_table = target in _TABLE_TARGETS
+
+        def go(*arg: Any, **kw: Any) -> Any:
+            now = time.perf_counter()
+            try:
+                return fn(*arg, **kw)
+            finally:
+                elapsed = time.perf_counter() - now
+                with self._lock:
+                    record = self.comparators.setdefault(key, [0, 0.0])
+                    record[0] += 1
+                    record[1] += elapsed
+                    if per_table:
+                        table = (arg[2], arg[3])
+                        self.tables[table] = (
+                            self.tables.get(table, 0.0) + elapsed
+                        )
+
+        return go
+
+    @contextlib.contextmanager
+    def run(self, connection: Connection | None) -> Iterator[None]:
+        """Record the total time of an autogenerate run, along with the
+        statements emitted on the given connection."""
+
+        now = time.perf_counter()
+        try:
+            with self.track_connection(connection):
+                yield
+        finally:
+            self.total_time += time.perf_counter() - now
+
+    @contextlib.contextmanager
+    def track_connection(
+        self, connection: Connection | None
+    ) -> Iterator[None]:
+        """Record the statements emitted on the given connection."""
+
+        if connection is None:
+            yield
+            return
+
+        event.listen(
+            connection, "before_cursor_execute", self._before_cursor_execute
+        )
+        event.listen(
+            connection, "after_cursor_execute", self._after_cursor_execute
+        )
+        try:
+            yield
+        finally:
+            event.remove(
+                connection,
+                "before_cursor_execute",
+                self._before_cursor_execute,
+            )
+            event.remove(
+                connection, "after_cursor_execute", self._after_cursor_execute
+            )
+
+    def _before_cursor_execute(self, *arg: Any) -> None:
+        self._local.started = time.perf_counter()
+
+    def _after_cursor_execute(self, *arg: Any) -> None:
+        elapsed = time.perf_counter() - self._local.started
+        with self._lock:
+            self.round_trips += 1
+            self.round_trip_time += elapsed
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the recorded timings as a dictionary, in the form written
+        by :meth:`.AutogenProfile.write`, with comparison functions and
+        tables ordered by descending time."""
+
+        return {
+            "total_time": self.total_time,
+            "round_trips": {
+                "count": self.round_trips,
+                "time": self.round_trip_time,
+            },
+            "comparators": [
+                {"target": target, "name": name, "calls": calls, "time": t}
+                for (target, name), (calls, t) in sorted(
+                    self.comparators.items(), key=lambda item: -item[1][1]
+                )
+            ],
+            "tables": [
+                {"schema": schema, "name": name, "time": t}
+                for (schema, name), t in sorted(
+                    self.tables.items(), key=lambda item: -item[1]
+                )
+            ],
+        }
+
+    def write(self, path: str | os.PathLike[str]) -> None:
+        """Write the recorded timings to the given path as JSON."""
+
+        with open(path, "w", encoding="utf-8") as file_:
+            json.dump(self.as_dict(), file_, indent=2)
+
+    def format(self, limit: int = 10) -> str:
+        """Return a plain text summary of the recorded timings, listing the
+        given number of slowest tables."""
+
+        lines = [
+            f"Autogenerate completed in {self.total_time:.3f} sec",
+            f"Database round trips: {self.round_trips} in "
+            f"{self.round_trip_time:.3f} sec",
+            "",
+            "Comparators (inclusive time):",
+        ]
+        report = self.as_dict()
+        for record in report["comparators"]:
+            lines.append(
+                f"  {record['time']:10.3f} sec {record['calls']:8d} calls  "
+                f"[{record['target']}] {record['name']}"
+            )
+        lines.extend(["", f"Slowest tables (of {len(self.tables)}):"])
+        for record in report["tables"][:limit]:
+            name = (
+                f"{record['schema']}.{record['name']}"
+                if record["schema"]
+                else record["name"]
+            )
+            lines.append(f"  {record['time']:10.3f} sec  {name}")
+        return "\n".join(lines)
@@ -3,10 +3,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from collections.abc import Iterator
 from io import StringIO
 import re
+import tempfile
 from typing import Any
 from typing import cast
+from typing import TextIO
 from typing import TYPE_CHECKING
 
 from mako.pygen import PythonPrinter
@@ -70,13 +74,23 @@ def _indent(text: str) -> str:
 def _render_python_into_templatevars(
     autogen_context: AutogenContext,
     migration_script: MigrationScript,
-    template_args: dict[str, str | Config],
+    template_args: dict[str, str | Config | util.TemplateStream],
 ) -> None:
     imports = autogen_context.imports
 
     for upgrade_ops, downgrade_ops in zip(
         migration_script.upgrade_ops_list, migration_script.downgrade_ops_list
     ):
+        if isinstance(upgrade_ops.ops, _StreamedOps):
+            streamed = upgrade_ops.ops
+            imports.update(streamed.imports)
+            template_args[upgrade_ops.upgrade_token] = util.TemplateStream(
+                streamed.write_upgrade
+            )
+            template_args[downgrade_ops.downgrade_token] = util.TemplateStream(
+                streamed.write_downgrade
+            )
+            continue
         template_args[upgrade_ops.upgrade_token] = _indent(
             _render_cmd_body(upgrade_ops, autogen_context)
         )
@@ -116,6 +130,97 @@ def _render_cmd_body(
     return buf.getvalue()
 
 
+class _StreamedOps(list):
+    """The operation list of an :class:`.UpgradeOps` whose operations are
+    rendered as they're appended, rather than being collected.
+
+    The rendered upgrade and downgrade commands of each operation are
+    spooled to temporary files and the operation itself is discarded, so
+    that only the operations of a single table are held in memory at a
+    time.  The spooled text is written into the revision file by
+    :meth:`.write_upgrade` and :meth:`.write_downgrade`, indented in the
+    same way as the text rendered by :func:`._render_cmd_body`.
+
+    """
+
+    def __init__(self, autogen_context: AutogenContext) -> None:
+        super().__init__()
+        self.autogen_context = autogen_context
+        self.imports: set[str] = set()
+        self._upgrade = _Spool()
+        self._downgrade = _Spool()
+
+    def append(self, op: ops.MigrateOperation) -> None:
+        self._render(op)
+
+    def extend(self, op_iter: Iterable[ops.MigrateOperation]) -> None:
+        for op in op_iter:
+            self._render(op)
+
+    def _render(self, op: ops.MigrateOperation) -> None:
+        self._upgrade.write(self._render_text(op))
+        self._downgrade.write(self._render_text(op.reverse()))
+
+        # imports added by renderers are otherwise reset when the
+        # revision is rendered
+        self.imports.update(self.autogen_context.imports)
+
+    def _render_text(self, op: ops.MigrateOperation) -> str:
+        buf = StringIO()
+        printer = PythonPrinter(buf)
+        for line in render_op(self.autogen_context, op):
+            printer.writeline(line)
+        return buf.getvalue()
+
+    def write_upgrade(self, dest: TextIO) -> None:
+        _write_streamed_body(dest, self._upgrade)
+
+    def write_downgrade(self, dest: TextIO) -> None:
+        _write_streamed_body(dest, self._downgrade, reverse=True)
+
+    def close(self) -> None:
+        self._upgrade.close()
+        self._downgrade.close()
+
+
+class _Spool:
+    """Text rendered for each operation of a :class:`._StreamedOps`,
+    held in a temporary file."""
+
+    def __init__(self) -> None:
+        self.file = tempfile.TemporaryFile("w+", encoding="utf-8", newline="")
+        self.chunks: list[tuple[int, int]] = []
+
+    def write(self, text: str) -> None:
+        if text:
+            self.chunks.append((self.file.tell(), len(text)))
+            self.file.write(text)
+
+    def read(self, reverse: bool = False) -> Iterator[str]:
+        for start, length in (
+            reversed(self.chunks) if reverse else self.chunks
+        ):
+            self.file.seek(start)
+            yield self.file.read(length)
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def _write_streamed_body(
+    dest: TextIO, spool: _Spool, reverse: bool = False
+) -> None:
+    # equivalent to _indent(_render_cmd_body(...)), one operation at
+    # a time
+    dest.write("# ### commands auto generated by Alembic - please adjust! ###")
+    if not spool.chunks:
+        dest.write("\n    pass")
+    for chunk in spool.read(reverse):
+        for line in chunk.split("\n")[:-1]:
+            dest.write("\n" + ("    " + line).rstrip(" "))
+    dest.write("\n    # ### end Alembic commands ###")
+
+
 def render_op(
     autogen_context: AutogenContext, op: ops.MigrateOperation
 ) -> list[str]:
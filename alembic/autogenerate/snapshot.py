@@ -0,0 +1,375 @@
+"""Persistence of the database schema reflected during autogenerate."""
+
+from __future__ import annotations
+
+import ast
+from collections.abc import Sequence
+import json
+import logging
+import os
+from pathlib import Path
+import sys
+import tempfile
+from typing import Any
+from typing import cast
+from typing import NoReturn
+from typing import TYPE_CHECKING
+
+from sqlalchemy import types as sqltypes
+from sqlalchemy.engine.reflection import Inspector
+
+from .compare.util import _InspectorConv
+from .. import util
+from ..util import sqla_compat
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Dialect
+
+log = logging.getLogger(__name__)
+
+
+class ReflectionSnapshot:
+    """A file-backed snapshot of the database schema as reflected during
+    an autogenerate run.
+
+    The snapshot stores the table names and per-table reflection data
+    which autogenerate caches on the
+    :class:`~sqlalchemy.engine.reflection.Inspector`, along with the name
+    of the dialect and the revisions present in the version table when it
+    was taken.  A later autogenerate run against a database with the same
+    revisions applied restores this data rather than reflecting the
+    database again.  Snapshots of several databases, such as those of a
+    multiple database environment, are stored in the same file under
+    separate keys.
+
+    A snapshot may also be used without any database connection, by
+    passing it to :func:`.compare_metadata` or :func:`.produce_migrations`
+    along with a :class:`.MigrationContext` that was configured using only
+    a dialect name; autogenerate then compares the model to the schema
+    stored in the snapshot.
+
+    The file is written as JSON.  Reflected datatypes are stored using their
+    Python representation, as they would be rendered within a migration
+    script, and are reconstructed only from the type classes of SQLAlchemy
+    and of the dialect in use.
+
+    .. versionadded:: 1.19.2
+
+    """
+
+    format_version = 2
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        refresh: bool = False,
+        key: str | None = None,
+    ) -> None:
+        """Construct a new :class:`.ReflectionSnapshot`.
+
+        :param path: path to the snapshot file.
+        :param refresh: if True, the snapshot is never restored from the
+         file, and is replaced at the end of the autogenerate run.
+        :param key: the database URL, rendered with the password hidden,
+         of the snapshot to use when autogenerating without a database
+         connection.  May be omitted if the file contains the snapshot of
+         a single database only.
+
+        """
+        self.path = Path(path)
+        self.refresh = refresh
+        self.key = key
+        self.restored = False
+
+    def _read(self) -> dict[str, Any]:
+        try:
+            with open(self.path, encoding="utf-8") as file_:
+                data = json.load(file_)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as err:
+            util.warn(
+                f"Could not read reflection snapshot file {self.path}: "
+                f"{err}; the database will be reflected"
+            )
+            return {}
+
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != self.format_version
+            or not isinstance(data.get("entries"), dict)
+        ):
+            return {}
+        return cast("dict[str, Any]", data["entries"])
+
+    def restore(
+        self, inspector: Inspector, heads: Sequence[str], key: str
+    ) -> bool:
+        """Populate the given inspector from the snapshot stored under the
+        given key, if it was taken against the same dialect and heads.
+
+        Returns True if the snapshot was used.
+
+        """
+        if self.refresh:
+            return False
+
+        entry = self._read().get(key)
+        if (
+            not isinstance(entry, dict)
+            or entry.get("dialect") != inspector.dialect.name
+            or entry.get("heads") != sorted(heads)
+        ):
+            return False
+
+        try:
+            reflection = _decode(entry["reflection"], inspector.dialect)
+        except (KeyError, TypeError, ValueError) as err:
+            util.warn(
+                f"Could not read reflection snapshot file {self.path}: "
+                f"{err}; the database will be reflected"
+            )
+            return False
+
+        inspector.info_cache.update(reflection)
+        self.restored = True
+        log.info("Using reflection snapshot %s for %s", self.path, key)
+        return True
+
+    def offline_inspector(self, dialect: Dialect) -> Inspector:
+        """Return an :class:`~sqlalchemy.engine.reflection.Inspector`
+        which serves the reflected schema stored in the snapshot file,
+        without a database connection.
+
+        """
+        if not sqla_compat.sqla_2:
+            raise util.CommandError(
+                "Autogenerate against a reflection snapshot without a "
+                "database connection requires SQLAlchemy 2.0 or greater"
+            )
+
+        entries = self._read()
+        if self.key is not None:
+            entry = entries.get(self.key)
+        elif len(entries) == 1:
+            (entry,) = entries.values()
+        elif entries:
+            raise util.CommandError(
+                f"Reflection snapshot file {self.path} contains snapshots "
+                f"of more than one database; a key is required to select "
+                f"one of: {', '.join(sorted(entries))}"
+            )
+        else:
+            entry = None
+
+        if not isinstance(entry, dict):
+            raise util.CommandError(
+                f"No reflection snapshot found in file {self.path}"
+                + (f" for {self.key}" if self.key is not None else "")
+            )
+        if entry.get("dialect") != dialect.name:
+            raise util.CommandError(
+                f"Reflection snapshot in file {self.path} was taken "
+                f"against the {entry.get('dialect')!r} dialect; can't "
+                f"compare using the {dialect.name!r} dialect"
+            )
+
+        try:
+            reflection = _decode(entry["reflection"], dialect)
+        except (KeyError, TypeError, ValueError) as err:
+            raise util.CommandError(
+                f"Could not read reflection snapshot file {self.path}: {err}"
+            ) from err
+
+        self.restored = True
+        return _SnapshotInspector(
+            dialect,
+            entry.get("default_schema_name"),
+            reflection,
+            self.path,
+        )
+
+    def save(
+        self, inspector: Inspector, heads: Sequence[str], key: str
+    ) -> None:
+        """Store the reflection data cached by the given inspector in the
+        snapshot file under the given key, unless the data was restored
+        from it."""
+
+        if self.restored:
+            return
+
+        entries = self._read()
+        try:
+            entries[key] = {
+                "dialect": inspector.dialect.name,
+                "default_schema_name": inspector.default_schema_name,
+                "heads": sorted(heads),
+                "reflection": _encode(
+                    _InspectorConv(inspector).cached_reflection(),
+                    inspector.dialect,
+                ),
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self.path.parent,
+                prefix=self.path.name,
+                suffix=".tmp",
+                delete=False,
+            ) as file_:
+                try:
+                    json.dump(
+                        {"version": self.format_version, "entries": entries},
+                        file_,
+                    )
+                except BaseException:
+                    file_.close()
+                    os.unlink(file_.name)
+                    raise
+            os.replace(file_.name, self.path)
+        except (OSError, TypeError, ValueError) as err:
+            util.warn(
+                f"Could not write reflection snapshot file {self.path}: {err}"
+            )
+        else:
+            log.info("Wrote reflection snapshot %s for %s", self.path, key)
+
+
+def _encode(obj: Any, dialect: Dialect) -> Any:
+    """Convert reflection data into a form which may be written as JSON.
+
+    Tuples, dictionaries and datatypes are tagged so that :func:`._decode`
+    restores them as they were.
+
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    elif isinstance(obj, list):
+        return [_encode(elem, dialect) for elem in obj]
+    elif isinstance(obj, tuple):
+        return {"__tuple__": [_encode(elem, dialect) for elem in obj]}
+    elif isinstance(obj, dict):
+        return {
+            "__dict__": [
+                [_encode(key, dialect), _encode(value, dialect)]
+                for key, value in obj.items()
+            ]
+        }
+    elif obj is NotImplementedError:
+        return {"__not_implemented__": True}
+    elif isinstance(obj, sqltypes.TypeEngine):
+        encoded = {"__type__": repr(obj), "module": type(obj).__module__}
+        restored = _decode(encoded, dialect)
+        if type(restored) is not type(obj) or repr(restored) != repr(obj):
+            raise TypeError(f"Can't store datatype {obj!r}")
+        return encoded
+    else:
+        raise TypeError(f"Can't store reflected value {obj!r}")
+
+
+def _decode(obj: Any, dialect: Dialect) -> Any:
+    """Restore reflection data converted using :func:`._encode`."""
+
+    if isinstance(obj, list):
+        return [_decode(elem, dialect) for elem in obj]
+    elif not isinstance(obj, dict):
+        return obj
+    elif "__tuple__" in obj:
+        return tuple(_decode(elem, dialect) for elem in obj["__tuple__"])
+    elif "__dict__" in obj:
+        return {
+            _decode(key, dialect): _decode(value, dialect)
+            for key, value in obj["__dict__"]
+        }
+    elif "__not_implemented__" in obj:
+        return NotImplementedError
+    elif "__type__" in obj:
+        # only modules which are already imported are consulted, being
+        # those of SQLAlchemy and of the dialect in use
+        namespaces = [
+            sys.modules.get(obj["module"]),
+            sys.modules.get(type(dialect).__module__.rpartition(".")[0]),
+            sqltypes,
+        ]
+        return _type_from_expr(
+            ast.parse(obj["__type__"], mode="eval").body,
+            [ns for ns in namespaces if ns is not None],
+        )
+    else:
+        raise ValueError(f"Unexpected value in reflection snapshot: {obj!r}")
+
+
+def _type_from_expr(node: ast.expr, namespaces: list[Any]) -> Any:
+    """Evaluate the representation of a datatype, allowing only literal
+    values and calls to datatype classes."""
+
+    if isinstance(node, ast.Call):
+        if not isinstance(node.func, ast.Name):
+            raise ValueError(f"Unexpected datatype {ast.unparse(node)!r}")
+        for ns in namespaces:
+            cls = getattr(ns, node.func.id, None)
+            if isinstance(cls, type) and issubclass(cls, sqltypes.TypeEngine):
+                break
+        else:
+            raise ValueError(f"Unknown datatype {node.func.id!r}")
+        if any(kw.arg is None for kw in node.keywords):
+            raise ValueError(f"Unexpected datatype {ast.unparse(node)!r}")
+        return cls(
+            *[_type_from_expr(arg, namespaces) for arg in node.args],
+            **{
+                cast(str, kw.arg): _type_from_expr(kw.value, namespaces)
+                for kw in node.keywords
+            },
+        )
+    elif isinstance(node, (ast.List, ast.Tuple)):
+        elements = [_type_from_expr(elem, namespaces) for elem in node.elts]
+        return elements if isinstance(node, ast.List) else tuple(elements)
+    else:
+        return ast.literal_eval(node)
+
+
+class _SnapshotBind:
+    """Stands in for the database connection of a
+    :class:`._SnapshotInspector`, providing only its dialect.  Any attempt
+    to query the database raises."""
+
+    def __init__(self, dialect: Dialect, path: Path) -> None:
+        self.dialect = dialect
+        self._path = path
+
+    def schema_for_object(self, obj: Any) -> str | None:
+        return obj.schema  # type: ignore[no-any-return]
+
+    def __getattr__(self, key: str) -> NoReturn:
+        raise util.CommandError(
+            f"Reflection snapshot in file {self._path} does not include all "
+            "of the schema information required by autogenerate; take a "
+            "new snapshot against the database using the same "
+            "include_schemas and include_name settings"
+        )
+
+
+class _SnapshotInspector(Inspector):
+    """An inspector which serves only the reflection data restored from
+    a snapshot, having no database connection."""
+
+    def __init__(
+        self,
+        dialect: Dialect,
+        default_schema_name: str | None,
+        info_cache: dict[Any, Any],
+        path: Path,
+    ) -> None:
+        self.bind = self.engine = _SnapshotBind(  # type: ignore[assignment]
+            dialect, path
+        )
+        self.dialect = dialect
+        self.info_cache = info_cache
+        self._op_context_requires_connect = False
+        self._default_schema_name = default_schema_name
+
+    @property
+    def default_schema_name(self) -> str | None:
+        return self._default_schema_name
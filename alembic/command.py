@@ -200,6 +200,9 @@ def revision(
     rev_id: str | None = None,
     depends_on: str | None = None,
     process_revision_directives: ProcessRevisionDirectiveFn | None = None,
+    refresh_snapshot: bool = False,
+    profile: bool | str = False,
+    stream: bool = False,
 ) -> Script | None | list[Script | None]:
     """Create a new revision file.
 
@@ -244,6 +247,31 @@ def revision(
      the other parameters, this option is only available via programmatic
      use of :func:`.command.revision`.
 
+    :param refresh_snapshot: when autogenerating with the
+     ``autogenerate_snapshot_file`` configuration option in use, reflect the
+     database even if the snapshot matches its current heads, and write a
+     new snapshot; this is the ``--refresh-snapshot`` option to
+     ``alembic revision``.
+
+     .. versionadded:: 1.19.2
+
+    :param profile: when autogenerating, record the time taken by each
+     comparison function and table along with the number of database round
+     trips.  If True, a summary is printed; if a string, a JSON report is
+     written to the file of that name.  This is the ``--profile`` option to
+     ``alembic revision``.
+
+     .. versionadded:: 1.19.2
+
+    :param stream: when autogenerating, render the operations of each
+     table as soon as that table has been compared, spooling the rendered
+     text to temporary files rather than holding the operations of all
+     tables in memory.  Can't be combined with
+     ``process_revision_directives``.  This is the ``--stream`` option to
+     ``alembic revision``.
+
+     .. versionadded:: 1.19.2
+
     """
 
     script_directory = ScriptDirectory.from_config(config)
@@ -258,6 +286,9 @@ def revision(
         version_path=version_path,
         rev_id=rev_id,
         depends_on=depends_on,
+        refresh_snapshot=refresh_snapshot,
+        profile=profile,
+        stream=stream,
     )
     revision_context = autogen.RevisionContext(
         config,
@@ -270,6 +301,11 @@ def revision(
         config.get_alembic_option("revision_environment")
     )
 
+    if profile and not autogenerate:
+        raise util.CommandError(
+            "Using --profile without --autogenerate does not make any sense"
+        )
+
     if autogenerate:
         environment = True
 
@@ -305,6 +341,8 @@ def revision(
         ):
             script_directory.run_env()
 
+        revision_context._report_profile()
+
         # the revision_context now has MigrationScript structure(s) present.
         # these could theoretically be further processed / rewritten *here*,
         # in addition to the hooks present within each run_migrations() call,
@@ -317,13 +355,29 @@ def revision(
         return scripts
 
 
-def check(config: Config) -> None:
+def check(
+    config: Config, refresh_snapshot: bool = False, profile: bool | str = False
+) -> None:
     """Check if revision command with autogenerate has pending upgrade ops.
 
     :param config: a :class:`.Config` object.
 
     .. versionadded:: 1.9.0
 
+    :param refresh_snapshot: when the ``autogenerate_snapshot_file``
+     configuration option is in use, reflect the database even if the
+     snapshot matches its current heads, and write a new snapshot; this is
+     the ``--refresh-snapshot`` option to ``alembic check``.
+
+     .. versionadded:: 1.19.2
+
+    :param profile: record the time taken by each comparison function and
+     table along with the number of database round trips.  If True, a
+     summary is printed; if a string, a JSON report is written to the file
+     of that name.  This is the ``--profile`` option to ``alembic check``.
+
+     .. versionadded:: 1.19.2
+
     """
 
     script_directory = ScriptDirectory.from_config(config)
@@ -338,6 +392,8 @@ def check(config: Config) -> None:
         version_path=None,
         rev_id=None,
         depends_on=None,
+        refresh_snapshot=refresh_snapshot,
+        profile=profile,
     )
     revision_context = autogen.RevisionContext(
         config,
@@ -359,6 +415,8 @@ def check(config: Config) -> None:
     ):
         script_directory.run_env()
 
+    revision_context._report_profile()
+
     # the revision_context now has MigrationScript structure(s) present.
 
     migration_script = revision_context.generated_revisions[-1]
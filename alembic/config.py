@@ -783,6 +783,35 @@ class CommandLine:
                 "of database to model.",
             ),
         ),
+        "refresh_snapshot": (
+            "--refresh-snapshot",
+            dict(
+                action="store_true",
+                help="Reflect the database even if the autogenerate "
+                "snapshot file matches its current heads.",
+            ),
+        ),
+        "profile": (
+            "--profile",
+            dict(
+                nargs="?",
+                const=True,
+                default=False,
+                metavar="FILE",
+                help="Record the time taken by autogenerate comparisons "
+                "and database round trips; print a summary, or write a "
+                "JSON report to FILE if given.",
+            ),
+        ),
+        "stream": (
+            "--stream",
+            dict(
+                action="store_true",
+                help="Render the autogenerated operations of each table "
+                "as it's compared, rather than holding those of all "
+                "tables in memory.",
+            ),
+        ),
         "rev_range": (
             "-r",
             "--rev-range",
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 import functools
 from typing import Any
 from typing import Literal
@@ -13,8 +14,10 @@ from sqlalchemy import exc
 from sqlalchemy import Integer
 from sqlalchemy import types as sqltypes
 from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.schema import AddConstraint
 from sqlalchemy.schema import Column
 from sqlalchemy.schema import DDLElement
+from sqlalchemy.schema import DropConstraint
 from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.elements import quoted_name
 from sqlalchemy.sql.elements import TextClause
@@ -187,6 +190,54 @@ class ColumnComment(AlterColumn):
         self.comment = comment
 
 
+class CoalescedAlterTable(AlterTable):
+    """Represent a series of ALTER TABLE constructs against the same table
+    as a single ALTER TABLE statement with multiple clauses.
+
+    Each construct is compiled individually, and its clause following the
+    ``ALTER TABLE <name>`` prefix is appended to the statement.
+
+    """
+
+    def __init__(
+        self,
+        name: str,
+        elements: Sequence[DDLElement],
+        schema: quoted_name | str | None = None,
+    ) -> None:
+        super().__init__(name, schema=schema)
+        self.elements = list(elements)
+
+
+@compiles(CoalescedAlterTable)
+def visit_coalesced_alter_table(
+    element: CoalescedAlterTable, compiler: DDLCompiler, **kw
+) -> str:
+    prefix = alter_table(compiler, element.table_name, element.schema)
+    clauses = []
+    for construct in element.elements:
+        if isinstance(construct, (AddConstraint, DropConstraint)):
+            construct_prefix = "ALTER TABLE %s" % (
+                compiler.preparer.format_table(construct.element.table)
+            )
+        else:
+            construct_prefix = prefix
+        text = compiler.process(construct, **kw).strip()
+        if not text.startswith(construct_prefix + " "):
+            raise exc.CompileError(
+                "Can't combine %r into a single ALTER TABLE statement; "
+                "it doesn't compile to a clause of ALTER TABLE %s"
+                % (
+                    construct,
+                    format_table_name(
+                        compiler, element.table_name, element.schema
+                    ),
+                )
+            )
+        clauses.append(text[len(construct_prefix) + 1 :])
+    return "%s %s" % (prefix, ", ".join(clauses))
+
+
 @compiles(RenameTable)
 def visit_rename_table(
     element: RenameTable, compiler: DDLCompiler, **kw
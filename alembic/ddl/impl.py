@@ -4,8 +4,10 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from collections.abc import Iterator
 from collections.abc import Mapping
 from collections.abc import Sequence
+import itertools
 import logging
 import re
 from typing import Any
@@ -21,6 +23,7 @@ from sqlalchemy import schema
 from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy import text
+from sqlalchemy.util import LRUCache
 
 from . import _autogen
 from . import base
@@ -30,6 +33,7 @@ from .. import util
 from ..util import sqla_compat
 
 if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
     from typing import Literal
     from typing import TextIO
 
@@ -109,6 +113,14 @@ class DefaultImpl(metaclass=ImplMeta):
     # oracle_on_null
     identity_attrs_ignore: tuple[str, ...] = ("order", "on_null")
 
+    # maximum number of rows that may be rendered in a single multi-row
+    # INSERT..VALUES statement, if the backend imposes a limit
+    max_insert_values_rows: int | None = None
+
+    # maximum number of distinct pairs of compiled reflected / metadata
+    # types whose comparison result is retained by compare_type()
+    type_comparison_cache_size: int = 1000
+
     def __init__(
         self,
         dialect: Dialect,
@@ -125,7 +137,16 @@ class DefaultImpl(metaclass=ImplMeta):
 
         self.output_buffer = output_buffer
         self.memo: dict = {}
+        self._type_comparisons: LRUCache[tuple[str, str], bool] = LRUCache(
+            self.type_comparison_cache_size
+        )
         self.context_opts = context_opts
+        self._coalesce_alter_table = bool(
+            context_opts.get("coalesce_alter_table", False)
+        )
+        self._coalesced: list[schema.DDLElement] = []
+        self._coalesced_table: tuple[str, str | None] | None = None
+        self._coalesced_names: set[tuple[str, str]] = set()
         if transactional_ddl is not None:
             self.transactional_ddl = transactional_ddl
 
@@ -202,10 +223,119 @@ class DefaultImpl(metaclass=ImplMeta):
 
         """
 
+    def batch_copy_context(
+        self, batch_impl: ApplyBatchImpl
+    ) -> AbstractContextManager[None] | None:
+        """Return a context manager within which rows are copied from
+        the existing table to the new one in batch mode, or None.
+
+        When a context manager is returned, the copy takes place outside
+        of the migration's transaction, within
+        :meth:`.MigrationContext.autocommit_block`.  The SQLite dialect
+        uses this to adjust PRAGMA settings which can't be changed within
+        a transaction.
+
+        .. versionadded:: 1.19.2
+
+        """
+        return None
+
+    def can_coalesce_alter_table(self, construct: Executable) -> bool:
+        """Return True if the given ALTER TABLE construct may be emitted as
+        one of the clauses of a single ALTER TABLE statement, when the
+        :paramref:`.EnvironmentContext.configure.coalesce_alter_table`
+        option is in use.
+
+        Returns False for all constructs by default; dialects whose
+        ALTER TABLE accepts multiple clauses return True for the
+        constructs which compile to such a clause.
+
+        .. versionadded:: 1.19.2
+
+        """
+        return False
+
     @property
     def bind(self) -> Connection | None:
+        # statements may be emitted on the connection directly
+        self.flush_alter_table()
         return self.connection
 
+    def flush_alter_table(self) -> None:
+        """Emit the ALTER TABLE clauses held by the
+        :paramref:`.EnvironmentContext.configure.coalesce_alter_table`
+        option as a single statement.
+
+        This is invoked before any other statement is emitted, when the
+        connection is acquired by :meth:`.Operations.get_bind`, and at the
+        end of each migration.
+
+        .. versionadded:: 1.19.2
+
+        """
+        if not self._coalesced:
+            return
+        coalesced, self._coalesced = self._coalesced, []
+        assert self._coalesced_table is not None
+        table_name, schema_name = self._coalesced_table
+        self._coalesced_table = None
+        self._coalesced_names.clear()
+
+        self._coalesce_alter_table = False
+        try:
+            if len(coalesced) == 1:
+                self._exec(coalesced[0])
+            else:
+                self._exec(
+                    base.CoalescedAlterTable(
+                        table_name, coalesced, schema=schema_name
+                    )
+                )
+        finally:
+            self._coalesce_alter_table = True
+
+    def _coalesce(self, construct: Executable) -> bool:
+        """Hold the given construct to be emitted along with the
+        constructs which follow it against the same table, if it can be
+        combined with them."""
+
+        if not self.can_coalesce_alter_table(construct):
+            return False
+
+        names: set[tuple[str, str]]
+        if isinstance(
+            construct, (schema.AddConstraint, schema.DropConstraint)
+        ):
+            table = getattr(construct.element, "table", None)
+            if table is None:
+                return False
+            target = (table.name, table.schema)
+            names = (
+                {("constraint", construct.element.name)}
+                if isinstance(construct.element.name, str)
+                else set()
+            )
+        elif isinstance(construct, (base.AddColumn, base.DropColumn)):
+            target = (construct.table_name, construct.schema)
+            names = {("column", construct.column.name)}
+        elif isinstance(construct, base.AlterColumn):
+            target = (construct.table_name, construct.schema)
+            names = {("column", construct.column_name)}
+            newname = getattr(construct, "newname", None)
+            if newname is not None:
+                names.add(("column", newname))
+        else:
+            return False
+
+        # a column or constraint that appears in more than one clause
+        # would depend on the order in which the backend applies them
+        if target != self._coalesced_table or names & self._coalesced_names:
+            self.flush_alter_table()
+        self._coalesced.append(construct)
+        self._coalesced_table = target
+        self._coalesced_names.update(names)
+        return True
+
     def _exec(
         self,
         construct: Executable | str,
@@ -213,6 +343,17 @@ class DefaultImpl(metaclass=ImplMeta):
         multiparams: Sequence[Mapping[str, Any]] | None = None,
         params: Mapping[str, Any] = util.immutabledict(),
     ) -> CursorResult | None:
+        if self._coalesce_alter_table:
+            if (
+                not isinstance(construct, str)
+                and not execution_options
+                and multiparams is None
+                and not params
+                and self._coalesce(construct)
+            ):
+                return None
+            self.flush_alter_table()
+
         if isinstance(construct, str):
             construct = text(construct)
         if self.as_sql:
@@ -477,20 +618,29 @@ class DefaultImpl(metaclass=ImplMeta):
     def bulk_insert(
         self,
         table: TableClause | Table,
-        rows: list[dict],
+        rows: Iterable[dict],
         multiinsert: bool = True,
+        chunk_size: int | None = None,
+        multirow_values: bool = False,
     ) -> None:
-        if not isinstance(rows, list):
-            raise TypeError("List expected")
-        elif rows and not isinstance(rows[0], dict):
-            raise TypeError("List of dictionaries expected")
+        if isinstance(rows, (dict, str, bytes)) or not isinstance(
+            rows, Iterable
+        ):
+            raise TypeError("List or other iterable of dictionaries expected")
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer")
+
+        rows = _check_bulk_insert_rows(rows)
         if self.as_sql:
-            for row in rows:
-                self._exec(
-                    table.insert()
-                    .inline()
-                    .values(
-                        **{
+            # rows are rendered as they're consumed from the iterable; when
+            # multirow_values is set and the backend supports it,
+            # consecutive rows with the same keys are rendered as multi-row
+            # INSERT..VALUES statements of up to chunk_size rows
+            values_rows = self._insert_values_rows(chunk_size, multirow_values)
+            for _, group in itertools.groupby(rows, key=tuple):
+                for chunk in _chunks(group, values_rows):
+                    literal_rows = [
+                        {
                             k: (
                                 sqla_compat._literal_bindparam(
                                     k, v, type_=table.c[k].type
@@ -502,20 +652,48 @@ class DefaultImpl(metaclass=ImplMeta):
                             )
                             for k, v in row.items()
                         }
-                    )
-                )
+                        for row in chunk
+                    ]
+                    if len(literal_rows) == 1:
+                        self._exec(
+                            table.insert().inline().values(**literal_rows[0])
+                        )
+                    else:
+                        self._exec(
+                            table.insert().inline().values(literal_rows)
+                        )
+        elif multiinsert:
+            stmt = table.insert().inline()
+            for chunk in _chunks(rows, chunk_size):
+                self._exec(stmt, multiparams=chunk)
         else:
-            if rows:
-                if multiinsert:
-                    self._exec(table.insert().inline(), multiparams=rows)
-                else:
-                    for row in rows:
-                        self._exec(table.insert().inline().values(**row))
+            for row in rows:
+                self._exec(table.insert().inline().values(**row))
+
+    def _insert_values_rows(
+        self, chunk_size: int | None, multirow_values: bool
+    ) -> int | None:
+        """Return the number of rows to render in each INSERT statement
+        for a bulk insert in --sql mode, or None for no limit."""
+
+        if not multirow_values or not self.dialect.supports_multivalues_insert:
+            return 1
+        elif chunk_size is None:
+            return self.max_insert_values_rows
+        elif self.max_insert_values_rows is not None:
+            return min(chunk_size, self.max_insert_values_rows)
+        else:
+            return chunk_size
+
+    def _compile_column_type(self, column: Column) -> str:
+        return self.dialect.type_compiler.process(column.type).lower()
 
     def _tokenize_column_type(self, column: Column) -> Params:
-        definition: str
-        definition = self.dialect.type_compiler.process(column.type).lower()
+        return self._tokenize_type_definition(
+            self._compile_column_type(column)
+        )
 
+    def _tokenize_type_definition(self, definition: str) -> Params:
         # tokenize the SQLAlchemy-generated version of a type, so that
         # the two can be compared.
         #
@@ -612,16 +790,28 @@ class DefaultImpl(metaclass=ImplMeta):
     ) -> bool:
         """Returns True if there ARE differences between the types of the two
         columns. Takes impl.type_synonyms into account between retrospected
-        and metadata types
+        and metadata types.
+
+        The result is cached on the compiled forms of the two types, so
+        that each distinct pair of types is tokenized and compared once.
         """
-        inspector_params = self._tokenize_column_type(inspector_column)
-        metadata_params = self._tokenize_column_type(metadata_column)
+        key = (
+            self._compile_column_type(inspector_column),
+            self._compile_column_type(metadata_column),
+        )
+        try:
+            return self._type_comparisons[key]
+        except KeyError:
+            pass
 
-        if not self._column_types_match(inspector_params, metadata_params):
-            return True
-        if not self._column_args_match(inspector_params, metadata_params):
-            return True
-        return False
+        inspector_params = self._tokenize_type_definition(key[0])
+        metadata_params = self._tokenize_type_definition(key[1])
+
+        is_diff = not self._column_types_match(
+            inspector_params, metadata_params
+        ) or not self._column_args_match(inspector_params, metadata_params)
+        self._type_comparisons[key] = is_diff
+        return is_diff
 
     def compare_server_default(
         self,
@@ -632,6 +822,24 @@ class DefaultImpl(metaclass=ImplMeta):
     ):
         return rendered_inspector_default != rendered_metadata_default
 
+    def prepare_server_default_comparisons(
+        self,
+        comparisons: Sequence[
+            tuple[Column[Any], Column[Any], str | None, str | None]
+        ],
+    ) -> None:
+        """Receive the arguments of each :meth:`.compare_server_default`
+        call which autogenerate is about to make for the columns of a
+        table, before any of them are made.
+
+        Dialect implementations which compare defaults by querying the
+        server may use this hook to evaluate all the comparisons of a
+        table at once.  The default implementation does nothing.
+
+        .. versionadded:: 1.19.2
+
+        """
+
     def correct_for_autogen_constraints(
         self,
         conn_uniques: set[UniqueConstraint],
@@ -862,6 +1070,40 @@ class DefaultImpl(metaclass=ImplMeta):
         return reflected_object.get("dialect_options", {})  # type: ignore[return-value]   # noqa: E501
 
 
+def _check_bulk_insert_rows(rows: Iterable[dict]) -> Iterator[dict]:
+    """Iterate the rows given to :meth:`.DefaultImpl.bulk_insert`,
+    checking that they are dictionaries.
+
+    As with a plain list, only the first row is checked.
+
+    """
+    iterator = iter(rows)
+    for row in iterator:
+        if not isinstance(row, dict):
+            raise TypeError("List of dictionaries expected")
+        yield row
+        break
+    yield from iterator
+
+
+def _chunks(rows: Iterable[dict], size: int | None) -> Iterator[list[dict]]:
+    """Collect rows into lists of at most the given size; all rows are
+    collected into a single list if no size is given."""
+
+    if size is None:
+        chunk = list(rows)
+        if chunk:
+            yield chunk
+        return
+
+    iterator = iter(rows)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
 class Params(NamedTuple):
     token0: str
     tokens: list[str]
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 import re
 from typing import Any
 from typing import TYPE_CHECKING
@@ -49,6 +50,9 @@ class MSSQLImpl(DefaultImpl):
     transactional_ddl = True
     batch_separator = "GO"
 
+    # SQL Server's table value constructor accepts at most 1000 rows
+    max_insert_values_rows = 1000
+
     type_synonyms = DefaultImpl.type_synonyms + ({"VARCHAR", "NVARCHAR"},)
     identity_attrs_ignore = DefaultImpl.identity_attrs_ignore + (
         "minvalue",
@@ -190,7 +194,7 @@ class MSSQLImpl(DefaultImpl):
         self._exec(CreateIndex(index, **kw))
 
     def bulk_insert(  # type: ignore[override]
-        self, table: TableClause | Table, rows: list[dict], **kw: Any
+        self, table: TableClause | Table, rows: Iterable[dict], **kw: Any
     ) -> None:
         if self.as_sql:
             self._exec(
@@ -3,24 +3,34 @@
 
 from __future__ import annotations
 
+from collections.abc import Collection
+from collections.abc import Mapping
+from collections.abc import Sequence
+import logging
 import re
 from typing import Any
+from typing import cast
 from typing import TYPE_CHECKING
 
 from sqlalchemy import schema
 from sqlalchemy import types as sqltypes
+from sqlalchemy.schema import DDLElement
 from sqlalchemy.sql import elements
 from sqlalchemy.sql import functions
 from sqlalchemy.sql import operators
 
+from .base import AddColumn
 from .base import alter_table
 from .base import AlterColumn
 from .base import ColumnDefault
 from .base import ColumnName
 from .base import ColumnNullable
+from .base import CoalescedAlterTable
 from .base import ColumnType
+from .base import DropColumn
 from .base import format_column_name
 from .base import format_server_default
+from .base import RenameTable
 from .impl import DefaultImpl
 from .. import util
 from ..util import sqla_compat
@@ -31,6 +41,9 @@ if TYPE_CHECKING:
     from typing import Literal
 
     from sqlalchemy.dialects.mysql.base import MySQLDDLCompiler
+    from sqlalchemy.dialects.mysql.base import MySQLDialect
+    from sqlalchemy.engine.cursor import CursorResult
+    from sqlalchemy.sql.base import Executable
     from sqlalchemy.sql.ddl import DropConstraint
     from sqlalchemy.sql.elements import ClauseElement
     from sqlalchemy.sql.schema import Constraint
@@ -39,6 +52,11 @@ if TYPE_CHECKING:
     from .base import _ServerDefaultArgument
     from .base import _ServerDefaultType
 
+log = logging.getLogger(__name__)
+
+# online DDL algorithms, from least to most disruptive
+_ONLINE_DDL_ALGORITHMS = ("INSTANT", "INPLACE", "COPY")
+
 
 class MySQLImpl(DefaultImpl):
     __dialect__ = "mysql"
@@ -75,6 +93,169 @@ class MySQLImpl(DefaultImpl):
             expr, is_server_default=is_server_default, is_index=is_index, **kw
         )
 
+    def __init__(self, *arg: Any, **kw: Any) -> None:
+        super().__init__(*arg, **kw)
+        self.online_ddl = self.context_opts.get("mysql_online_ddl") or None
+        if self.online_ddl not in (None, "instant", "inplace"):
+            raise util.CommandError(
+                "mysql_online_ddl must be one of 'instant' or 'inplace'; "
+                "got %r" % (self.online_ddl,)
+            )
+
+    def _exec(
+        self,
+        construct: Executable | str,
+        execution_options: Mapping[str, Any] | None = None,
+        multiparams: Sequence[Mapping[str, Any]] | None = None,
+        params: Mapping[str, Any] = util.immutabledict(),
+    ) -> CursorResult | None:
+        # constructs held to be combined into a single ALTER TABLE are
+        # given their algorithm once combined
+        if (
+            self.online_ddl is not None
+            and not isinstance(construct, str)
+            and not (
+                self._coalesce_alter_table
+                and self.can_coalesce_alter_table(construct)
+            )
+        ):
+            construct = self._online_ddl_construct(construct)
+        return super()._exec(
+            construct,
+            execution_options=execution_options,
+            multiparams=multiparams,
+            params=params,
+        )
+
+    def _online_ddl_construct(self, construct: Executable) -> Executable:
+        algorithm = self.online_ddl_algorithm(construct)
+        if algorithm is None:
+            return construct
+        elif algorithm == "INSTANT" and self.online_ddl == "inplace":
+            algorithm = "INPLACE"
+        elif algorithm == "COPY":
+            statement = str(
+                cast("ClauseElement", construct).compile(dialect=self.dialect)
+            )
+            if self.context_opts.get("mysql_online_ddl_fallback", False):
+                log.warning(
+                    "Statement can't be performed online; emitting it "
+                    "without ALGORITHM and LOCK clauses: %s",
+                    statement,
+                )
+                return construct
+            raise util.CommandError(
+                "Statement can't be performed with ALGORITHM=INSTANT or "
+                "ALGORITHM=INPLACE, LOCK=NONE, as it requires the table "
+                "to be copied or locked: %s; set "
+                "mysql_online_ddl_fallback=True to emit such statements "
+                "without online DDL clauses" % statement
+            )
+        return MySQLOnlineDDL(construct, algorithm)
+
+    def online_ddl_algorithm(self, construct: Executable) -> str | None:
+        """Return the least disruptive ``ALGORITHM`` with which the given
+        DDL construct may be performed without blocking writes to the
+        table, when the ``mysql_online_ddl`` option is in use.
+
+        Returns ``"INSTANT"``, ``"INPLACE"``, or ``"COPY"`` when the
+        operation requires the table to be copied or locked, and None for
+        constructs which don't accept an ``ALGORITHM`` clause.  The result
+        takes the version of the server into account where it's known.
+
+        .. versionadded:: 1.19.2
+
+        """
+        if isinstance(construct, CoalescedAlterTable):
+            algorithms = [
+                self.online_ddl_algorithm(element)
+                for element in construct.elements
+            ]
+            return max(
+                (a or "COPY" for a in algorithms),
+                key=_ONLINE_DDL_ALGORITHMS.index,
+            )
+        elif isinstance(construct, AddColumn):
+            column = construct.column
+            computed = column.computed
+            if (
+                column.primary_key
+                or column.autoincrement is True
+                or column.constraints
+                or (construct.inline_references and column.foreign_keys)
+                or (computed is not None and computed.persisted)
+            ):
+                return "COPY"
+            return self._instant_if((8, 0, 12), (10, 3, 2))
+        elif isinstance(construct, DropColumn):
+            return self._instant_if((8, 0, 29), (10, 4))
+        elif isinstance(construct, MySQLAlterDefault):
+            return "INSTANT"
+        elif isinstance(construct, MySQLChangeColumn):
+            alterations = construct.alterations
+            if alterations is None or alterations & {"type", "autoincrement"}:
+                return "COPY"
+            elif alterations & {"nullable", "comment"}:
+                return "INPLACE"
+            elif "name" in alterations:
+                return self._instant_if((8, 0, 28), (10, 5, 2))
+            else:
+                return "INSTANT"
+        elif isinstance(construct, RenameTable):
+            return self._instant_if((8, 0, 0), (10, 3))
+        elif isinstance(construct, schema.AddConstraint):
+            if isinstance(
+                construct.element,
+                (schema.UniqueConstraint, schema.PrimaryKeyConstraint),
+            ):
+                return "INPLACE"
+            # foreign keys are only added in place when foreign key
+            # checks are disabled
+            return "COPY"
+        elif isinstance(construct, schema.DropConstraint):
+            if isinstance(construct.element, schema.PrimaryKeyConstraint):
+                return "COPY"
+            return "INPLACE"
+        elif isinstance(construct, schema.CreateIndex):
+            if construct.element.dialect_options["mysql"]["prefix"] in (
+                "FULLTEXT",
+                "SPATIAL",
+            ):
+                return "COPY"
+            return "INPLACE"
+        elif isinstance(construct, schema.DropIndex):
+            return "INPLACE"
+        else:
+            return None
+
+    def _instant_if(
+        self,
+        mysql_version: tuple[int, ...],
+        mariadb_version: tuple[int, ...],
+    ) -> str:
+        # without a connection, the most recent server is assumed
+        version = self.dialect.server_version_info
+        if version is None or version >= (
+            mariadb_version
+            if cast("MySQLDialect", self.dialect).is_mariadb
+            else mysql_version
+        ):
+            return "INSTANT"
+        return "INPLACE"
+
+    def can_coalesce_alter_table(self, construct: Executable) -> bool:
+        return isinstance(
+            construct,
+            (
+                AddColumn,
+                DropColumn,
+                MySQLAlterDefault,
+                MySQLChangeColumn,
+                schema.AddConstraint,
+                schema.DropConstraint,
+            ),
+        )
+
     def alter_column(
         self,
         table_name: str,
@@ -113,6 +294,18 @@ class MySQLImpl(DefaultImpl):
                 existing_server_default=existing_server_default,
                 **kw,
             )
+        alterations = {
+            alteration
+            for alteration, altered in [
+                ("name", name is not None and name != column_name),
+                ("type", type_ is not None),
+                ("nullable", nullable is not None),
+                ("default", server_default is not False),
+                ("autoincrement", autoincrement is not None),
+                ("comment", comment is not False),
+            ]
+            if altered
+        }
         if name is not None or self._is_mysql_allowed_functional_default(
             type_ if type_ is not None else existing_type, server_default
         ):
@@ -145,6 +338,7 @@ class MySQLImpl(DefaultImpl):
                     comment=(
                         comment if comment is not False else existing_comment
                     ),
+                    alterations=alterations,
                 )
             )
         elif (
@@ -182,6 +376,7 @@ class MySQLImpl(DefaultImpl):
                     comment=(
                         comment if comment is not False else existing_comment
                     ),
+                    alterations=alterations,
                 )
             )
         elif server_default is not False:
@@ -410,10 +605,15 @@ class MySQLChangeColumn(AlterColumn):
         default: _ServerDefaultArgument = False,
         autoincrement: bool | None = None,
         comment: str | Literal[False] | None = False,
+        alterations: Collection[str] | None = None,
     ) -> None:
         super(AlterColumn, self).__init__(name, schema=schema)
         self.column_name = column_name
         self.nullable = nullable
+        # the attributes of the column being changed, if known
+        self.alterations = (
+            frozenset(alterations) if alterations is not None else None
+        )
         self.newname = newname
         self.default = default
         self.autoincrement = autoincrement
@@ -431,6 +631,33 @@ class MySQLModifyColumn(MySQLChangeColumn):
     pass
 
 
+class MySQLOnlineDDL(DDLElement):
+    """Represent a DDL statement with the ``ALGORITHM`` and ``LOCK``
+    clauses of MySQL online DDL."""
+
+    def __init__(self, element: Executable, algorithm: str) -> None:
+        self.element = element
+        self.algorithm = algorithm
+
+
+@compiles(MySQLOnlineDDL, "mysql", "mariadb")
+def _mysql_online_ddl(
+    element: MySQLOnlineDDL, compiler: MySQLDDLCompiler, **kw
+) -> str:
+    clauses = ["ALGORITHM=%s" % element.algorithm]
+    # INSTANT permits only the default LOCK
+    if element.algorithm == "INPLACE":
+        clauses.append("LOCK=NONE")
+
+    text = compiler.process(
+        cast("ClauseElement", element.element), **kw
+    ).rstrip()
+    if isinstance(element.element, (schema.CreateIndex, schema.DropIndex)):
+        return "%s %s" % (text, " ".join(clauses))
+    else:
+        return "%s, %s" % (text, ", ".join(clauses))
+
+
 @compiles(ColumnNullable, "mysql", "mariadb")
 @compiles(ColumnName, "mysql", "mariadb")
 @compiles(ColumnDefault, "mysql", "mariadb")
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import re
 from typing import Any
@@ -11,6 +12,7 @@ from typing import cast
 from typing import TYPE_CHECKING
 
 from sqlalchemy import Column
+from sqlalchemy import exc
 from sqlalchemy import Float
 from sqlalchemy import Identity
 from sqlalchemy import literal_column
@@ -21,7 +23,10 @@ from sqlalchemy import types as sqltypes
 from sqlalchemy.dialects.postgresql import BIGINT
 from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.dialects.postgresql import INTEGER
+from sqlalchemy.schema import AddConstraint
 from sqlalchemy.schema import CreateIndex
+from sqlalchemy.schema import DropConstraint
+from sqlalchemy.schema import DropIndex
 from sqlalchemy.sql.elements import ColumnClause
 from sqlalchemy.sql.elements import TextClause
 from sqlalchemy.sql.functions import FunctionElement
@@ -29,8 +34,12 @@ from sqlalchemy.types import NULLTYPE
 
 from .base import alter_column
 from .base import alter_table
+from .base import AddColumn
 from .base import AlterColumn
 from .base import ColumnComment
+from .base import ColumnDefault
+from .base import ColumnNullable
+from .base import DropColumn
 from .base import format_column_name
 from .base import format_table_name
 from .base import format_type
@@ -57,6 +66,8 @@ if TYPE_CHECKING:
     from sqlalchemy.dialects.postgresql.hstore import HSTORE
     from sqlalchemy.dialects.postgresql.json import JSON
     from sqlalchemy.dialects.postgresql.json import JSONB
+    from sqlalchemy.engine import Connection
+    from sqlalchemy.sql.base import Executable
     from sqlalchemy.sql.elements import ClauseElement
     from sqlalchemy.sql.elements import ColumnElement
     from sqlalchemy.sql.elements import quoted_name
@@ -92,6 +103,126 @@ class PostgresqlImpl(DefaultImpl):
                 )
         self._exec(CreateIndex(index, **kw))
 
+    def create_indexes_concurrently(
+        self, indexes: Sequence[Index], *, workers: int, retries: int
+    ) -> None:
+        """Build the given indexes using ``CREATE INDEX CONCURRENTLY``, on
+        up to the given number of connections in parallel.
+
+        Must be invoked outside of a transaction, such as within
+        :meth:`.MigrationContext.autocommit_block`.  Indexes that already
+        exist and are valid are skipped, so that a run which failed part
+        way through resumes where it left off; invalid indexes, as left
+        behind by a failed concurrent build, are dropped and built again,
+        up to the given number of retries.
+
+        .. versionadded:: 1.19.2
+
+        """
+        for index in indexes:
+            index.dialect_options["postgresql"]["concurrently"] = True
+
+        if self.as_sql:
+            for index in indexes:
+                self.create_index(index)
+            return
+
+        assert self.connection is not None
+        engine = self.connection.engine
+
+        # the worker connections are set up to resolve names in the same
+        # way as the migration's connection, by carrying over its execution
+        # options, such as schema_translate_map, and its search_path
+        execution_options = dict(self.connection.get_execution_options())
+        execution_options["isolation_level"] = "AUTOCOMMIT"
+        search_path, default_schema = self.connection.execute(
+            text("SELECT current_setting('search_path'), current_schema()")
+        ).one()
+
+        set_path = text("SELECT set_config('search_path', :path, false)")
+
+        def build(index: Index) -> None:
+            with engine.connect() as conn:
+                conn = conn.execution_options(**execution_options)
+                # search_path is set for the whole session, so restore the
+                # connection's own setting before it's returned to the pool
+                original_path = conn.execute(
+                    text("SELECT current_setting('search_path')")
+                ).scalar()
+                conn.execute(set_path, {"path": search_path})
+                try:
+                    self._build_index_concurrently(
+                        conn, index, retries, default_schema
+                    )
+                finally:
+                    conn.execute(set_path, {"path": original_path})
+
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(workers, len(indexes)))
+        ) as executor:
+            # consume the results so that the first error is raised
+            list(executor.map(build, indexes))
+
+    def _build_index_concurrently(
+        self,
+        conn: Connection,
+        index: Index,
+        retries: int,
+        default_schema: str,
+    ) -> None:
+        for attempt in range(retries + 1):
+            valid = self._index_validity(conn, index, default_schema)
+            if valid:
+                if attempt == 0:
+                    log.info("Index %s already exists; skipping", index.name)
+                return
+            elif valid is not None:
+                log.info("Dropping invalid index %s", index.name)
+                conn.execute(DropIndex(index, if_exists=True))
+
+            try:
+                conn.execute(CreateIndex(index))
+            except exc.DBAPIError as err:
+                log.warning(
+                    "Concurrent build of index %s failed: %s", index.name, err
+                )
+                if attempt == retries:
+                    raise
+                continue
+
+            if self._index_validity(conn, index, default_schema):
+                log.info("Built index %s concurrently", index.name)
+                return
+
+        raise util.CommandError(
+            "Index %s is invalid after %d attempt(s) to build it "
+            "concurrently" % (index.name, retries + 1)
+        )
+
+    def _index_validity(
+        self, conn: Connection, index: Index, default_schema: str
+    ) -> bool | None:
+        """Return whether the given index is valid, or None if it doesn't
+        exist."""
+
+        assert index.table is not None
+        schema = index.table.schema
+        schema_translate_map = conn.get_execution_options().get(
+            "schema_translate_map"
+        )
+        if schema_translate_map and schema in schema_translate_map:
+            schema = schema_translate_map[schema]
+
+        return conn.execute(
+            text(
+                "SELECT i.indisvalid FROM pg_catalog.pg_index i "
+                "JOIN pg_catalog.pg_class c ON c.oid = i.indexrelid "
+                "JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE c.relname = :name AND n.nspname = :schema"
+            ),
+            {"name": index.name, "schema": schema or default_schema},
+        ).scalar()
+
     def prep_table_for_batch(self, batch_impl, table):
         for constraint in table.constraints:
             if (
@@ -100,13 +231,24 @@ class PostgresqlImpl(DefaultImpl):
             ):
                 self.drop_constraint(constraint)
 
-    def compare_server_default(
+    def __init__(self, *arg: Any, **kw: Any) -> None:
+        super().__init__(*arg, **kw)
+        self._server_default_results: dict[tuple[str, str], bool] = {}
+
+    def _server_default_comparison(
         self,
         inspector_column,
         metadata_column,
         rendered_metadata_default,
         rendered_inspector_default,
     ):
+        """Compare the given defaults locally where possible.
+
+        Returns True or False if the defaults could be compared without the
+        server, else a tuple of the reflected default text and the metadata
+        default expression, which are to be compared on the server.
+
+        """
 
         # don't do defaults for SERIAL columns
         if (
@@ -142,14 +284,133 @@ class PostgresqlImpl(DefaultImpl):
 
             metadata_default = literal_column(metadata_default)
 
+        if self.as_sql or self.connection is None:
+            # no server to compare against, such as when autogenerating
+            # from a reflection snapshot; as the defaults may be textually
+            # different yet equivalent, e.g. '0'::integer and 0, they are
+            # not reported as different
+            log.info(
+                "Skipping comparison of server default %r to %r on column "
+                "'%s.%s' as there is no database connection",
+                conn_col_default,
+                rendered_metadata_default,
+                metadata_column.table.name,
+                metadata_column.name,
+            )
+            return False
+
+        return conn_col_default, metadata_default
+
+    def _server_default_key(self, conn_col_default, metadata_default):
+        return (
+            conn_col_default,
+            str(
+                metadata_default.compile(
+                    dialect=self.dialect,
+                    compile_kwargs={"literal_binds": True},
+                )
+            ),
+        )
+
+    def prepare_server_default_comparisons(self, comparisons):
+        # evaluate all the comparisons of the table which require the
+        # server within a single SELECT, rather than one per column
+        if self.as_sql or self.connection is None:
+            return
+
+        pending = {}
+        for comparison in comparisons:
+            result = self._server_default_comparison(*comparison)
+            if not isinstance(result, tuple):
+                continue
+            try:
+                key = self._server_default_key(*result)
+            except exc.CompileError:
+                continue
+            if key not in self._server_default_results:
+                pending[key] = result
+
+        if len(pending) < 2:
+            return
+
+        keys = list(pending)
+        stmt = select(
+            *[
+                (literal_column(conn_col_default) == metadata_default).label(
+                    f"default_{idx}"
+                )
+                for idx, (conn_col_default, metadata_default) in enumerate(
+                    pending[key] for key in keys
+                )
+            ]
+        )
+
+        # an expression which can't be evaluated fails the statement;
+        # leave the comparisons to be evaluated one at a time in that case.
+        # this requires a savepoint, so is only done within a transaction
+        conn = self.connection
+        if not conn.in_transaction():
+            return
+        try:
+            with conn.begin_nested():
+                row = conn.execute(stmt).one()
+        except exc.DBAPIError:
+            return
+
+        for key, equal in zip(keys, row):
+            self._server_default_results[key] = not equal
+
+    def compare_server_default(
+        self,
+        inspector_column,
+        metadata_column,
+        rendered_metadata_default,
+        rendered_inspector_default,
+    ):
+        result = self._server_default_comparison(
+            inspector_column,
+            metadata_column,
+            rendered_metadata_default,
+            rendered_inspector_default,
+        )
+        if not isinstance(result, tuple):
+            return result
+
+        conn_col_default, metadata_default = result
+        try:
+            key = self._server_default_key(conn_col_default, metadata_default)
+        except exc.CompileError:
+            key = None
+        else:
+            if key in self._server_default_results:
+                return self._server_default_results[key]
+
         # run a real compare against the server
         # TODO: this seems quite a bad idea for a default that's a SQL
         # function!   SQL functions are not deterministic!
         conn = self.connection
         assert conn is not None
-        return not conn.scalar(
+        is_diff = not conn.scalar(
             select(literal_column(conn_col_default) == metadata_default)
         )
+        if key is not None:
+            self._server_default_results[key] = is_diff
+        return is_diff
+
+    def can_coalesce_alter_table(self, construct: Executable) -> bool:
+        # RENAME and COMMENT ON can't be combined with other clauses
+        return isinstance(
+            construct,
+            (
+                AddColumn,
+                DropColumn,
+                ColumnNullable,
+                ColumnDefault,
+                PostgresqlColumnType,
+                AddConstraint,
+                DropConstraint,
+            ),
+        )
 
     def alter_column(
         self,
@@ -205,6 +466,13 @@ class PostgresqlImpl(DefaultImpl):
         )
 
     def autogen_column_reflect(self, inspector, table, column_info):
+        from ..autogenerate.snapshot import _SnapshotInspector
+
+        if isinstance(inspector, _SnapshotInspector):
+            # SERIAL defaults were already omitted from the reflected
+            # columns when the snapshot was taken
+            return
+
         if column_info.get("default") and isinstance(
             column_info["type"], (INTEGER, BIGINT)
         ):
@@ -849,3 +1117,95 @@ def _render_potential_column(
             autogen_context,
             wrap_in_element=isinstance(value, (TextClause, FunctionElement)),
         )
+
+
+@Operations.register_operation("create_indexes_concurrently")
+class CreateIndexesConcurrentlyOp(ops.MigrateOperation):
+    """Represent the concurrent build of a set of indexes."""
+
+    def __init__(
+        self,
+        indexes: Sequence[ops.CreateIndexOp],
+        *,
+        workers: int = 4,
+        retries: int = 1,
+    ) -> None:
+        self.indexes = list(indexes)
+        self.workers = workers
+        self.retries = retries
+
+    @classmethod
+    def create_indexes_concurrently(
+        cls,
+        operations: Operations,
+        indexes: Sequence[ops.CreateIndexOp],
+        *,
+        workers: int = 4,
+        retries: int = 1,
+    ) -> None:
+        """Build a set of indexes using ``CREATE INDEX CONCURRENTLY``, on
+        several database connections in parallel.
+
+        .. note::  This method is Postgresql specific.
+
+        e.g.::
+
+            from alembic import op
+            from alembic.operations import ops
+
+            op.create_indexes_concurrently(
+                [
+                    ops.CreateIndexOp("ix_user_email", "user", ["email"]),
+                    ops.CreateIndexOp("ix_order_user", "order", ["user_id"]),
+                ],
+                workers=8,
+            )
+
+        The transaction in progress is committed, as with
+        :meth:`.MigrationContext.autocommit_block`, and each index is then
+        built on its own connection from the engine of the migration's
+        connection, with up to ``workers`` indexes being built at once.
+        Each of these connections receives the execution options of the
+        migration's connection, such as ``schema_translate_map``, as well
+        as its ``search_path``, so that table names resolve in the same way.
+
+        Once built, each index is checked for validity; an index left
+        invalid, such as by a deadlock or a uniqueness violation during the
+        build, is dropped and built again, up to ``retries`` times, after
+        which an error is raised.  Indexes that already exist and are valid
+        are skipped, so that if the migration fails part way through, running
+        it again builds only the indexes that remain.
+
+        In ``--sql`` mode, the ``CREATE INDEX CONCURRENTLY`` statements are
+        rendered one after another.
+
+        :param indexes: sequence of :class:`.CreateIndexOp` objects
+         describing the indexes to build.
+        :param workers: maximum number of indexes to build at once, each on
+         its own connection.  Defaults to 4.
+        :param retries: number of times an index that is invalid once built
+         is dropped and built again.  Defaults to 1.
+
+        .. versionadded:: 1.19.2
+
+        """
+        op = cls(indexes, workers=workers, retries=retries)
+        return operations.invoke(op)
+
+
+@Operations.implementation_for(CreateIndexesConcurrentlyOp)
+def _create_indexes_concurrently(
+    operations: Operations, operation: CreateIndexesConcurrentlyOp
+) -> None:
+    if not isinstance(operations.impl, PostgresqlImpl):
+        raise NotImplementedError(
+            "create_indexes_concurrently is only supported on PostgreSQL"
+        )
+    indexes = [
+        index_op.to_index(operations.migration_context)
+        for index_op in operation.indexes
+    ]
+    with operations.get_context().autocommit_block():
+        operations.impl.create_indexes_concurrently(
+            indexes, workers=operation.workers, retries=operation.retries
+        )
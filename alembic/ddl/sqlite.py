@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 import re
 from typing import Any
 from typing import TYPE_CHECKING
@@ -23,6 +25,11 @@ from .. import util
 from ..util.sqla_compat import compiles
 
 if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+    from typing import TextIO
+
+    from sqlalchemy.engine import Connection
+    from sqlalchemy.engine import Dialect
     from sqlalchemy.engine.reflection import Inspector
     from sqlalchemy.sql.compiler import DDLCompiler
     from sqlalchemy.sql.elements import Cast
@@ -32,6 +39,7 @@ if TYPE_CHECKING:
     from sqlalchemy.sql.schema import Table
     from sqlalchemy.sql.type_api import TypeEngine
 
+    from ..operations.batch import ApplyBatchImpl
     from ..operations.batch import BatchOperationsImpl
 
 
@@ -43,6 +51,37 @@ class SQLiteImpl(DefaultImpl):
     see: http://bugs.python.org/issue10740
     """
 
+    fast_batch_copy_pragmas = {
+        "synchronous": "OFF",
+        "journal_mode": "MEMORY",
+        "cache_size": "-262144",
+        "foreign_keys": "OFF",
+    }
+    """PRAGMA settings in effect while rows are copied in batch mode,
+    when :paramref:`.EnvironmentContext.configure.sqlite_fast_batch_copy`
+    is set."""
+
+    def __init__(
+        self,
+        dialect: Dialect,
+        connection: Connection | None,
+        as_sql: bool,
+        transactional_ddl: bool | None,
+        output_buffer: TextIO | None,
+        context_opts: dict[str, Any],
+    ) -> None:
+        super().__init__(
+            dialect,
+            connection,
+            as_sql,
+            transactional_ddl,
+            output_buffer,
+            context_opts,
+        )
+        self.fast_batch_copy = bool(
+            context_opts.get("sqlite_fast_batch_copy", False)
+        )
+
     def requires_recreate_in_batch(
         self, batch_op: BatchOperationsImpl
     ) -> bool:
@@ -71,6 +110,40 @@ class SQLiteImpl(DefaultImpl):
         else:
             return False
 
+    def batch_copy_context(
+        self, batch_impl: ApplyBatchImpl
+    ) -> AbstractContextManager[None] | None:
+        if not self.fast_batch_copy:
+            return None
+        return self._fast_batch_copy()
+
+    @contextmanager
+    def _fast_batch_copy(self) -> Iterator[None]:
+        conn = self.connection
+        assert conn is not None
+
+        pragmas = dict(self.fast_batch_copy_pragmas)
+        if conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal":
+            # leaving WAL mode requires exclusive access to the database
+            # and is persisted in the database file, so leave it in place
+            pragmas.pop("journal_mode", None)
+
+        saved: dict[str, Any] = {}
+        for name in pragmas:
+            current = conn.exec_driver_sql("PRAGMA %s" % name).scalar()
+            # pragmas which report no value aren't restored
+            if current is not None:
+                saved[name] = current
+        for name, value in pragmas.items():
+            conn.exec_driver_sql("PRAGMA %s = %s" % (name, value)).close()
+        try:
+            yield
+        finally:
+            for name, current in saved.items():
+                conn.exec_driver_sql(
+                    "PRAGMA %s = %s" % (name, current)
+                ).close()
+
     def add_constraint(self, const: Constraint, **kw: Any):
         # attempt to distinguish between an
         # auto-gen constraint and an explicit one
@@ -6,6 +6,7 @@ from contextlib import contextmanager
 from typing import Any
 from typing import Awaitable
 from typing import Callable
+from typing import Iterable
 from typing import Iterator
 from typing import Literal
 from typing import Mapping
@@ -315,6 +316,7 @@ def batch_alter_table(
     reflect_args: tuple[Any, ...] = (),
     reflect_kwargs: Mapping[str, Any] = immutabledict({}),
     naming_convention: dict[str, str] | None = None,
+    copy_batch_size: int | None = None,
 ) -> Iterator[BatchOperations]:
     """Invoke a series of per-table migrations in batch.
 
@@ -445,6 +447,28 @@ def batch_alter_table(
      set is undefined.   Therefore it is best to specify the complete
      ordering of all columns for best results.
 
+    :param copy_batch_size: when the table is recreated, copy rows from the
+     existing table to the new one in batches of this many rows, in order
+     of primary key, rather than using a single ``INSERT..SELECT``
+     statement.  The transaction in progress is committed first and each
+     batch is committed as it's copied, as with
+     :meth:`.MigrationContext.autocommit_block`, so that the transaction
+     journal does not grow with the size of the table.  The number of rows
+     copied, and the rate at which they are copied, is logged to the
+     ``alembic.operations.batch`` logger.  If the copy fails, the new table
+     is left in place, and when the migration is run again, copying resumes
+     after the rows already present in the new table.  The table must not
+     be written to while it's being copied; the number of rows in both
+     tables is compared once the copy completes, and an error is raised
+     if they differ.  Requires a table with a single-column primary key.
+     Has no effect in ``--sql`` mode.
+
+     .. seealso::
+
+        :ref:`batch_chunked_copy`
+
+     .. versionadded:: 1.19.2
+
     .. note:: batch mode requires SQLAlchemy 0.8 or above.
 
     .. seealso::
@@ -455,9 +479,11 @@ def batch_alter_table(
 
 def bulk_insert(
     table: Table | TableClause,
-    rows: list[dict[str, Any]],
+    rows: Iterable[dict[str, Any]],
     *,
     multiinsert: bool = True,
+    chunk_size: int | None = None,
+    multirow_values: bool = False,
 ) -> None:
     """Issue a "bulk insert" operation using the current
     migration context.
@@ -542,7 +568,15 @@ def bulk_insert(
 
     :param table: a table object which represents the target of the INSERT.
 
-    :param rows: a list of dictionaries indicating rows.
+    :param rows: a list of dictionaries indicating rows.  Any other
+       iterable of dictionaries, such as a generator, may also be
+       passed, in which case rows are consumed from the iterable as they
+       are inserted, rather than all being held in memory at once; this
+       is most useful in conjunction with the
+       :paramref:`~.Operations.bulk_insert.chunk_size` parameter.
+
+       .. versionchanged:: 1.19.2 Iterables other than lists are
+          accepted.
 
     :param multiinsert: when at its default of True and --sql mode is not
        enabled, the INSERT statement will be executed using
@@ -553,6 +587,29 @@ def bulk_insert(
        in those cases where non-literal values are present in the
        parameter sets.
 
+    :param chunk_size: when using "executemany()" style, the maximum
+       number of rows to pass in each execution.  Rows are consumed from
+       the given iterable one chunk at a time.  Defaults to None, in
+       which case all rows are passed in a single execution.
+
+       In --sql mode, when
+       :paramref:`~.Operations.bulk_insert.multirow_values` is set, the
+       maximum number of rows to render in each INSERT statement.
+
+       .. versionadded:: 1.19.2
+
+    :param multirow_values: when True, in --sql mode, and when the
+       backend supports multi-row ``INSERT..VALUES`` statements, as is
+       the case for PostgreSQL, MySQL / MariaDB, SQLite and SQL Server,
+       consecutive rows which have the same keys are rendered as a
+       single INSERT statement, of up to
+       :paramref:`~.Operations.bulk_insert.chunk_size` rows if given
+       (SQL Server is limited to 1000 rows per statement).  Defaults to
+       False, in which case, or on other backends, one INSERT statement
+       is rendered per row.  Has no effect when not in --sql mode.
+
+       .. versionadded:: 1.19.2
+
     """
 
 def create_check_constraint(
@@ -766,6 +823,59 @@ def create_index(
 
     """
 
+def create_indexes_concurrently(
+    indexes: Sequence[CreateIndexOp],
+    *,
+    workers: int = 4,
+    retries: int = 1,
+) -> None:
+    """Build a set of indexes using ``CREATE INDEX CONCURRENTLY``, on
+    several database connections in parallel.
+
+    .. note::  This method is Postgresql specific.
+
+    e.g.::
+
+        from alembic import op
+        from alembic.operations import ops
+
+        op.create_indexes_concurrently(
+            [
+                ops.CreateIndexOp("ix_user_email", "user", ["email"]),
+                ops.CreateIndexOp("ix_order_user", "order", ["user_id"]),
+            ],
+            workers=8,
+        )
+
+    The transaction in progress is committed, as with
+    :meth:`.MigrationContext.autocommit_block`, and each index is then
+    built on its own connection from the engine of the migration's
+    connection, with up to ``workers`` indexes being built at once.
+    Each of these connections receives the execution options of the
+    migration's connection, such as ``schema_translate_map``, as well
+    as its ``search_path``, so that table names resolve in the same way.
+
+    Once built, each index is checked for validity; an index left
+    invalid, such as by a deadlock or a uniqueness violation during the
+    build, is dropped and built again, up to ``retries`` times, after
+    which an error is raised.  Indexes that already exist and are valid
+    are skipped, so that if the migration fails part way through, running
+    it again builds only the indexes that remain.
+
+    In ``--sql`` mode, the ``CREATE INDEX CONCURRENTLY`` statements are
+    rendered one after another.
+
+    :param indexes: sequence of :class:`.CreateIndexOp` objects
+     describing the indexes to build.
+    :param workers: maximum number of indexes to build at once, each on
+     its own connection.  Defaults to 4.
+    :param retries: number of times an index that is invalid once built
+     is dropped and built again.  Defaults to 1.
+
+    .. versionadded:: 1.19.2
+
+    """
+
 def create_primary_key(
     constraint_name: str | None,
     table_name: str,
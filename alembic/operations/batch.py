@@ -3,13 +3,18 @@
 
 from __future__ import annotations
 
+from contextlib import nullcontext
+import logging
+import time
 from typing import Any
 from typing import TYPE_CHECKING
 
 from sqlalchemy import CheckConstraint
 from sqlalchemy import Column
 from sqlalchemy import ForeignKeyConstraint
+from sqlalchemy import func
 from sqlalchemy import Index
+from sqlalchemy import inspect
 from sqlalchemy import MetaData
 from sqlalchemy import PrimaryKeyConstraint
 from sqlalchemy import schema as sql_schema
@@ -34,16 +39,22 @@ from ..util.sqla_compat import constraint_name_defined
 from ..util.sqla_compat import constraint_name_string
 
 if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
     from typing import Literal
 
     from sqlalchemy.engine import Dialect
     from sqlalchemy.sql.elements import ColumnClause
+    from sqlalchemy.sql.dml import Insert
+    from sqlalchemy.sql.elements import ColumnElement
     from sqlalchemy.sql.elements import quoted_name
     from sqlalchemy.sql.schema import Constraint
     from sqlalchemy.sql.type_api import TypeEngine
 
     from ..ddl.base import _ServerDefaultType
     from ..ddl.impl import DefaultImpl
+    from ..runtime.migration import MigrationContext
+
+log = logging.getLogger(__name__)
 
 
 class BatchOperationsImpl:
@@ -60,6 +71,7 @@ class BatchOperationsImpl:
         reflect_kwargs,
         naming_convention,
         partial_reordering,
+        copy_batch_size=None,
     ):
         self.operations = operations
         self.table_name = table_name
@@ -69,6 +81,9 @@ class BatchOperationsImpl:
                 "recreate may be one of 'auto', 'always', or 'never'."
             )
         self.recreate = recreate
+        if copy_batch_size is not None and copy_batch_size < 1:
+            raise ValueError("copy_batch_size must be a positive integer.")
+        self.copy_batch_size = copy_batch_size
         self.copy_from = copy_from
         self.table_args = table_args
         self.table_kwargs = dict(table_kwargs)
@@ -150,6 +165,8 @@ class BatchOperationsImpl:
                     self.table_kwargs,
                     reflected,
                     partial_reordering=self.partial_reordering,
+                    copy_batch_size=self.copy_batch_size,
+                    migration_context=self.operations.migration_context,
                 )
                 for opname, arg, kw in self.batch:
                     fn = getattr(batch_impl, opname)
@@ -213,6 +230,8 @@ class ApplyBatchImpl:
         table_kwargs: dict[str, Any],
         reflected: bool,
         partial_reordering: tuple = (),
+        copy_batch_size: int | None = None,
+        migration_context: MigrationContext | None = None,
     ) -> None:
         self.impl = impl
         self.table = table  # this is a Table object
@@ -222,6 +241,8 @@ class ApplyBatchImpl:
         self.new_table: Table | None = None
 
         self.partial_reordering = partial_reordering  # tuple of tuples
+        self.copy_batch_size = copy_batch_size
+        self.migration_context = migration_context
         self.add_col_ordering: tuple[
             tuple[str, str], ...
         ] = ()  # tuple of tuples
@@ -439,41 +460,206 @@ class ApplyBatchImpl:
 
         op_impl.prep_table_for_batch(self, self.table)
         assert self.new_table is not None
-        op_impl.create_table(self.new_table)
 
+        if op_impl.as_sql:
+            copy_context = None
+        else:
+            copy_context = op_impl.batch_copy_context(self)
+
+        if self.copy_batch_size is not None and not op_impl.as_sql:
+            # the new table is left in place if the copy fails, so that
+            # running the migration again resumes the copy
+            self._copy_in_chunks(op_impl, copy_context)
+            op_impl.drop_table(self.table)
+        else:
+            op_impl.create_table(self.new_table)
+            try:
+                if copy_context is not None:
+                    assert self.migration_context is not None
+                    with self.migration_context.autocommit_block():
+                        with copy_context:
+                            op_impl._exec(self._copy_data())
+                else:
+                    op_impl._exec(self._copy_data())
+                op_impl.drop_table(self.table)
+            except:
+                op_impl.drop_table(self.new_table)
+                raise
+
+        op_impl.rename_table(
+            self.temp_table_name, self.table.name, schema=self.table.schema
+        )
+        self.new_table.name = self.table.name
         try:
-            op_impl._exec(
-                self.new_table.insert()
-                .inline()
-                .from_select(
-                    list(
-                        k
-                        for k, transfer in self.column_transfers.items()
+            for idx in self._gather_indexes_from_both_tables():
+                op_impl.create_index(idx)
+        finally:
+            self.new_table.name = self.temp_table_name
+
+    def _copy_data(self, *criteria: ColumnElement[bool]) -> Insert:
+        assert self.new_table is not None
+        return (
+            self.new_table.insert()
+            .inline()
+            .from_select(
+                list(
+                    k
+                    for k, transfer in self.column_transfers.items()
+                    if "expr" in transfer
+                ),
+                select(
+                    *[
+                        transfer["expr"]
+                        for transfer in self.column_transfers.values()
                         if "expr" in transfer
-                    ),
-                    select(
-                        *[
-                            transfer["expr"]
-                            for transfer in self.column_transfers.values()
-                            if "expr" in transfer
-                        ]
-                    ),
+                    ]
+                ).where(*criteria),
+            )
+        )
+
+    def _copy_in_chunks(
+        self,
+        op_impl: DefaultImpl,
+        copy_context: AbstractContextManager[None] | None,
+    ) -> None:
+        """Copy rows to the new table in ranges of primary key values,
+        committing each range, resuming after the rows already present in
+        the new table if it exists from a previous run.
+
+        The table must not be written to while the copy takes place; the
+        number of rows in both tables is compared once the copy completes,
+        and an error is raised if they differ.
+
+        """
+
+        assert self.new_table is not None
+        assert self.migration_context is not None
+        assert self.copy_batch_size is not None
+
+        pk_cols = list(self.table.primary_key)
+        if len(pk_cols) != 1 or pk_cols[0].key not in self.new_table.c:
+            raise exc.CommandError(
+                "Copying table %s in batches requires a single-column "
+                "primary key which is present in the new table"
+                % self.table.name
+            )
+        old_pk = pk_cols[0]
+        new_pk = self.new_table.c[old_pk.key]
+
+        conn = op_impl.connection
+        assert conn is not None
+
+        lower = None
+        insp = inspect(conn)
+        if insp.has_table(self.temp_table_name, schema=self.table.schema):
+            existing_cols = sorted(
+                col["name"]
+                for col in insp.get_columns(
+                    self.temp_table_name, schema=self.table.schema
                 )
             )
-            op_impl.drop_table(self.table)
-        except:
-            op_impl.drop_table(self.new_table)
-            raise
+            new_cols = sorted(col.name for col in self.new_table.c)
+            if existing_cols != new_cols:
+                raise exc.CommandError(
+                    "Table %s exists with columns (%s), which don't match "
+                    "the columns (%s) of the new table for %s; drop it in "
+                    "order to copy the table again"
+                    % (
+                        self.temp_table_name,
+                        ", ".join(existing_cols),
+                        ", ".join(new_cols),
+                        self.table.name,
+                    )
+                )
+
+            if old_pk.type.compile(conn.dialect) == new_pk.type.compile(
+                conn.dialect
+            ):
+                # the key values are copied unchanged, so the copy resumes
+                # after the greatest key present in the new table
+                lower = conn.scalar(select(func.max(new_pk)))
+            else:
+                # rows are copied in order of the old table's key, so the
+                # new table holds the first rows of the old table in that
+                # order; the key to resume after is located in the old
+                # table, as the new key may sort differently
+                existing = conn.scalar(
+                    select(func.count()).select_from(new_pk.table)
+                )
+                if existing:
+                    lower = conn.scalar(
+                        select(old_pk)
+                        .order_by(old_pk)
+                        .offset(existing - 1)
+                        .limit(1)
+                    )
+            log.info(
+                "Resuming copy of table %s into existing table %s "
+                "after key %r",
+                self.table.name,
+                self.temp_table_name,
+                lower,
+            )
         else:
-            op_impl.rename_table(
-                self.temp_table_name, self.table.name, schema=self.table.schema
+            op_impl.create_table(self.new_table)
+
+        copied = 0
+        start = time.perf_counter()
+        with (
+            self.migration_context.autocommit_block(),
+            copy_context or nullcontext(),
+        ):
+            while True:
+                upper_bound = (
+                    select(old_pk)
+                    .order_by(old_pk)
+                    .offset(self.copy_batch_size - 1)
+                    .limit(1)
+                )
+                criteria = []
+                if lower is not None:
+                    criteria.append(old_pk > lower)
+                    upper_bound = upper_bound.where(old_pk > lower)
+                assert op_impl.connection is not None
+                upper = op_impl.connection.scalar(upper_bound)
+                if upper is not None:
+                    criteria.append(old_pk <= upper)
+
+                result = op_impl._exec(self._copy_data(*criteria))
+                assert result is not None
+                copied += result.rowcount
+                elapsed = time.perf_counter() - start
+                log.info(
+                    "Copied %d rows of table %s (%d rows/sec)",
+                    copied,
+                    self.table.name,
+                    copied / elapsed if elapsed else 0,
+                )
+                if upper is None:
+                    break
+                lower = upper
+
+        assert op_impl.connection is not None
+        old_count, new_count = op_impl.connection.execute(
+            select(
+                select(func.count()).select_from(self.table).scalar_subquery(),
+                select(func.count())
+                .select_from(self.new_table)
+                .scalar_subquery(),
+            )
+        ).one()
+        if old_count != new_count:
+            raise exc.CommandError(
+                "Table %s has %d rows, however %d rows were copied into "
+                "table %s; the table may have been written to while it was "
+                "being copied.  Both tables have been left in place"
+                % (
+                    self.table.name,
+                    old_count,
+                    new_count,
+                    self.temp_table_name,
+                )
             )
-            self.new_table.name = self.table.name
-            try:
-                for idx in self._gather_indexes_from_both_tables():
-                    op_impl.create_index(idx)
-            finally:
-                self.new_table.name = self.temp_table_name
 
     def alter_column(
         self,
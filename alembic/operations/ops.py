@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import abstractmethod
+from collections.abc import Iterable
 from collections.abc import Iterator
 from collections.abc import MutableMapping
 from collections.abc import Sequence
@@ -2422,22 +2423,28 @@ class BulkInsertOp(MigrateOperation):
     def __init__(
         self,
         table: Table | TableClause,
-        rows: list[dict[str, Any]],
+        rows: Iterable[dict[str, Any]],
         *,
         multiinsert: bool = True,
+        chunk_size: int | None = None,
+        multirow_values: bool = False,
     ) -> None:
         self.table = table
         self.rows = rows
         self.multiinsert = multiinsert
+        self.chunk_size = chunk_size
+        self.multirow_values = multirow_values
 
     @classmethod
     def bulk_insert(
         cls,
         operations: Operations,
         table: Table | TableClause,
-        rows: list[dict[str, Any]],
+        rows: Iterable[dict[str, Any]],
         *,
         multiinsert: bool = True,
+        chunk_size: int | None = None,
+        multirow_values: bool = False,
     ) -> None:
         """Issue a "bulk insert" operation using the current
         migration context.
@@ -2522,7 +2529,15 @@ class BulkInsertOp(MigrateOperation):
 
         :param table: a table object which represents the target of the INSERT.
 
-        :param rows: a list of dictionaries indicating rows.
+        :param rows: a list of dictionaries indicating rows.  Any other
+           iterable of dictionaries, such as a generator, may also be
+           passed, in which case rows are consumed from the iterable as they
+           are inserted, rather than all being held in memory at once; this
+           is most useful in conjunction with the
+           :paramref:`~.Operations.bulk_insert.chunk_size` parameter.
+
+           .. versionchanged:: 1.19.2 Iterables other than lists are
+              accepted.
 
         :param multiinsert: when at its default of True and --sql mode is not
            enabled, the INSERT statement will be executed using
@@ -2533,9 +2548,38 @@ class BulkInsertOp(MigrateOperation):
            in those cases where non-literal values are present in the
            parameter sets.
 
+        :param chunk_size: when using "executemany()" style, the maximum
+           number of rows to pass in each execution.  Rows are consumed from
+           the given iterable one chunk at a time.  Defaults to None, in
+           which case all rows are passed in a single execution.
+
+           In --sql mode, when
+           :paramref:`~.Operations.bulk_insert.multirow_values` is set, the
+           maximum number of rows to render in each INSERT statement.
+
+           .. versionadded:: 1.19.2
+
+        :param multirow_values: when True, in --sql mode, and when the
+           backend supports multi-row ``INSERT..VALUES`` statements, as is
+           the case for PostgreSQL, MySQL / MariaDB, SQLite and SQL Server,
+           consecutive rows which have the same keys are rendered as a
+           single INSERT statement, of up to
+           :paramref:`~.Operations.bulk_insert.chunk_size` rows if given
+           (SQL Server is limited to 1000 rows per statement).  Defaults to
+           False, in which case, or on other backends, one INSERT statement
+           is rendered per row.  Has no effect when not in --sql mode.
+
+           .. versionadded:: 1.19.2
+
         """
 
-        op = cls(table, rows, multiinsert=multiinsert)
+        op = cls(
+            table,
+            rows,
+            multiinsert=multiinsert,
+            chunk_size=chunk_size,
+            multirow_values=multirow_values,
+        )
         operations.invoke(op)
 
 
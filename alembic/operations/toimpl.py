@@ -248,7 +248,11 @@ def bulk_insert(
     operations: "Operations", operation: "ops.BulkInsertOp"
 ) -> None:
     operations.impl.bulk_insert(  # type: ignore[union-attr]
-        operation.table, operation.rows, multiinsert=operation.multiinsert
+        operation.table,
+        operation.rows,
+        multiinsert=operation.multiinsert,
+        chunk_size=operation.chunk_size,
+        multirow_values=operation.multirow_values,
     )
 
 
@@ -540,6 +540,88 @@ class EnvironmentContext(util.ModuleClsProxy):
          only takes effect when the table is first created.
          Defaults to True; setting to False should not be necessary and is
          here for backwards compatibility reasons.
+        :param defer_version_updates: boolean, when True, changes to the
+         heads present in the version table are kept in memory as each
+         migration is run, and only the net change is written to the
+         version table once all migrations have been run, within the
+         enclosing transaction; a long series of migrations will typically
+         then produce a single UPDATE.  When each migration is committed in
+         its own transaction, such as when
+         :paramref:`.EnvironmentContext.configure.transaction_per_migration`
+         is used or on backends that don't support transactional DDL, the
+         change is instead written at the end of each migration.  The
+         change is also written when :meth:`.MigrationContext.autocommit_block`
+         commits the transaction in progress, so that the version table
+         matches the migrations committed along with it.
+         Defaults to False.
+
+         .. versionadded:: 1.19.2
+
+        :param coalesce_alter_table: boolean, when True, consecutive
+         operations that alter the same table, such as
+         :meth:`.Operations.add_column`, :meth:`.Operations.alter_column`,
+         :meth:`.Operations.drop_column` and
+         :meth:`.Operations.create_foreign_key`, are held and then emitted
+         as a single ``ALTER TABLE`` statement with multiple clauses, on
+         backends which support it; currently MySQL, MariaDB and
+         PostgreSQL.  On MySQL, each ``ALTER TABLE`` that can't be
+         performed in place copies the table, so combining the clauses
+         reduces the number of copies to one.  The held clauses are
+         emitted when an operation against another table or any other
+         statement is emitted, when :meth:`.Operations.get_bind` is called,
+         when an operation refers to a column or constraint already held,
+         and at the end of each migration.  Statements which a migration
+         emits on a connection it acquired before the held clauses, such
+         as one returned by an earlier call to
+         :meth:`.Operations.get_bind`, don't cause the clauses to be
+         emitted, and won't see their effects; call
+         :meth:`.Operations.get_bind` again before such statements.
+         Defaults to False.
+
+         .. versionadded:: 1.19.2
+
+        :param mysql_online_ddl: on MySQL and MariaDB, one of ``"instant"``
+         or ``"inplace"``; when set, ``ALTER TABLE``, ``CREATE INDEX`` and
+         ``DROP INDEX`` statements are emitted with the ``ALGORITHM`` and
+         ``LOCK`` clauses of online DDL, so that writes to the table aren't
+         blocked while the statement runs.  With ``"instant"``, operations
+         that only change table metadata, such as adding or dropping a
+         column, renaming a column or changing its default, use
+         ``ALGORITHM=INSTANT`` where the server version supports it, and
+         other operations use ``ALGORITHM=INPLACE, LOCK=NONE``; with
+         ``"inplace"``, all operations use ``ALGORITHM=INPLACE, LOCK=NONE``.
+         Operations that require the table to be copied or locked, such as
+         changing the type of a column or adding a foreign key, raise an
+         error, unless
+         :paramref:`.EnvironmentContext.configure.mysql_online_ddl_fallback`
+         is set.  The clauses are included in ``--sql`` output, where the
+         most recent server version is assumed.  Defaults to None.
+
+         .. versionadded:: 1.19.2
+
+        :param mysql_online_ddl_fallback: boolean, when True along with
+         :paramref:`.EnvironmentContext.configure.mysql_online_ddl`,
+         operations that can't be performed online are emitted without the
+         ``ALGORITHM`` and ``LOCK`` clauses, and a warning is logged, rather
+         than raising an error.  Defaults to False.
+
+         .. versionadded:: 1.19.2
+
+        :param sqlite_fast_batch_copy: boolean, when True, and a table is
+         recreated in batch mode on SQLite, rows are copied to the new table
+         outside of the migration's transaction, within
+         :meth:`.MigrationContext.autocommit_block`, with the ``synchronous``,
+         ``journal_mode``, ``cache_size`` and ``foreign_keys`` PRAGMA settings
+         adjusted for speed; the previous settings are restored once the copy
+         completes.  A database in WAL mode is left in WAL mode.  Has no effect
+         in ``--sql`` mode.  Defaults to False.
+
+         .. seealso::
+
+            :ref:`batch_sqlite_fast_copy`
+
+         .. versionadded:: 1.19.2
+
         :param on_version_apply: a callable or collection of callables to be
             run for each migration step.
             The callables will be run in the order they are given, once for
@@ -878,6 +960,39 @@ class EnvironmentContext(util.ModuleClsProxy):
             :ref:`alembic.plugins.toplevel` - Introduction and documentation
             to the plugin system
 
+        :param autogenerate_reflection_bind: An
+         :class:`~sqlalchemy.engine.Engine`, or a callable that returns a new
+         :class:`~sqlalchemy.engine.Connection`, from which additional
+         connections are acquired in order to reflect the database schema in
+         parallel during autogenerate.  The table names within each schema are
+         split into shards, each of which is reflected on its own connection
+         in a thread pool; the results are then merged into the reflected
+         :class:`~sqlalchemy.schema.MetaData` on the main connection, so that
+         the operations generated are the same as when reflecting on a single
+         connection.  Connections returned by a callable are closed once
+         reflection of a shard completes.
+
+         As these connections are separate from the one passed to
+         :meth:`.EnvironmentContext.configure`, they will not see schema
+         changes that are uncommitted on that connection.  The execution
+         options of that connection, such as ``schema_translate_map``, are
+         applied to each additional connection; however, session state such
+         as a PostgreSQL ``search_path`` set on the main connection is not.
+         If an additional connection reports a different default schema name
+         than the main connection, the default schema is reflected on the
+         main connection only, while explicitly named schemas are still
+         reflected in parallel.  Parallel reflection requires SQLAlchemy 2.0
+         or greater; on older versions the parameter is ignored.
+
+         .. versionadded:: 1.19.2
+
+        :param autogenerate_reflection_workers: The number of connections
+         used in parallel when
+         :paramref:`.EnvironmentContext.configure.autogenerate_reflection_bind`
+         is present.  Defaults to 4.
+
+         .. versionadded:: 1.19.2
+
         Parameters specific to individual backends:
 
         :param mssql_batch_separator: The "batch separator" which will
@@ -16,6 +16,7 @@ from typing import cast
 from typing import Optional
 from typing import TYPE_CHECKING
 
+from sqlalchemy import bindparam
 from sqlalchemy import literal_column
 from sqlalchemy import select
 from sqlalchemy.engine import Engine
@@ -34,7 +35,10 @@ if TYPE_CHECKING:
     from sqlalchemy.engine.base import Connection
     from sqlalchemy.engine.base import Transaction
     from sqlalchemy.engine.mock import MockConnection
+    from sqlalchemy.sql import Delete
     from sqlalchemy.sql import Executable
+    from sqlalchemy.sql import Insert
+    from sqlalchemy.sql import Update
 
     from .environment import EnvironmentContext
     from ..config import Config
@@ -142,6 +146,7 @@ class MigrationContext:
         )
         self.on_version_apply_callbacks = opts.get("on_version_apply", ())
         self._transaction: Transaction | None = None
+        self._head_maintainer: HeadMaintainer | None = None
 
         if as_sql:
             self.connection = cast(
@@ -315,6 +320,11 @@ class MigrationContext:
 
 
         """
+        # coalesced ALTER TABLE clauses and deferred version table writes
+        # belong to the preceding transaction
+        self.impl.flush_alter_table()
+        if self._head_maintainer is not None:
+            self._head_maintainer.flush()
         _in_connection_transaction = self._in_connection_transaction()
 
         if self.impl.transactional_ddl and self.as_sql:
@@ -347,6 +357,7 @@ class MigrationContext:
             fake_trans = None
         try:
             yield
+            self.impl.flush_alter_table()
         finally:
             if not self.as_sql:
                 assert self.connection is not None
@@ -603,36 +614,58 @@ class MigrationContext:
             if not self.as_sql and not heads and not dont_mutate:
                 self._ensure_version_table()
 
-        head_maintainer = HeadMaintainer(self, heads)
+        # when each migration is committed in its own transaction, deferred
+        # version table writes are flushed along with each migration; the
+        # DDL of backends without transactional DDL is committed as it's
+        # emitted, regardless of any enclosing transaction
+        flush_per_migration = not self.impl.transactional_ddl or (
+            not self._in_external_transaction
+            and self._transaction_per_migration
+        )
 
-        assert self._migrations_fn is not None
-        for step in self._migrations_fn(heads, self):
-            with self.begin_transaction(_per_migration=True):
-                if self.as_sql and not head_maintainer.heads:
-                    # for offline mode, include a CREATE TABLE from
-                    # the base
-                    assert self.connection is not None
-                    self._version.create(self.connection)
-                log.info("Running %s", step)
-                if self.as_sql:
-                    self.impl.static_output(
-                        "-- Running %s" % (step.short_log,)
-                    )
-                step.migration_fn(**kw)
-
-                # previously, we wouldn't stamp per migration
-                # if we were in a transaction, however given the more
-                # complex model that involves any number of inserts
-                # and row-targeted updates and deletes, it's simpler for now
-                # just to run the operations on every version
-                head_maintainer.update_to_step(step)
-                for callback in self.on_version_apply_callbacks:
-                    callback(
-                        ctx=self,
-                        step=step.info,
-                        heads=set(head_maintainer.heads),
-                        run_args=kw,
-                    )
+        # deferred version table writes are also flushed by
+        # autocommit_block(), which commits the transaction in progress
+        self._head_maintainer = head_maintainer = HeadMaintainer(
+            self, heads, defer_writes=self.opts.get("defer_version_updates")
+        )
+        try:
+            assert self._migrations_fn is not None
+            for step in self._migrations_fn(heads, self):
+                with self.begin_transaction(_per_migration=True):
+                    if self.as_sql and not head_maintainer.heads:
+                        # for offline mode, include a CREATE TABLE from
+                        # the base
+                        assert self.connection is not None
+                        self._version.create(self.connection)
+                    log.info("Running %s", step)
+                    if self.as_sql:
+                        self.impl.static_output(
+                            "-- Running %s" % (step.short_log,)
+                        )
+                    step.migration_fn(**kw)
+                    self.impl.flush_alter_table()
+
+                    # previously, we wouldn't stamp per migration
+                    # if we were in a transaction, however given the more
+                    # complex model that involves any number of inserts
+                    # and row-targeted updates and deletes, it's simpler for
+                    # now just to run the operations on every version
+                    head_maintainer.update_to_step(step)
+                    if flush_per_migration:
+                        head_maintainer.flush()
+                    for callback in self.on_version_apply_callbacks:
+                        callback(
+                            ctx=self,
+                            step=step.info,
+                            heads=set(head_maintainer.heads),
+                            run_args=kw,
+                        )
+
+            # with defer_version_updates, write the net change in heads
+            # within the enclosing transaction
+            head_maintainer.flush()
+        finally:
+            self._head_maintainer = None
 
         # NOTE: offline ("--sql") mode intentionally does not emit a DROP
         # of the version table when ending at base.  Online mode never drops
@@ -704,33 +737,119 @@ class MigrationContext:
 
 
 class HeadMaintainer:
-    def __init__(self, context: MigrationContext, heads: Any) -> None:
+    def __init__(
+        self,
+        context: MigrationContext,
+        heads: Any,
+        defer_writes: bool | None = False,
+    ) -> None:
         self.context = context
         self.heads = set(heads)
+        self.defer_writes = bool(defer_writes)
+
+        # the heads as currently present in the version table, when
+        # writes are deferred
+        self._written_heads = set(heads)
 
     def _insert_version(self, version: str) -> None:
         assert version not in self.heads
         self.heads.add(version)
 
-        self.context.impl._exec(
-            self.context._version.insert().values(
-                version_num=literal_column("'%s'" % version)
-            )
-        )
+        if not self.defer_writes:
+            self._write_insert(version)
 
     def _delete_version(self, version: str) -> None:
         self.heads.remove(version)
 
-        ret = self.context.impl._exec(
-            self.context._version.delete().where(
-                self.context._version.c.version_num
-                == literal_column("'%s'" % version)
+        if not self.defer_writes:
+            self._write_delete(version)
+
+    def _update_version(self, from_: str, to_: str) -> None:
+        assert to_ not in self.heads
+        self.heads.remove(from_)
+        self.heads.add(to_)
+
+        if not self.defer_writes:
+            self._write_update(from_, to_)
+
+    def flush(self) -> None:
+        """Write the net change in heads since the last flush to the
+        version table, when writes are deferred.
+
+        Heads which were replaced by other heads are written as UPDATE
+        statements; any remaining heads are deleted or inserted.
+
+        """
+        if not self.defer_writes:
+            return
+
+        removed = sorted(self._written_heads.difference(self.heads))
+        added = sorted(self.heads.difference(self._written_heads))
+
+        for from_, to_ in zip(removed, added):
+            self._write_update(from_, to_)
+        for version in removed[len(added) :]:
+            self._write_delete(version)
+        for version in added[len(removed) :]:
+            self._write_insert(version)
+
+        self._written_heads = set(self.heads)
+
+    # online, statements against the version table are built once using
+    # bound parameters, so that they're compiled once and then retrieved
+    # from the SQLAlchemy compiled cache for each head change; offline,
+    # the revision identifiers are rendered inline
+
+    @util.memoized_property
+    def _insert_statement(self) -> Insert:
+        return self.context._version.insert().values(
+            version_num=bindparam("to_version")
+        )
+
+    @util.memoized_property
+    def _delete_statement(self) -> Delete:
+        version = self.context._version
+        return version.delete().where(
+            version.c.version_num == bindparam("from_version")
+        )
+
+    @util.memoized_property
+    def _update_statement(self) -> Update:
+        version = self.context._version
+        return (
+            version.update()
+            .values(version_num=bindparam("to_version"))
+            .where(version.c.version_num == bindparam("from_version"))
+        )
+
+    def _write_insert(self, version: str) -> None:
+        if self.context.as_sql:
+            self.context.impl._exec(
+                self.context._version.insert().values(
+                    version_num=literal_column("'%s'" % version)
+                )
+            )
+        else:
+            self.context.impl._exec(
+                self._insert_statement, params={"to_version": version}
             )
+
+    def _write_delete(self, version: str) -> None:
+        if self.context.as_sql:
+            self.context.impl._exec(
+                self.context._version.delete().where(
+                    self.context._version.c.version_num
+                    == literal_column("'%s'" % version)
+                )
+            )
+            return
+
+        ret = self.context.impl._exec(
+            self._delete_statement, params={"from_version": version}
         )
 
         if (
-            not self.context.as_sql
-            and self.context.dialect.supports_sane_rowcount
+            self.context.dialect.supports_sane_rowcount
             and ret is not None
             and ret.rowcount != 1
         ):
@@ -741,23 +860,25 @@ class HeadMaintainer:
                 % (version, self.context.version_table, ret.rowcount)
             )
 
-    def _update_version(self, from_: str, to_: str) -> None:
-        assert to_ not in self.heads
-        self.heads.remove(from_)
-        self.heads.add(to_)
+    def _write_update(self, from_: str, to_: str) -> None:
+        if self.context.as_sql:
+            self.context.impl._exec(
+                self.context._version.update()
+                .values(version_num=literal_column("'%s'" % to_))
+                .where(
+                    self.context._version.c.version_num
+                    == literal_column("'%s'" % from_)
+                )
+            )
+            return
 
         ret = self.context.impl._exec(
-            self.context._version.update()
-            .values(version_num=literal_column("'%s'" % to_))
-            .where(
-                self.context._version.c.version_num
-                == literal_column("'%s'" % from_)
-            )
+            self._update_statement,
+            params={"from_version": from_, "to_version": to_},
         )
 
         if (
-            not self.context.as_sql
-            and self.context.dialect.supports_sane_rowcount
+            self.context.dialect.supports_sane_rowcount
             and ret is not None
             and ret.rowcount != 1
         ):
@@ -0,0 +1,334 @@
+"""Lightweight access to the header values of revision files.
+
+The "header" of a revision file consists of the ``revision``,
+``down_revision``, ``branch_labels`` and ``depends_on`` identifiers
+along with the module docstring; this is everything that's needed in
+order to build a :class:`.RevisionMap` without running the migration
+code itself.
+
+"""
+
+from __future__ import annotations
+
+import ast
+import json
+import os
+from pathlib import Path
+import tempfile
+import threading
+from types import ModuleType
+from typing import Any
+from typing import cast
+from typing import NamedTuple
+
+from .. import util
+
+
+class RevisionHeader(NamedTuple):
+    """The identifiers and docstring extracted from a single revision
+    file."""
+
+    revision: str
+    down_revision: str | tuple[str, ...] | None
+    branch_labels: tuple[str, ...]
+    depends_on: str | tuple[str, ...] | None
+    doc: str
+
+    @classmethod
+    def from_module(cls, module: ModuleType, revision: str) -> RevisionHeader:
+        return cls(
+            revision,
+            _as_rev_ids(module.down_revision),
+            util.to_tuple(getattr(module, "branch_labels", None), default=()),
+            _as_rev_ids(getattr(module, "depends_on", None)),
+            _module_doc(module),
+        )
+
+
+def _as_rev_ids(value: Any) -> Any:
+    # lists, including those coming back from JSON, are normalized to
+    # tuples
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+
+def _module_doc(module: ModuleType) -> str:
+    doc = module.__doc__
+    if doc:
+        if hasattr(module, "_alembic_source_encoding"):
+            doc = doc.decode(  # type: ignore[attr-defined]
+                module._alembic_source_encoding
+            )
+        return doc.strip()
+    else:
+        return ""
+
+
+_header_names = frozenset(
+    ["revision", "down_revision", "branch_labels", "depends_on"]
+)
+
+_scope_nodes = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+# ast.parse() is not safe to call from multiple threads at once on some
+# Python versions (see python/cpython#106905); files are still read
+# concurrently when revision_load_workers is used
+_parse_mutex = threading.Lock()
+
+
+def parse_header(path: str | os.PathLike[str]) -> RevisionHeader | None:
+    """Extract a :class:`.RevisionHeader` from a Python source file
+    without importing it.
+
+    Only plain module-level assignments of literal values, e.g.
+    ``down_revision = "abc"`` or ``depends_on: str | None = None``, are
+    recognized.  If any of the header names is bound in some other way,
+    or if ``revision`` or ``down_revision`` are not present, None is
+    returned and the module should be imported instead.
+
+    """
+    try:
+        with open(path, "rb") as file_:
+            source = file_.read()
+        with _parse_mutex:
+            tree = ast.parse(source, filename=str(path))
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    values: dict[str, Any] = {}
+    for stmt in tree.body:
+        if isinstance(stmt, ast.Assign):
+            targets = stmt.targets
+            value_node: ast.expr | None = stmt.value
+        elif isinstance(stmt, ast.AnnAssign):
+            targets = [stmt.target]
+            value_node = stmt.value
+        else:
+            if _binds_header_name(stmt):
+                return None
+            continue
+
+        names = [
+            target.id for target in targets if isinstance(target, ast.Name)
+        ]
+        if len(names) != len(targets):
+            # tuple unpacking, attribute / subscript assignment
+            if _binds_header_name(stmt):
+                return None
+            continue
+        header_names = _header_names.intersection(names)
+        if not header_names:
+            continue
+        if value_node is None:
+            # annotation only, e.g. "revision: str"
+            continue
+        try:
+            value = ast.literal_eval(value_node)
+        except (ValueError, TypeError):
+            return None
+        for name in header_names:
+            values[name] = value
+
+    if "revision" not in values or "down_revision" not in values:
+        return None
+
+    header = RevisionHeader(
+        values["revision"],
+        _as_rev_ids(values["down_revision"]),
+        util.to_tuple(_as_rev_ids(values.get("branch_labels")), default=()),
+        _as_rev_ids(values.get("depends_on")),
+        (ast.get_docstring(tree, clean=False) or "").strip(),
+    )
+    if not _is_literal_header(header):
+        return None
+    return header
+
+
+def _binds_header_name(stmt: ast.stmt) -> bool:
+    """Return True if the given module-level statement may bind one of
+    the header names in the module namespace."""
+
+    if isinstance(stmt, _scope_nodes):
+        # names assigned within a function or class body are local to it;
+        # only a "global" statement can affect the module namespace
+        return stmt.name in _header_names or any(
+            isinstance(node, ast.Global)
+            and bool(_header_names.intersection(node.names))
+            for node in ast.walk(stmt)
+        )
+
+    for node in ast.walk(stmt):
+        if isinstance(node, ast.Name):
+            name = node.id if not isinstance(node.ctx, ast.Load) else None
+        elif isinstance(node, ast.alias):
+            name = (node.asname or node.name).split(".")[0]
+        elif isinstance(node, ast.ExceptHandler):
+            name = node.name
+        elif isinstance(node, ast.Global):
+            if _header_names.intersection(node.names):
+                return True
+            continue
+        else:
+            continue
+        if name in _header_names:
+            return True
+    return False
+
+
+def _is_rev_ids(value: Any, allow_str: bool = True) -> bool:
+    if value is None or (allow_str and isinstance(value, str)):
+        return True
+    return isinstance(value, tuple) and all(
+        isinstance(elem, str) for elem in value
+    )
+
+
+def _is_literal_header(header: RevisionHeader) -> bool:
+    return (
+        isinstance(header.revision, str)
+        and _is_rev_ids(header.down_revision)
+        and _is_rev_ids(header.branch_labels, allow_str=False)
+        and _is_rev_ids(header.depends_on)
+    )
+
+
+class RevisionHeaderCache:
+    """A file-backed cache of :class:`.RevisionHeader` objects.
+
+    Entries are keyed on the absolute path of each revision file and
+    are considered to be valid only as long as the modification time
+    and size of that file are unchanged.  The cache is written back to
+    disk by :meth:`.RevisionHeaderCache.save`, which also discards
+    entries for files that were not seen since the cache was loaded.
+
+    :meth:`.RevisionHeaderCache.get` and :meth:`.RevisionHeaderCache.put`
+    may be called from multiple threads.
+
+    """
+
+    format_version = 1
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        self._entries = self._read()
+        self._seen: set[str] = set()
+        self._dirty = False
+        self._mutex = threading.Lock()
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        try:
+            with open(self.path, encoding="utf-8") as file_:
+                data = json.load(file_)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as err:
+            util.warn(
+                f"Could not read revision cache file {self.path}: {err}; "
+                "the cache will be rebuilt"
+            )
+            return {}
+
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != self.format_version
+            or not isinstance(data.get("entries"), dict)
+        ):
+            return {}
+        return cast("dict[str, dict[str, Any]]", data["entries"])
+
+    def get(self, file_path: str | os.PathLike[str]) -> RevisionHeader | None:
+        """Return the cached header for the given file, or None if the
+        file isn't cached or has changed since it was cached."""
+
+        key = str(file_path)
+        with self._mutex:
+            self._seen.add(key)
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        if (
+            entry.get("mtime_ns") != stat.st_mtime_ns
+            or entry.get("size") != stat.st_size
+        ):
+            return None
+        try:
+            return RevisionHeader(
+                entry["revision"],
+                _as_rev_ids(entry["down_revision"]),
+                tuple(entry["branch_labels"]),
+                _as_rev_ids(entry["depends_on"]),
+                entry["doc"],
+            )
+        except (KeyError, TypeError):
+            return None
+
+    def put(
+        self, file_path: str | os.PathLike[str], header: RevisionHeader
+    ) -> None:
+        """Store the header for the given file."""
+
+        key = str(file_path)
+        if not _is_literal_header(header):
+            # non-literal header values aren't cached; the file will
+            # be loaded each time
+            with self._mutex:
+                self._seen.add(key)
+                self._entries.pop(key, None)
+            return
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            with self._mutex:
+                self._seen.add(key)
+            return
+        with self._mutex:
+            self._seen.add(key)
+            self._entries[key] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "revision": header.revision,
+                "down_revision": header.down_revision,
+                "branch_labels": header.branch_labels,
+                "depends_on": header.depends_on,
+                "doc": header.doc,
+            }
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache back to disk if it has changed."""
+
+        stale = set(self._entries).difference(self._seen)
+        for key in stale:
+            del self._entries[key]
+        if not self._dirty and not stale:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self.path.parent,
+                prefix=self.path.name,
+                suffix=".tmp",
+                delete=False,
+            ) as file_:
+                json.dump(
+                    {
+                        "version": self.format_version,
+                        "entries": self._entries,
+                    },
+                    file_,
+                )
+            os.replace(file_.name, self.path)
+        except OSError as err:
+            util.warn(
+                f"Could not write revision cache file {self.path}: {err}"
+            )
+        else:
+            self._dirty = False
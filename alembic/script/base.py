@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
 from collections.abc import Iterator
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 import datetime
 import os
@@ -15,6 +17,7 @@ from typing import cast
 from typing import Optional
 from typing import TYPE_CHECKING
 
+from . import _headers
 from . import revision
 from . import write_hooks
 from .. import util
@@ -80,6 +83,8 @@ class ScriptDirectory:
         messaging_opts: MessagingOptions = cast(
             "MessagingOptions", util.EMPTY_DICT
         ),
+        revision_cache_file: str | os.PathLike[str] | None = None,
+        revision_load_workers: int = 1,
     ) -> None:
         self.dir = _preserving_path_as_str(dir)
         self.version_locations = [
@@ -94,6 +99,12 @@ class ScriptDirectory:
         self.hooks = hooks
         self.recursive_version_locations = recursive_version_locations
         self.messaging_opts = messaging_opts
+        self.revision_cache_file = (
+            _preserving_path_as_str(revision_cache_file)
+            if revision_cache_file is not None
+            else None
+        )
+        self.revision_load_workers = revision_load_workers
 
         if not os.access(dir, os.F_OK):
             raise util.CommandError(
@@ -131,9 +142,16 @@ class ScriptDirectory:
         else:
             return [Path(self.dir, "versions").absolute()]
 
+    @util.memoized_property
+    def _revision_header_cache(self) -> _headers.RevisionHeaderCache | None:
+        if self.revision_cache_file is None:
+            return None
+        return _headers.RevisionHeaderCache(self.revision_cache_file)
+
     def _load_revisions(self) -> Iterator[Script]:
         paths = [vers for vers in self._version_locations if vers.exists()]
 
+        file_paths: list[Path] = []
         dupes = set()
         for vers in paths:
             for file_path in Script._list_py_dir(self, vers):
@@ -145,11 +163,37 @@ class ScriptDirectory:
                     )
                     continue
                 dupes.add(real_path)
+                file_paths.append(real_path)
+
+        # retrieve the cache up front, so that the read() workers below
+        # all share the same instance
+        cache = self._revision_header_cache
+
+        def read(
+            file_path: Path,
+        ) -> tuple[bool, _headers.RevisionHeader | None]:
+            if not Script._is_revision_file(self, file_path):
+                return False, None
+            return True, Script._read_header(file_path, cache)
+
+        headers: Iterable[tuple[bool, _headers.RevisionHeader | None]]
+        if self.revision_load_workers > 1 and len(file_paths) > 1:
+            # stat and read files concurrently; the map() preserves
+            # the order of file_paths.  Modules that need to be imported
+            # are still imported serially below.
+            with ThreadPoolExecutor(
+                max_workers=self.revision_load_workers
+            ) as executor:
+                headers = list(executor.map(read, file_paths))
+        else:
+            headers = map(read, file_paths)
 
-                script = Script._from_path(self, real_path)
-                if script is None:
-                    continue
-                yield script
+        for file_path, (is_revision_file, header) in zip(file_paths, headers):
+            if is_revision_file:
+                yield Script._from_header(self, file_path, header)
+
+        if cache is not None:
+            cache.save()
 
     @classmethod
     def from_config(cls, config: Config) -> ScriptDirectory:
@@ -176,6 +220,21 @@ class ScriptDirectory:
         if prepend_sys_path:
             sys.path[:0] = prepend_sys_path
 
+        revision_load_workers: int
+        rlw = config.get_alembic_option("revision_load_workers")
+        if rlw is not None:
+            try:
+                revision_load_workers = int(rlw)
+            except ValueError:
+                revision_load_workers = 0
+            if revision_load_workers < 1:
+                raise util.CommandError(
+                    "revision_load_workers must be an integer of 1 or "
+                    "greater; got %r" % rlw
+                )
+        else:
+            revision_load_workers = 1
+
         rvl = config.get_alembic_boolean_option("recursive_version_locations")
         return ScriptDirectory(
             util.coerce_resource_to_filename(script_location),
@@ -192,6 +251,10 @@ class ScriptDirectory:
             hooks=config.get_hooks_list(),
             recursive_version_locations=rvl,
             messaging_opts=config.messaging_opts,
+            revision_cache_file=config.get_alembic_option(
+                "revision_cache_file"
+            ),
+            revision_load_workers=revision_load_workers,
         )
 
     @contextmanager
@@ -495,15 +558,19 @@ class ScriptDirectory:
 
                 # figure out if the dest is a descendant or an
                 # ancestor of the selected nodes
-                descendants = set(
-                    self.revision_map._get_descendant_nodes([dest])
+                heads_are_descendants = any(
+                    self.revision_map._is_ancestor_of(dest, head)
+                    for head in filtered_heads
+                )
+                heads_are_ancestors = any(
+                    self.revision_map._is_ancestor_of(head, dest)
+                    for head in filtered_heads
                 )
-                ancestors = set(self.revision_map._get_ancestor_nodes([dest]))
 
-                if descendants.intersection(filtered_heads):
+                if heads_are_descendants:
                     # heads are above the target, so this is a downgrade.
                     # we can treat them as a "merge", single step.
-                    assert not ancestors.intersection(filtered_heads)
+                    assert not heads_are_ancestors
                     todo_heads = [head.revision for head in filtered_heads]
                     step = migration.StampStep(
                         todo_heads,
@@ -514,7 +581,7 @@ class ScriptDirectory:
                     )
                     steps.append(step)
                     continue
-                elif ancestors.intersection(filtered_heads):
+                elif heads_are_ancestors:
                     # heads are below the target, so this is an upgrade.
                     # we can treat them as a "merge", single step.
                     todo_heads = [head.revision for head in filtered_heads]
@@ -801,27 +868,44 @@ class Script(revision.Revision):
 
     """
 
+    __slots__ = ("_module", "path", "_db_current_indicator", "_doc")
+
     def __init__(
         self,
-        module: ModuleType,
+        module: ModuleType | None,
         rev_id: str,
         path: str | os.PathLike[str],
+        header: _headers.RevisionHeader | None = None,
     ):
-        self.module = module
+        self._module = module
         self.path = _preserving_path_as_str(path)
+        self._db_current_indicator = None
+        if header is None:
+            assert module is not None
+            header = _headers.RevisionHeader.from_module(module, rev_id)
+        self._doc = header.doc
         super().__init__(
             rev_id,
-            module.down_revision,
-            branch_labels=util.to_tuple(
-                getattr(module, "branch_labels", None), default=()
-            ),
-            dependencies=util.to_tuple(
-                getattr(module, "depends_on", None), default=()
-            ),
+            header.down_revision,
+            branch_labels=header.branch_labels,
+            dependencies=util.to_tuple(header.depends_on, default=()),
         )
 
-    module: ModuleType
-    """The Python module representing the actual script itself."""
+    @property
+    def module(self) -> ModuleType:
+        """The Python module representing the actual script itself.
+
+        When the revision identifiers of the script could be read from
+        its source or from the ``revision_cache_file``, the module is not
+        imported until this attribute is first accessed.
+
+        """
+        if self._module is None:
+            script_path = self._script_path
+            self._module = util.load_python_file(
+                script_path.parent, script_path.name
+            )
+        return self._module
 
     path: str
     """Filesystem path of the script."""
@@ -830,7 +914,7 @@ class Script(revision.Revision):
     def _script_path(self) -> Path:
         return Path(self.path)
 
-    _db_current_indicator: bool | None = None
+    _db_current_indicator: bool | None
     """Utility variable which when set will cause string output to indicate
     this is a "current" version in some database"""
 
@@ -844,15 +928,9 @@ class Script(revision.Revision):
     def longdoc(self) -> str:
         """Return the docstring given in the script."""
 
-        doc = self.module.__doc__
-        if doc:
-            if hasattr(self.module, "_alembic_source_encoding"):
-                doc = doc.decode(  # type: ignore[attr-defined]
-                    self.module._alembic_source_encoding
-                )
-            return doc.strip()
-        else:
-            return ""
+        if self._module is None:
+            return self._doc
+        return _headers._module_doc(self._module)
 
     @property
     def log_entry(self) -> str:
@@ -1006,8 +1084,17 @@ class Script(revision.Revision):
     def _from_path(
         cls, scriptdir: ScriptDirectory, path: str | os.PathLike[str]
     ) -> Script | None:
-
         path = Path(path)
+        if not cls._is_revision_file(scriptdir, path):
+            return None
+        return cls._from_header(
+            scriptdir,
+            path,
+            cls._read_header(path, scriptdir._revision_header_cache),
+        )
+
+    @classmethod
+    def _is_revision_file(cls, scriptdir: ScriptDirectory, path: Path) -> bool:
         dir_, filename = path.parent, path.name
 
         if scriptdir.sourceless:
@@ -1016,7 +1103,7 @@ class Script(revision.Revision):
             py_match = _only_source_rev_file.match(filename)
 
         if not py_match:
-            return None
+            return False
 
         py_filename = py_match.group(1)
 
@@ -1034,8 +1121,40 @@ class Script(revision.Revision):
             # source encoding; prefer .pyc over .pyo because we'd like to
             # have the docstrings which a -OO file would not have
             if py_exists or is_o and pyc_exists:
-                return None
+                return False
+
+        return True
+
+    @classmethod
+    def _read_header(
+        cls, path: Path, cache: _headers.RevisionHeaderCache | None
+    ) -> _headers.RevisionHeader | None:
+        """Return the header of a revision file from the given revision
+        cache or from its source, without importing it.
+
+        Returns None if the file needs to be imported.
 
+        """
+        header = cache.get(path) if cache is not None else None
+        if header is None and path.suffix == ".py":
+            # read identifiers from the source without importing it,
+            # if they are all literal values
+            header = _headers.parse_header(path)
+            if header is not None and cache is not None:
+                cache.put(path, header)
+        return header
+
+    @classmethod
+    def _from_header(
+        cls,
+        scriptdir: ScriptDirectory,
+        path: Path,
+        header: _headers.RevisionHeader | None,
+    ) -> Script:
+        if header is not None:
+            return Script(None, header.revision, path, header=header)
+
+        dir_, filename = path.parent, path.name
         module = util.load_python_file(dir_, filename)
 
         if not hasattr(module, "revision"):
@@ -1054,4 +1173,8 @@ class Script(revision.Revision):
                 revision = m.group(1)
         else:
             revision = module.revision
-        return Script(module, revision, dir_ / filename)
+        header = _headers.RevisionHeader.from_module(module, revision)
+        cache = scriptdir._revision_header_cache
+        if cache is not None:
+            cache.put(path, header)
+        return Script(module, revision, path, header=header)
@@ -6,6 +6,7 @@ from collections.abc import Iterable
 from collections.abc import Iterator
 from collections.abc import Sequence
 import re
+import sys
 from typing import Any
 from typing import Callable
 from typing import cast
@@ -118,6 +119,70 @@ class DependencyLoopDetected(DependencyCycleDetected, LoopDetected):
         super().__init__(revision)
 
 
+class _AncestorIndex:
+    """Ancestry of the revisions in a revision map, computed on demand.
+
+    Each revision is assigned an integer ordinal when it's first
+    encountered.  The first time a revision is tested as a descendant, the
+    ordinals of the revision itself and of all of its ancestors along the
+    given edges are collected into a bitset, stored as a Python integer;
+    later tests against the same revision are then a single bit lookup.
+    Bitsets are only kept for the revisions which were tested, and the walk
+    which collects them stops at any ancestor whose bitset is already known.
+
+    """
+
+    __slots__ = ("map_", "fn", "ordinals", "ancestors")
+
+    def __init__(
+        self,
+        map_: _RevisionMapType,
+        fn: Callable[[Revision], Iterable[str]],
+    ) -> None:
+        self.map_ = map_
+        self.fn = fn
+        self.ordinals: dict[str, int] = {}
+        self.ancestors: dict[str, int] = {}
+
+    def _ancestor_bits(self, descendant: str) -> int:
+        bits = self.ancestors.get(descendant)
+        if bits is not None:
+            return bits
+
+        ordinals = self.ordinals
+        bits = 0
+        seen = {descendant}
+        todo = [descendant]
+        while todo:
+            revision = todo.pop()
+            known = self.ancestors.get(revision)
+            if known is not None:
+                bits |= known
+                continue
+
+            ordinal = ordinals.get(revision)
+            if ordinal is None:
+                ordinal = ordinals[revision] = len(ordinals)
+            bits |= 1 << ordinal
+
+            rev = self.map_[revision]
+            assert rev is not None
+            if rev.revision != revision:
+                raise RevisionError("Dependency resolution failed; broken map")
+            for down_rev in self.fn(rev):
+                if down_rev not in seen:
+                    seen.add(down_rev)
+                    todo.append(down_rev)
+
+        self.ancestors[descendant] = bits
+        return bits
+
+    def is_ancestor_of(self, ancestor: str, descendant: str) -> bool:
+        bits = self._ancestor_bits(descendant)
+        ordinal = self.ordinals.get(ancestor)
+        return ordinal is not None and bool(bits >> ordinal & 1)
+
+
 class RevisionMap:
     """Maintains a map of :class:`.Revision` objects.
 
@@ -426,6 +491,8 @@ class RevisionMap:
 
         """
         map_ = self._revision_map
+        self.__dict__.pop("_ancestor_index", None)
+        self.__dict__.pop("_versioned_ancestor_index", None)
         if not _replace and revision.revision in map_:
             util.warn(
                 "Revision %s is present more than once" % revision.revision
@@ -669,10 +736,14 @@ class RevisionMap:
         targets = set(targets)
 
         for rev in list(targets):
-            assert rev
-            if targets.intersection(
-                self._get_descendant_nodes([rev], include_dependencies=False)
-            ).difference([rev]):
+            rev = is_revision(rev)
+            if any(
+                other is not rev
+                and self._is_ancestor_of(
+                    rev, is_revision(other), include_dependencies=False
+                )
+                for other in targets
+            ):
                 targets.discard(rev)
         return targets
 
@@ -722,22 +793,54 @@ class RevisionMap:
             )
         ]
 
-        return bool(
-            set(
-                self._get_descendant_nodes(
-                    [resolved_target],
-                    include_dependencies=include_dependencies,
+        return any(
+            test_against_rev is not None
+            and (
+                self._is_ancestor_of(
+                    test_against_rev, resolved_target, include_dependencies
                 )
-            )
-            .union(
-                self._get_ancestor_nodes(
-                    [resolved_target],
-                    include_dependencies=include_dependencies,
+                or self._is_ancestor_of(
+                    resolved_target, test_against_rev, include_dependencies
                 )
             )
-            .intersection(resolved_test_against_revs)
+            for test_against_rev in resolved_test_against_revs
         )
 
+    @util.memoized_property
+    def _ancestor_index(self) -> _AncestorIndex:
+        """Reachability index following down revisions as well as
+        dependencies."""
+        return _AncestorIndex(
+            self._revision_map, lambda rev: rev._all_down_revisions
+        )
+
+    @util.memoized_property
+    def _versioned_ancestor_index(self) -> _AncestorIndex:
+        """Reachability index following down revisions only."""
+        return _AncestorIndex(
+            self._revision_map, lambda rev: rev._versioned_down_revisions
+        )
+
+    def _is_ancestor_of(
+        self,
+        ancestor: Revision,
+        descendant: Revision,
+        include_dependencies: bool = True,
+    ) -> bool:
+        """Return True if ``ancestor`` is ``descendant`` or is among the
+        revisions returned by :meth:`._get_ancestor_nodes` for it.
+
+        Uses a reachability index that's filled in as revisions are tested,
+        so that repeated lineage checks don't need to walk the graph each
+        time.
+
+        """
+        if include_dependencies:
+            index = self._ancestor_index
+        else:
+            index = self._versioned_ancestor_index
+        return index.is_ancestor_of(ancestor.revision, descendant.revision)
+
     def _resolve_revision_number(
         self, id_: _GetRevArg | None
     ) -> tuple[tuple[str, ...], str | None]:
@@ -930,24 +1033,54 @@ class RevisionMap:
 
         id_to_rev = self._revision_map
 
-        def get_ancestors(rev_id: str) -> set[str]:
-            return {
-                r.revision
-                for r in self._get_ancestor_nodes([id_to_rev[rev_id]])
-            }
-
         todo = {d.revision for d in revisions}
 
         # Use revision map (ordered dict) key order to pre-sort.
-        inserted_order = list(self._revision_map)
+        inserted_order = {rev_id: idx for idx, rev_id in enumerate(id_to_rev)}
 
         current_heads = list(
             sorted(
                 {d.revision for d in heads if d.revision in todo},
-                key=inserted_order.index,
+                key=inserted_order.__getitem__,
             )
         )
-        ancestors_by_idx = [get_ancestors(rev_id) for rev_id in current_heads]
+
+        # map each revision that's an ancestor of one of the heads to
+        # its immediate descendants, so that we can search upwards from
+        # a candidate for the heads that still depend on it.
+        children: dict[str, list[str]] = collections.defaultdict(list)
+        for rev in self._get_ancestor_nodes(
+            [id_to_rev[rev_id] for rev_id in current_heads]
+        ):
+            for down_rev in rev._normalized_down_revisions:
+                children[down_rev].append(rev.revision)
+
+        emitted: set[str] = set()
+
+        def dependent_heads(candidate: str) -> set[str]:
+            """Return the current heads that have the candidate as an
+            ancestor.
+
+            A revision is only emitted once no current head depends on it,
+            and every revision in todo that's not yet emitted is an
+            ancestor of some current head; so revisions that were already
+            emitted don't have any remaining heads above them and don't need
+            to be searched.
+
+            """
+            heads_set = set(current_heads)
+            found = set()
+            seen = set()
+            stack = list(children.get(candidate, ()))
+            while stack:
+                rev_id = stack.pop()
+                if rev_id in seen or rev_id in emitted:
+                    continue
+                seen.add(rev_id)
+                if rev_id in heads_set:
+                    found.add(rev_id)
+                stack.extend(children.get(rev_id, ()))
+            return found
 
         output = []
 
@@ -955,67 +1088,41 @@ class RevisionMap:
         while current_heads:
             candidate = current_heads[current_candidate_idx]
 
-            for check_head_index, ancestors in enumerate(ancestors_by_idx):
-                # scan all the heads.  see if we can continue walking
-                # down the current branch indicated by current_candidate_idx.
-                if (
-                    check_head_index != current_candidate_idx
-                    and candidate in ancestors
-                ):
-                    current_candidate_idx = check_head_index
-                    # nope, another head is dependent on us, they have
-                    # to be traversed first
-                    break
-            else:
-                # yup, we can emit
-                if candidate in todo:
-                    output.append(candidate)
-                    todo.remove(candidate)
+            blocking = dependent_heads(candidate)
+            if blocking:
+                # nope, another head is dependent on us, they have
+                # to be traversed first
+                current_candidate_idx = min(
+                    idx
+                    for idx, head in enumerate(current_heads)
+                    if head in blocking
+                )
+                continue
 
-                # now update the heads with our ancestors.
+            # yup, we can emit
+            if candidate in todo:
+                output.append(candidate)
+                todo.remove(candidate)
+                emitted.add(candidate)
 
-                candidate_rev = id_to_rev[candidate]
-                assert candidate_rev is not None
+            # now update the heads with our ancestors.
 
-                heads_to_add = [
-                    r
-                    for r in candidate_rev._normalized_down_revisions
-                    if r in todo and r not in current_heads
-                ]
+            candidate_rev = id_to_rev[candidate]
+            assert candidate_rev is not None
 
-                if not heads_to_add:
-                    # no ancestors, so remove this head from the list
-                    del current_heads[current_candidate_idx]
-                    del ancestors_by_idx[current_candidate_idx]
-                    current_candidate_idx = max(current_candidate_idx - 1, 0)
-                else:
-                    if (
-                        not candidate_rev._normalized_resolved_dependencies
-                        and len(candidate_rev._versioned_down_revisions) == 1
-                    ):
-                        current_heads[current_candidate_idx] = heads_to_add[0]
-
-                        # for plain movement down a revision line without
-                        # any mergepoints, branchpoints, or deps, we
-                        # can update the ancestors collection directly
-                        # by popping out the candidate we just emitted
-                        ancestors_by_idx[current_candidate_idx].discard(
-                            candidate
-                        )
+            heads_to_add = [
+                r
+                for r in candidate_rev._normalized_down_revisions
+                if r in todo and r not in current_heads
+            ]
 
-                    else:
-                        # otherwise recalculate it again, things get
-                        # complicated otherwise.  This can possibly be
-                        # improved to not run the whole ancestor thing
-                        # each time but it was getting complicated
-                        current_heads[current_candidate_idx] = heads_to_add[0]
-                        current_heads.extend(heads_to_add[1:])
-                        ancestors_by_idx[current_candidate_idx] = (
-                            get_ancestors(heads_to_add[0])
-                        )
-                        ancestors_by_idx.extend(
-                            get_ancestors(head) for head in heads_to_add[1:]
-                        )
+            if not heads_to_add:
+                # no ancestors, so remove this head from the list
+                del current_heads[current_candidate_idx]
+                current_candidate_idx = max(current_candidate_idx - 1, 0)
+            else:
+                current_heads[current_candidate_idx] = heads_to_add[0]
+                current_heads.extend(heads_to_add[1:])
 
         assert not todo
         return output
@@ -1537,17 +1644,32 @@ class Revision:
     within :class:`.Revision`, while :class:`.Script` applies this logic
     to Python files in a version directory.
 
+    Instances use ``__slots__`` and intern their revision identifiers,
+    so that very large revision graphs remain compact in memory.
+
     """
 
-    nextrev: frozenset[str] = frozenset()
+    __slots__ = (
+        "revision",
+        "down_revision",
+        "dependencies",
+        "branch_labels",
+        "nextrev",
+        "_all_nextrev",
+        "_orig_branch_labels",
+        "_resolved_dependencies",
+        "_normalized_resolved_dependencies",
+    )
+
+    nextrev: frozenset[str]
     """following revisions, based on down_revision only."""
 
-    _all_nextrev: frozenset[str] = frozenset()
+    _all_nextrev: frozenset[str]
 
-    revision: str = None  # type: ignore[assignment]
+    revision: str
     """The string revision number."""
 
-    down_revision: _RevIdType | None = None
+    down_revision: _RevIdType | None
     """The ``down_revision`` identifier(s) within the migration script.
 
     Note that the total set of "down" revisions is
@@ -1555,7 +1677,7 @@ class Revision:
 
     """
 
-    dependencies: _RevIdType | None = None
+    dependencies: _RevIdType | None
     """Additional revisions which this revision is dependent on.
 
     From a migration standpoint, these dependencies are added to the
@@ -1565,10 +1687,11 @@ class Revision:
 
     """
 
-    branch_labels: set[str] = None  # type: ignore[assignment]
+    branch_labels: set[str]
     """Optional string/tuple of symbolic names to apply to this
     revision's branch"""
 
+    _orig_branch_labels: tuple[str, ...]
     _resolved_dependencies: tuple[str, ...]
     _normalized_resolved_dependencies: tuple[str, ...]
 
@@ -1588,20 +1711,25 @@ class Revision:
         dependencies: str | tuple[str, ...] | None = None,
         branch_labels: str | tuple[str, ...] | None = None,
     ) -> None:
-        if down_revision and revision in util.to_tuple(down_revision):
+        down_revisions = _intern_rev_ids(down_revision)
+        dependency_revisions = _intern_rev_ids(dependencies)
+        if revision in down_revisions:
             raise LoopDetected(revision)
-        elif dependencies is not None and revision in util.to_tuple(
-            dependencies
-        ):
+        elif revision in dependency_revisions:
             raise DependencyLoopDetected(revision)
 
         self.verify_rev_id(revision)
-        self.revision = revision
-        self.down_revision = tuple_rev_as_scalar(util.to_tuple(down_revision))
-        self.dependencies = tuple_rev_as_scalar(util.to_tuple(dependencies))
+        self.revision = sys.intern(revision)
+        self.down_revision = tuple_rev_as_scalar(down_revisions)
+        self.dependencies = tuple_rev_as_scalar(dependency_revisions)
         self._orig_branch_labels = util.to_tuple(branch_labels, default=())
         self.branch_labels = set(self._orig_branch_labels)
 
+        # a revision usually has the same following revisions whether or
+        # not dependencies are considered; add_nextrev() keeps a single
+        # frozenset for both in that case
+        self.nextrev = self._all_nextrev = _no_revisions
+
     def __repr__(self) -> str:
         args = [repr(self.revision), repr(self.down_revision)]
         if self.dependencies:
@@ -1611,9 +1739,14 @@ class Revision:
         return "%s(%s)" % (self.__class__.__name__, ", ".join(args))
 
     def add_nextrev(self, revision: Revision) -> None:
-        self._all_nextrev = self._all_nextrev.union([revision.revision])
         if self.revision in revision._versioned_down_revisions:
+            if self.nextrev is self._all_nextrev:
+                self.nextrev = self._all_nextrev = self.nextrev.union(
+                    [revision.revision]
+                )
+                return
             self.nextrev = self.nextrev.union([revision.revision])
+        self._all_nextrev = self._all_nextrev.union([revision.revision])
 
     @property
     def _all_down_revisions(self) -> tuple[str, ...]:
@@ -1695,6 +1828,16 @@ class Revision:
         return len(self._versioned_down_revisions) > 1
 
 
+_no_revisions: frozenset[str] = frozenset()
+
+
+def _intern_rev_ids(rev: _RevIdType | None) -> tuple[str, ...]:
+    return tuple(
+        sys.intern(elem) if isinstance(elem, str) else elem
+        for elem in util.to_tuple(rev, default=())
+    )
+
+
 @overload
 def tuple_rev_as_scalar(rev: None) -> None: ...
 
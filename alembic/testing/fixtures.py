@@ -196,10 +196,13 @@ def capture_context_buffer(
 
 @contextmanager
 def capture_engine_context_buffer(
-    **kw: Any,
+    *, render_bind_params: bool = False, **kw: Any
 ) -> Generator[io.StringIO]:
     from .env import _sqlite_file_db
     from sqlalchemy import event
+    from sqlalchemy import literal
+    from sqlalchemy.sql import visitors
+    from sqlalchemy.sql.elements import BindParameter
 
     buf = io.StringIO()
 
@@ -209,6 +212,30 @@ def capture_engine_context_buffer(
 
     @event.listens_for(conn, "before_cursor_execute")
     def bce(conn, cursor, statement, parameters, context, executemany):
+        if (
+            render_bind_params
+            and parameters
+            and not executemany
+            and context.compiled is not None
+        ):
+            # when requested, render bound parameters inline, as in
+            # offline mode
+            values = context.compiled_parameters[0]
+            statement = str(
+                visitors.replacement_traverse(
+                    context.compiled.statement,
+                    {},
+                    lambda elem: (
+                        literal(values[elem.key], elem.type)
+                        if isinstance(elem, BindParameter)
+                        and elem.key in values
+                        else None
+                    ),
+                ).compile(
+                    dialect=conn.dialect,
+                    compile_kwargs={"literal_binds": True},
+                )
+            )
         buf.write(statement + "\n")
 
     kw.update({"connection": conn})
@@ -228,10 +255,14 @@ def op_fixture(
     naming_convention=None,
     literal_binds=False,
     native_boolean=None,
+    coalesce_alter_table=False,
+    context_opts=None,
 ):
-    opts = {}
+    opts = dict(context_opts or {})
     if naming_convention:
         opts["target_metadata"] = MetaData(naming_convention=naming_convention)
+    if coalesce_alter_table:
+        opts["coalesce_alter_table"] = coalesce_alter_table
 
     class buffer_:
         def __init__(self):
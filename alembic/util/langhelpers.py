@@ -361,6 +361,9 @@ class PriorityDispatcher:
         self._registry: dict[tuple[Any, ...], Any] = collections.defaultdict(
             list
         )
+        self._plans: dict[
+            tuple[str, str], tuple[tuple[Callable[..., Any], str | None], ...]
+        ] = {}
 
     def dispatch_for(
         self,
@@ -383,37 +386,54 @@ class PriorityDispatcher:
             self._registry[(target, qualifier, priority)].append(
                 (fn, subgroup)
             )
+            self._plans.clear()
             return fn
 
         return decorate
 
-    def dispatch(
-        self, target: str, *, qualifier: str = "default"
-    ) -> Callable[..., None]:
-        """Provide a callable for the given target and qualifier."""
+    def _plan(
+        self, target: str, qualifier: str
+    ) -> tuple[tuple[Callable[..., Any], str | None], ...]:
+        """Return the functions to be invoked for the given target and
+        qualifier, in order, along with their subgroups.
+
+        The list is computed once and cached until a new function is
+        registered.
+
+        """
+        try:
+            return self._plans[(target, qualifier)]
+        except KeyError:
+            pass
 
         if qualifier != "default":
             qualifiers = [qualifier, "default"]
         else:
             qualifiers = ["default"]
 
+        plan = self._plans[(target, qualifier)] = tuple(
+            entry
+            for priority in DispatchPriority
+            for qualifier in qualifiers
+            for entry in self._registry.get((target, qualifier, priority), ())
+        )
+        return plan
+
+    def dispatch(
+        self, target: str, *, qualifier: str = "default"
+    ) -> Callable[..., None]:
+        """Provide a callable for the given target and qualifier."""
+
         def go(*arg: Any, **kw: Any) -> Any:
-            results_by_subgroup: dict[str, PriorityDispatchResult] = {}
-            for priority in DispatchPriority:
-                for qualifier in qualifiers:
-                    for fn, subgroup in self._registry.get(
-                        (target, qualifier, priority), ()
-                    ):
-                        if (
-                            results_by_subgroup.get(
-                                subgroup, PriorityDispatchResult.CONTINUE
-                            )
-                            is PriorityDispatchResult.STOP
-                        ):
-                            continue
+            results_by_subgroup: dict[str | None, PriorityDispatchResult] = {}
+            for fn, subgroup in self._plan(target, qualifier):
+                if (
+                    results_by_subgroup.get(subgroup)
+                    is PriorityDispatchResult.STOP
+                ):
+                    continue
 
-                        result = fn(*arg, **kw)
-                        results_by_subgroup[subgroup] = result
+                results_by_subgroup[subgroup] = fn(*arg, **kw)
 
         return go
 
@@ -433,6 +453,7 @@ class PriorityDispatcher:
         for k in other._registry:
             new_list = other._registry[k]
             self._registry[k].extend(new_list)
+        self._plans.clear()
 
 
 def not_none(value: _T | None) -> _T:
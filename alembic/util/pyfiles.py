@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import atexit
+from collections.abc import Callable
 from contextlib import ExitStack
 import importlib
 from importlib import resources
@@ -12,6 +13,8 @@ import re
 import tempfile
 from types import ModuleType
 from typing import Any
+from typing import TextIO
+import uuid
 
 from mako import exceptions
 from mako.template import Template
@@ -19,6 +22,16 @@ from mako.template import Template
 from .exc import CommandError
 
 
+class TemplateStream:
+    """A template argument whose text is written to the output file by the
+    given callable, in place of the argument's position in the rendered
+    template, rather than being held in memory and rendered by the
+    template itself."""
+
+    def __init__(self, write: Callable[[TextIO], None]) -> None:
+        self.write = write
+
+
 def template_to_file(
     template_file: str | os.PathLike[str],
     dest: str | os.PathLike[str],
@@ -27,9 +40,19 @@ def template_to_file(
     append_with_newlines: bool = False,
     **kw: Any,
 ) -> None:
+    # streamed arguments are rendered as unique placeholders, which are
+    # then replaced with the streamed text as the output is written
+    streams: dict[str, TemplateStream] = {}
+    template_args = dict(kw)
+    for key, value in kw.items():
+        if isinstance(value, TemplateStream):
+            placeholder = f"__alembic_stream_{uuid.uuid4().hex}__"
+            streams[placeholder] = value
+            template_args[key] = placeholder
+
     template = Template(filename=_preserving_path_as_str(template_file))
     try:
-        output = template.render_unicode(**kw).encode(output_encoding)
+        output = template.render_unicode(**template_args)
     except:
         with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as ntf:
             ntf.write(
@@ -43,10 +66,24 @@ def template_to_file(
             "template-oriented traceback." % fname
         )
     else:
-        with open(dest, "ab" if append_with_newlines else "wb") as f:
+        with open(
+            dest,
+            "a" if append_with_newlines else "w",
+            encoding=output_encoding,
+            newline="",
+        ) as f:
             if append_with_newlines:
-                f.write("\n\n".encode(output_encoding))
-            f.write(output)
+                f.write("\n\n")
+            if not streams:
+                f.write(output)
+                return
+            for part in re.split(
+                "(%s)" % "|".join(re.escape(p) for p in streams), output
+            ):
+                if part in streams:
+                    streams[part].write(f)
+                else:
+                    f.write(part)
 
 
 def coerce_resource_to_filename(fname_or_resource: str) -> pathlib.Path:
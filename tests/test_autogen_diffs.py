@@ -1,3 +1,5 @@
+import os
+
 from sqlalchemy import BIGINT
 from sqlalchemy import BigInteger
 from sqlalchemy import Boolean
@@ -8,6 +10,7 @@ from sqlalchemy import DATE
 from sqlalchemy import DateTime
 from sqlalchemy import DECIMAL
 from sqlalchemy import Enum
+from sqlalchemy import event
 from sqlalchemy import FLOAT
 from sqlalchemy import ForeignKey
 from sqlalchemy import ForeignKeyConstraint
@@ -32,13 +35,22 @@ from sqlalchemy import Unicode
 from sqlalchemy import UniqueConstraint
 from sqlalchemy import VARCHAR
 from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects import sqlite
+from sqlalchemy.sql import column
+from sqlalchemy.sql.elements import ClauseElement
+from sqlalchemy.sql.schema import DefaultClause
 from sqlalchemy.types import NULLTYPE
 from sqlalchemy.types import VARBINARY
+from sqlalchemy.util import LRUCache
 
 from alembic import autogenerate
 from alembic import testing
 from alembic.autogenerate import api
+from alembic.autogenerate import snapshot
+from alembic.autogenerate.compare.server_defaults import (
+    _render_server_default_for_compare,
+)
 from alembic.autogenerate.compare.tables import _compare_tables
 from alembic.migration import MigrationContext
 from alembic.operations import ops
@@ -51,6 +63,8 @@ from alembic.testing import is_not_
 from alembic.testing import mock
 from alembic.testing import schemacompare
 from alembic.testing import TestBase
+from alembic.testing.env import _get_staging_directory
+from alembic.testing.env import _sqlite_file_db
 from alembic.testing.env import clear_staging_env
 from alembic.testing.env import staging_env
 from alembic.testing.suite._autogen_fixtures import _default_name_filters
@@ -776,6 +790,41 @@ class CompareTypeSpecificityTest(TestBase):
             expected,
         )
 
+    def test_compare_type_cached(self, impl_fixture):
+        with mock.patch.object(
+            impl_fixture,
+            "_tokenize_type_definition",
+            side_effect=impl_fixture._tokenize_type_definition,
+        ) as tokenize:
+            for _ in range(3):
+                is_(
+                    impl_fixture.compare_type(
+                        Column("x", VARCHAR(30)), Column("x", String(40))
+                    ),
+                    True,
+                )
+                is_(
+                    impl_fixture.compare_type(
+                        Column("x", VARCHAR(30)), Column("x", String(30))
+                    ),
+                    False,
+                )
+        eq_(tokenize.call_count, 4)
+
+    def test_compare_type_cache_bounded(self, impl_fixture):
+        impl_fixture._type_comparisons = LRUCache(10, threshold=0)
+        for length in range(1, 100):
+            impl_fixture.compare_type(
+                Column("x", VARCHAR(length)), Column("x", String(30))
+            )
+        eq_(len(impl_fixture._type_comparisons), 10)
+        is_(
+            impl_fixture.compare_type(
+                Column("x", VARCHAR(30)), Column("x", String(30))
+            ),
+            False,
+        )
+
 
 class CompareServerDefaultTest(TestBase):
     __backend__ = True
@@ -943,6 +992,129 @@ class CompareServerDefaultTest(TestBase):
         else:
             assert not diff
 
+    def test_server_default_compile_cached(self, connection):
+        mc = MigrationContext.configure(connection)
+        autogen_context = api.AutogenContext(mc, MetaData())
+
+        with mock.patch.object(
+            ClauseElement,
+            "compile",
+            autospec=True,
+            side_effect=ClauseElement.compile,
+        ) as compile_:
+            rendered = [
+                _render_server_default_for_compare(
+                    DefaultClause(func.coalesce(column("q"), value)),
+                    autogen_context,
+                )
+                for value in (5, 5, 6, 5)
+            ]
+        eq_(
+            rendered,
+            [
+                "coalesce(q, 5)",
+                "coalesce(q, 5)",
+                "coalesce(q, 6)",
+                "coalesce(q, 5)",
+            ],
+        )
+        eq_(compile_.call_count, 2)
+
+    def test_server_default_comparisons_prepared_per_table(
+        self, connection, metadata
+    ):
+        Table(
+            "t1",
+            metadata,
+            Column("x", Integer, server_default=text("5")),
+            Column("y", Integer, server_default=text("6")),
+            Column("z", Integer),
+        )
+        Table("t2", metadata, Column("x", Integer, server_default=text("5")))
+        metadata.create_all(connection)
+
+        new_metadata = MetaData()
+        Table(
+            "t1",
+            new_metadata,
+            Column("x", Integer, server_default=text("5")),
+            Column("y", Integer, server_default=text("7")),
+            Column("z", Integer),
+        )
+        Table("t2", new_metadata, Column("x", Integer))
+
+        mc = MigrationContext.configure(
+            connection, opts={"compare_server_default": True}
+        )
+        with mock.patch.object(
+            mc.impl, "prepare_server_default_comparisons"
+        ) as prepare:
+            diff = api.compare_metadata(mc, new_metadata)
+
+        eq_(sorted(d[0][0] for d in diff), ["modify_default"] * 2)
+        eq_(
+            sorted(
+                (
+                    call[0][0][0][1].table.name,
+                    [comparison[1].name for comparison in call[0][0]],
+                )
+                for call in prepare.call_args_list
+            ),
+            [("t1", ["x", "y"]), ("t2", ["x"])],
+        )
+
+    @testing.combinations("include_name", "include_object", argnames="opt")
+    def test_server_default_comparisons_prepared_filtered(
+        self, connection, metadata, opt
+    ):
+        Table(
+            "t1",
+            metadata,
+            Column("x", Integer, server_default=text("5")),
+            Column("y", Integer, server_default=text("6")),
+            Column("z", Integer, server_default=text("7")),
+        )
+        metadata.create_all(connection)
+
+        new_metadata = MetaData()
+        Table(
+            "t1",
+            new_metadata,
+            Column("x", Integer, server_default=text("5")),
+            Column("y", Integer, server_default=text("8")),
+            Column("z", Integer, server_default=text("9")),
+        )
+
+        if opt == "include_name":
+
+            def include(name, type_, parent_names):
+                return type_ != "column" or name != "y"
+
+        else:
+
+            def include(obj, name, type_, reflected, compare_to):
+                return type_ != "column" or name != "y"
+
+        mc = MigrationContext.configure(
+            connection, opts={"compare_server_default": True, opt: include}
+        )
+        with mock.patch.object(
+            mc.impl, "prepare_server_default_comparisons"
+        ) as prepare:
+            diff = api.compare_metadata(mc, new_metadata)
+
+        eq_(
+            [d[0][3] for d in diff if d[0][0] == "modify_default"],
+            ["z"],
+        )
+        eq_(
+            [
+                [comparison[1].name for comparison in call[0][0]]
+                for call in prepare.call_args_list
+            ],
+            [["x", "z"]],
+        )
+
 
 class CompareMetadataToInspectorTest(TestBase):
     __backend__ = True
@@ -2224,6 +2396,445 @@ class AutogenInspectorCacheTest(AutogenFixtureTest, TestBase):
         )
 
 
+class AutogenMultiSchemaPreCacheTest(TestBase):
+    __requires__ = ("sqlalchemy_2",)
+    __only_on__ = "sqlite"
+
+    def setUp(self):
+        staging_env()
+        self.bind = _sqlite_file_db()
+        schema_db = self.bind.url.database.replace("foo.db", "schema.db")
+
+        @event.listens_for(self.bind, "connect")
+        def attach(dbapi_connection, connection_record):
+            dbapi_connection.execute(
+                "ATTACH DATABASE '%s' AS test_schema" % schema_db
+            )
+
+        m1 = MetaData()
+        for schema in (None, "test_schema"):
+            for num in range(3):
+                Table(
+                    "t%d" % num,
+                    m1,
+                    Column("id", Integer, primary_key=True),
+                    Column("name", String(50)),
+                    schema=schema,
+                )
+        m1.create_all(self.bind)
+
+    def tearDown(self):
+        self.bind.dispose()
+        clear_staging_env()
+
+    def test_one_multi_call_per_schema(self):
+        from sqlalchemy.engine.reflection import Inspector
+
+        m2 = MetaData()
+        for schema in (None, "test_schema"):
+            for num in range(3):
+                Table(
+                    "t%d" % num,
+                    m2,
+                    Column("id", Integer, primary_key=True),
+                    Column("name", String(75)),
+                    schema=schema,
+                )
+
+        per_table = ("columns", "pk_constraint", "table_comment", "indexes")
+        patchers = {
+            name: mock.patch.object(
+                Inspector,
+                name,
+                autospec=True,
+                side_effect=getattr(Inspector, name),
+            )
+            for name in [f"get_{key}" for key in per_table]
+            + [f"get_multi_{key}" for key in per_table]
+        }
+        mocks = {name: patcher.start() for name, patcher in patchers.items()}
+        try:
+            with self.bind.connect() as conn:
+                context = MigrationContext.configure(
+                    connection=conn,
+                    opts={
+                        "compare_type": True,
+                        "target_metadata": m2,
+                        "include_schemas": True,
+                    },
+                )
+                autogen_context = api.AutogenContext(context)
+                uo = ops.UpgradeOps(ops=[])
+                autogenerate._produce_net_changes(autogen_context, uo)
+        finally:
+            for patcher in patchers.values():
+                patcher.stop()
+
+        eq_(
+            sorted(
+                (diff[0], diff[1] or "", diff[2], diff[3])
+                for mt in uo.as_diffs()
+                for diff in mt
+            ),
+            [
+                ("modify_type", "", "t0", "name"),
+                ("modify_type", "", "t1", "name"),
+                ("modify_type", "", "t2", "name"),
+                ("modify_type", "test_schema", "t0", "name"),
+                ("modify_type", "test_schema", "t1", "name"),
+                ("modify_type", "test_schema", "t2", "name"),
+            ],
+        )
+        for key in per_table:
+            eq_(mocks[f"get_{key}"].call_count, 0)
+            eq_(
+                sorted(
+                    str(call.kwargs["schema"])
+                    for call in mocks[f"get_multi_{key}"].call_args_list
+                ),
+                ["None", "test_schema"],
+            )
+
+
+class AutogenParallelReflectionTest(TestBase):
+    __requires__ = ("sqlalchemy_2",)
+
+    def setUp(self):
+        staging_env()
+        self.bind = _sqlite_file_db()
+
+        m1 = MetaData()
+        for num in range(10):
+            Table(
+                "t%d" % num,
+                m1,
+                Column("id", Integer, primary_key=True),
+                Column("name", String(50), comment="the name"),
+                Column("parent_id", ForeignKey("t0.id")),
+                Index("ix_t%d_name" % num, "name"),
+                UniqueConstraint("parent_id", name="uq_t%d" % num),
+            )
+        m1.create_all(self.bind)
+
+        self.m2 = m2 = MetaData()
+        for num in range(0, 10, 2):
+            Table(
+                "t%d" % num,
+                m2,
+                Column("id", Integer, primary_key=True),
+                Column("name", String(75)),
+                Column("parent_id", ForeignKey("t0.id")),
+                Column("data", Integer),
+                Index("ix_t%d_name" % num, "name", unique=True),
+            )
+        Table("t10", m2, Column("id", Integer, primary_key=True))
+
+    def tearDown(self):
+        self.bind.dispose()
+        clear_staging_env()
+
+    def _run_autogen(self, execution_options=None, **opts):
+        statements = []
+
+        def track_before_cursor_execute(
+            conn, cursor, statement, parameters, context, executemany
+        ):
+            statements.append(statement)
+
+        with self.bind.connect() as conn:
+            if execution_options:
+                conn.execution_options(**execution_options)
+            event.listen(
+                conn, "before_cursor_execute", track_before_cursor_execute
+            )
+            context = MigrationContext.configure(
+                connection=conn,
+                opts={
+                    "compare_type": True,
+                    "target_metadata": self.m2,
+                    **opts,
+                },
+            )
+            autogen_context = api.AutogenContext(context)
+            uo = ops.UpgradeOps(ops=[])
+            autogenerate._produce_net_changes(autogen_context, uo)
+        return uo, statements
+
+    def test_parallel_ops_same_as_serial(self):
+        serial_ops, serial_statements = self._run_autogen()
+        parallel_ops, parallel_statements = self._run_autogen(
+            autogenerate_reflection_bind=self.bind,
+            autogenerate_reflection_workers=3,
+        )
+
+        eq_(
+            [repr(diff) for diff in parallel_ops.as_diffs()],
+            [repr(diff) for diff in serial_ops.as_diffs()],
+        )
+        assert len(parallel_statements) < len(serial_statements) / 5
+
+    def test_connection_factory(self):
+        connections = []
+
+        def connect():
+            conn = self.bind.connect()
+            connections.append(conn)
+            return conn
+
+        serial_ops, _ = self._run_autogen()
+        parallel_ops, _ = self._run_autogen(
+            autogenerate_reflection_bind=connect,
+            autogenerate_reflection_workers=4,
+        )
+
+        eq_(len(connections), 4)
+        for conn in connections:
+            is_(conn.closed, True)
+        eq_(
+            [repr(diff) for diff in parallel_ops.as_diffs()],
+            [repr(diff) for diff in serial_ops.as_diffs()],
+        )
+
+    def test_single_worker_is_serial(self):
+        connect = mock.Mock()
+
+        self._run_autogen(
+            autogenerate_reflection_bind=connect,
+            autogenerate_reflection_workers=1,
+        )
+        eq_(connect.mock_calls, [])
+
+    def test_execution_options_propagated(self):
+        connections = []
+
+        def connect():
+            conn = self.bind.connect()
+            connections.append(conn)
+            return conn
+
+        schema_map = {"foo": None}
+        self._run_autogen(
+            execution_options={"schema_translate_map": schema_map},
+            autogenerate_reflection_bind=connect,
+            autogenerate_reflection_workers=2,
+        )
+        eq_(len(connections), 2)
+        for conn in connections:
+            eq_(
+                conn.get_execution_options()["schema_translate_map"],
+                schema_map,
+            )
+
+    def test_default_schema_mismatch_is_serial(self):
+        serial_ops, serial_statements = self._run_autogen()
+
+        other = _sqlite_file_db()
+        other.connect().close()
+        try:
+            with mock.patch.object(other.dialect, "default_schema_name", "x"):
+                parallel_ops, parallel_statements = self._run_autogen(
+                    autogenerate_reflection_bind=other,
+                    autogenerate_reflection_workers=3,
+                )
+        finally:
+            other.dispose()
+
+        eq_(
+            [repr(diff) for diff in parallel_ops.as_diffs()],
+            [repr(diff) for diff in serial_ops.as_diffs()],
+        )
+        eq_(len(parallel_statements), len(serial_statements))
+
+
+class OfflineSnapshotTest(TestBase):
+    __requires__ = ("sqlalchemy_2",)
+    __only_on__ = "sqlite"
+
+    def setUp(self):
+        staging_env()
+        self.bind = _sqlite_file_db()
+        self.snapshot_file = os.path.join(
+            _get_staging_directory(), "snapshot.json"
+        )
+
+        m1 = MetaData()
+        Table(
+            "t1",
+            m1,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(50), server_default="x"),
+            Index("ix_t1_name", "name"),
+        )
+        Table(
+            "t2",
+            m1,
+            Column("id", Integer, primary_key=True),
+            Column("t1_id", ForeignKey("t1.id")),
+        )
+        m1.create_all(self.bind)
+
+        self.m2 = m2 = MetaData()
+        Table(
+            "t1",
+            m2,
+            Column("id", Integer, primary_key=True),
+            Column("name", String(75), server_default="x"),
+            Index("ix_t1_name", "name", unique=True),
+        )
+        Table("t3", m2, Column("id", Integer, primary_key=True))
+
+    def tearDown(self):
+        self.bind.dispose()
+        clear_staging_env()
+
+    def _take_snapshot(self, bind, **opts):
+        with bind.connect() as conn:
+            context = MigrationContext.configure(
+                connection=conn, opts={"compare_type": True, **opts}
+            )
+            return autogenerate.produce_migrations(
+                context,
+                self.m2,
+                snapshot=autogenerate.ReflectionSnapshot(self.snapshot_file),
+            ).upgrade_ops
+
+    def _offline_ops(self, dialect_name="sqlite", key=None, **opts):
+        context = MigrationContext.configure(
+            dialect_name=dialect_name, opts={"compare_type": True, **opts}
+        )
+        return autogenerate.produce_migrations(
+            context,
+            self.m2,
+            snapshot=autogenerate.ReflectionSnapshot(
+                self.snapshot_file, key=key
+            ),
+        ).upgrade_ops
+
+    @testing.combinations(True, False, argnames="as_sql")
+    def test_offline_same_as_live(self, as_sql):
+        live_ops = self._take_snapshot(self.bind)
+        self.bind.dispose()
+
+        with mock.patch.object(
+            self.bind, "connect", side_effect=Exception("no connection")
+        ):
+            offline_ops = self._offline_ops(as_sql=as_sql)
+
+        eq_(
+            autogenerate.render_python_code(offline_ops),
+            autogenerate.render_python_code(live_ops),
+        )
+        eq_(
+            sorted(
+                diff[0] if isinstance(diff, tuple) else diff[0][0]
+                for diff in offline_ops.as_diffs()
+            ),
+            [
+                "add_index",
+                "add_table",
+                "modify_type",
+                "remove_index",
+                "remove_table",
+            ],
+        )
+
+    def test_as_sql_requires_snapshot(self):
+        context = MigrationContext.configure(
+            dialect_name="sqlite", opts={"as_sql": True}
+        )
+        assert_raises_message(
+            CommandError,
+            "autogenerate can't use as_sql=True",
+            autogenerate.compare_metadata,
+            context,
+            self.m2,
+        )
+
+    def test_no_snapshot_file(self):
+        assert_raises_message(
+            CommandError,
+            "No reflection snapshot found in file",
+            self._offline_ops,
+        )
+
+    def test_dialect_mismatch(self):
+        self._take_snapshot(self.bind)
+        assert_raises_message(
+            CommandError,
+            "was taken against the 'sqlite' dialect; can't compare using "
+            "the 'postgresql' dialect",
+            self._offline_ops,
+            dialect_name="postgresql",
+        )
+
+    def test_key_required_for_multiple_databases(self):
+        other_bind = _sqlite_file_db(tempname="other.db")
+        self._take_snapshot(self.bind)
+        self._take_snapshot(other_bind)
+        other_bind.dispose()
+
+        assert_raises_message(
+            CommandError,
+            "contains snapshots of more than one database",
+            self._offline_ops,
+        )
+
+        upgrade_ops = self._offline_ops(
+            key=self.bind.url.render_as_string(hide_password=True)
+        )
+        eq_(len(upgrade_ops.as_diffs()), 5)
+
+        upgrade_ops = self._offline_ops(
+            key=other_bind.url.render_as_string(hide_password=True)
+        )
+        eq_(len(upgrade_ops.as_diffs()), 3)
+
+    def test_snapshot_missing_schema_information(self):
+        self._take_snapshot(self.bind)
+
+        assert_raises_message(
+            CommandError,
+            "does not include all of the schema information",
+            self._offline_ops,
+            include_schemas=True,
+        )
+
+    @testing.combinations(
+        (postgresql.dialect(), postgresql.ARRAY(postgresql.INTEGER())),
+        (postgresql.dialect(), postgresql.ENUM("a", "b", name="e")),
+        (postgresql.dialect(), postgresql.TIMESTAMP(timezone=True)),
+        (postgresql.dialect(), VARCHAR(50, collation="C")),
+        (mysql.dialect(), mysql.INTEGER(display_width=11, unsigned=True)),
+        (mysql.dialect(), mysql.SET("a", "b")),
+        (sqlite.dialect(), NULLTYPE),
+        argnames="dialect, type_",
+    )
+    def test_datatype_round_trip(self, dialect, type_):
+        encoded = snapshot._encode(
+            {("alembic_columns", None): [{"type": type_}]}, dialect
+        )
+        restored = snapshot._decode(encoded, dialect)
+        restored_type = restored[("alembic_columns", None)][0]["type"]
+        is_(type(restored_type), type(type_))
+        eq_(repr(restored_type), repr(type_))
+
+    def test_snapshot_rejects_non_datatype(self):
+        self._take_snapshot(self.bind)
+        with open(self.snapshot_file) as file_:
+            content = file_.read()
+        with open(self.snapshot_file, "w") as file_:
+            file_.write(
+                content.replace('"INTEGER()"', "\"exec('import os')\"")
+            )
+
+        assert_raises_message(
+            CommandError,
+            "Could not read reflection snapshot file .*: "
+            "Unknown datatype 'exec'",
+            self._offline_ops,
+        )
+
+
 class AutogenPlaceholderTableTest(AutogenFixtureTest, TestBase):
     """test for placeholder table creation for non-reflected FK targets (issue
     #1787).
@@ -2278,6 +2889,46 @@ class AutogenPlaceholderTableTest(AutogenFixtureTest, TestBase):
         eq_(len(diffs), 1)
         eq_(diffs[0][0], "remove_fk")
 
+    def test_fk_to_existing_table_compared_later(self):
+        """Test FK from a table compared before the table it refers to, which
+        is compared afterwards using the table reflected from the database."""
+        m1 = MetaData()
+        m2 = MetaData()
+
+        for m in (m1, m2):
+            Table(
+                "a_child",
+                m,
+                Column("id", Integer, primary_key=True),
+                Column("parent_id", Integer),
+                Column("other_id", Integer),
+                ForeignKeyConstraint(["parent_id"], ["b_parent.id"]),
+                *(
+                    [ForeignKeyConstraint(["other_id"], ["b_parent.id"])]
+                    if m is m2
+                    else []
+                ),
+            )
+        Table(
+            "b_parent",
+            m1,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+        )
+        Table(
+            "b_parent",
+            m2,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+            Column("extra", Integer),
+        )
+
+        diffs = self._fixture(m1, m2)
+        eq_([diff[0] for diff in diffs], ["add_fk", "add_column"])
+        eq_(diffs[0][1].parent.name, "a_child")
+        eq_(diffs[0][1].column_keys, ["other_id"])
+        eq_(diffs[1][2:4], ("b_parent", m2.tables["b_parent"].c.extra))
+
     def test_fk_to_filtered_table_composite(self):
         """Test FK to a table filtered out by include_name - composite FK."""
         m1 = MetaData()
@@ -7,6 +7,8 @@ from sqlalchemy import Column
 from sqlalchemy import Computed
 from sqlalchemy import DateTime
 from sqlalchemy import Enum
+from sqlalchemy import event
+from sqlalchemy import exc
 from sqlalchemy import ForeignKey
 from sqlalchemy import ForeignKeyConstraint
 from sqlalchemy import func
@@ -1561,6 +1563,336 @@ class BatchRoundTripTest(TestBase):
         res = res.mappings()
         eq_([dict(row) for row in res], data)
 
+    def _per_migration_op(self):
+        # batched copies commit each range of rows, which requires the
+        # migration's transaction to be owned by the MigrationContext
+        context = MigrationContext.configure(
+            self.conn, opts={"transaction_per_migration": True}
+        )
+        return Operations(context)
+
+    def test_copy_in_batches(self):
+        op = self._per_migration_op()
+        context = op.get_context()
+        with mock.patch("alembic.operations.batch.log") as log:
+            with context.begin_transaction(_per_migration=True):
+                with op.batch_alter_table(
+                    "foo", recreate="always", copy_batch_size=2
+                ) as batch_op:
+                    batch_op.alter_column("data", type_=String(30))
+
+        eq_([call[1][1] for call in log.info.mock_calls], [2, 4, 5])
+        self._assert_data(
+            [
+                {"id": 1, "data": "d1", "x": 5},
+                {"id": 2, "data": "22", "x": 6},
+                {"id": 3, "data": "8.5", "x": 7},
+                {"id": 4, "data": "9.46", "x": 8},
+                {"id": 5, "data": "d5", "x": 9},
+            ]
+        )
+
+    def test_copy_in_batches_failure_keeps_new_table(self):
+        op = self._per_migration_op()
+        context = op.get_context()
+        with expect_raises_message(exc.IntegrityError, "ck_id"):
+            with context.begin_transaction(_per_migration=True):
+                with op.batch_alter_table(
+                    "foo",
+                    recreate="always",
+                    copy_batch_size=2,
+                    table_args=(CheckConstraint("id < 4", name="ck_id"),),
+                ) as batch_op:
+                    batch_op.drop_column("x")
+
+        eq_(self.conn.execute(text("select count(*) from foo")).scalar(), 5)
+        self._assert_data(
+            [{"id": 1, "data": "d1"}, {"id": 2, "data": "22"}],
+            tablename="_alembic_tmp_foo",
+        )
+        self.conn.execute(text("drop table _alembic_tmp_foo"))
+        _safe_commit_connection_transaction(self.conn)
+
+    def test_copy_in_batches_resume(self):
+        # the new table as left behind by an interrupted copy
+        with self.conn.begin():
+            self.conn.execute(
+                text(
+                    "create table _alembic_tmp_foo "
+                    "(id integer primary key, data varchar(50))"
+                )
+            )
+            self.conn.execute(
+                text(
+                    "insert into _alembic_tmp_foo (id, data) "
+                    "values (1, 'd1'), (2, '22')"
+                )
+            )
+
+        op = self._per_migration_op()
+        context = op.get_context()
+        with mock.patch("alembic.operations.batch.log") as log:
+            with context.begin_transaction(_per_migration=True):
+                with op.batch_alter_table(
+                    "foo", recreate="always", copy_batch_size=2
+                ) as batch_op:
+                    batch_op.drop_column("x")
+
+        eq_(log.info.mock_calls[0][1][3], 2)
+        eq_([call[1][1] for call in log.info.mock_calls[1:]], [2, 3])
+        self._assert_data(
+            [
+                {"id": 1, "data": "d1"},
+                {"id": 2, "data": "22"},
+                {"id": 3, "data": "8.5"},
+                {"id": 4, "data": "9.46"},
+                {"id": 5, "data": "d5"},
+            ]
+        )
+
+    def test_copy_in_batches_resume_after_greatest_key(self):
+        # the new table as left behind by an interrupted copy, after which
+        # a row that was copied has been deleted from the old table
+        with self.conn.begin():
+            self.conn.execute(
+                text(
+                    "create table _alembic_tmp_foo "
+                    "(id integer primary key, data varchar(50))"
+                )
+            )
+            self.conn.execute(
+                text(
+                    "insert into _alembic_tmp_foo (id, data) "
+                    "values (1, 'd1'), (2, '22')"
+                )
+            )
+            self.conn.execute(text("delete from foo where id = 1"))
+
+        op = self._per_migration_op()
+        context = op.get_context()
+        with expect_raises_message(
+            CommandError,
+            "Table foo has 4 rows, however 5 rows were copied into "
+            "table _alembic_tmp_foo",
+        ):
+            with context.begin_transaction(_per_migration=True):
+                with op.batch_alter_table(
+                    "foo", recreate="always", copy_batch_size=2
+                ) as batch_op:
+                    batch_op.drop_column("x")
+
+        self._assert_data(
+            [
+                {"id": 1, "data": "d1"},
+                {"id": 2, "data": "22"},
+                {"id": 3, "data": "8.5"},
+                {"id": 4, "data": "9.46"},
+                {"id": 5, "data": "d5"},
+            ],
+            tablename="_alembic_tmp_foo",
+        )
+        self.conn.execute(text("drop table _alembic_tmp_foo"))
+        _safe_commit_connection_transaction(self.conn)
+
+    def test_copy_in_batches_resume_column_mismatch(self):
+        with self.conn.begin():
+            self.conn.execute(
+                text(
+                    "create table _alembic_tmp_foo "
+                    "(id integer primary key, data varchar(50), x integer)"
+                )
+            )
+
+        op = self._per_migration_op()
+        context = op.get_context()
+        try:
+            with expect_raises_message(
+                CommandError,
+                r"Table _alembic_tmp_foo exists with columns \(data, id, "
+                r"x\), which don't match the columns \(data, id\) of the "
+                "new table for foo",
+            ):
+                with context.begin_transaction(_per_migration=True):
+                    with op.batch_alter_table(
+                        "foo", recreate="always", copy_batch_size=2
+                    ) as batch_op:
+                        batch_op.drop_column("x")
+        finally:
+            _safe_commit_connection_transaction(self.conn)
+            with self.conn.begin():
+                self.conn.execute(text("drop table _alembic_tmp_foo"))
+
+    def test_copy_in_batches_resume_pk_type_change(self):
+        with self.conn.begin():
+            self.conn.execute(
+                text(
+                    "create table strpk "
+                    "(id varchar(10) primary key, data varchar(50))"
+                )
+            )
+            self.conn.execute(
+                text(
+                    "insert into strpk (id, data) values "
+                    "('10', 'd10'), ('9', 'd9'), ('95', 'd95'), "
+                    "('99', 'd99'), ('990', 'd990')"
+                )
+            )
+            # the new table as left behind by an interrupted copy, which
+            # copied the first two rows in order of the old, string key;
+            # the greatest of the new, integer keys is not the last row
+            # copied
+            self.conn.execute(
+                text(
+                    "create table _alembic_tmp_strpk "
+                    "(id integer primary key, data varchar(50))"
+                )
+            )
+            self.conn.execute(
+                text(
+                    "insert into _alembic_tmp_strpk (id, data) "
+                    "values (10, 'd10'), (9, 'd9')"
+                )
+            )
+
+        try:
+            op = self._per_migration_op()
+            context = op.get_context()
+            with context.begin_transaction(_per_migration=True):
+                with op.batch_alter_table(
+                    "strpk", recreate="always", copy_batch_size=2
+                ) as batch_op:
+                    batch_op.alter_column(
+                        "id", type_=Integer, existing_type=String(10)
+                    )
+
+            eq_(
+                self.conn.execute(
+                    text("select id, data from strpk order by id")
+                ).all(),
+                [
+                    (9, "d9"),
+                    (10, "d10"),
+                    (95, "d95"),
+                    (99, "d99"),
+                    (990, "d990"),
+                ],
+            )
+        finally:
+            self.conn.execute(text("drop table strpk"))
+            _safe_commit_connection_transaction(self.conn)
+
+    def test_copy_in_batches_row_count_mismatch(self):
+        inserted = []
+
+        @event.listens_for(self.conn, "after_cursor_execute")
+        def after_cursor_execute(conn, cursor, statement, *arg):
+            # a row written to the table while it's being copied, below
+            # the range of keys still to be copied
+            if statement.startswith("INSERT INTO _alembic_tmp_foo") and (
+                not inserted
+            ):
+                inserted.append(True)
+                cursor.execute(
+                    "insert into foo (id, data, x) values (0, 'd0', 4)"
+                )
+
+        op = self._per_migration_op()
+        context = op.get_context()
+        try:
+            with expect_raises_message(
+                CommandError,
+                "Table foo has 6 rows, however 5 rows were copied into "
+                "table _alembic_tmp_foo",
+            ):
+                with context.begin_transaction(_per_migration=True):
+                    with op.batch_alter_table(
+                        "foo", recreate="always", copy_batch_size=2
+                    ) as batch_op:
+                        batch_op.drop_column("x")
+        finally:
+            event.remove(
+                self.conn, "after_cursor_execute", after_cursor_execute
+            )
+
+        eq_(self.conn.execute(text("select count(*) from foo")).scalar(), 6)
+        self.conn.execute(text("drop table _alembic_tmp_foo"))
+        _safe_commit_connection_transaction(self.conn)
+
+    @exclusions.only_on("sqlite")
+    @testing.combinations((None,), (2,), argnames="copy_batch_size")
+    def test_sqlite_fast_batch_copy(self, copy_batch_size):
+        pragmas = ["synchronous", "journal_mode", "cache_size", "foreign_keys"]
+
+        def get_pragmas():
+            return {
+                name: self.conn.exec_driver_sql("PRAGMA %s" % name).scalar()
+                for name in pragmas
+            }
+
+        existing = get_pragmas()
+        _safe_commit_connection_transaction(self.conn)
+        statements = []
+
+        @event.listens_for(self.conn, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, *arg):
+            if statement.startswith(("PRAGMA", "INSERT")):
+                statements.append(statement.split(" (")[0])
+
+        context = MigrationContext.configure(
+            self.conn, opts={"sqlite_fast_batch_copy": True}
+        )
+        with context.begin_transaction(_per_migration=True):
+            with Operations(context).batch_alter_table(
+                "foo", recreate="always", copy_batch_size=copy_batch_size
+            ) as batch_op:
+                batch_op.alter_column("data", type_=String(30))
+        event.remove(self.conn, "before_cursor_execute", before_cursor_execute)
+
+        inserts = [s for s in statements if s.startswith("INSERT")]
+        start = statements.index("PRAGMA synchronous = OFF")
+        eq_(
+            statements[start : start + 4],
+            [
+                "PRAGMA synchronous = OFF",
+                "PRAGMA journal_mode = MEMORY",
+                "PRAGMA cache_size = -262144",
+                "PRAGMA foreign_keys = OFF",
+            ],
+        )
+        eq_(
+            statements[start + 4 : start + 4 + len(inserts)],
+            inserts,
+        )
+        eq_(
+            statements[start + 4 + len(inserts) :],
+            ["PRAGMA %s = %s" % (name, existing[name]) for name in pragmas],
+        )
+        eq_(get_pragmas(), existing)
+        self._assert_data(
+            [
+                {"id": 1, "data": "d1", "x": 5},
+                {"id": 2, "data": "22", "x": 6},
+                {"id": 3, "data": "8.5", "x": 7},
+                {"id": 4, "data": "9.46", "x": 8},
+                {"id": 5, "data": "d5", "x": 9},
+            ]
+        )
+
+    def test_copy_in_batches_no_pk(self):
+        self._no_pk_fixture()
+        op = self._per_migration_op()
+        context = op.get_context()
+        with expect_raises_message(
+            CommandError,
+            "Copying table nopk in batches requires a single-column "
+            "primary key",
+        ):
+            with context.begin_transaction(_per_migration=True):
+                with op.batch_alter_table(
+                    "nopk", recreate="always", copy_batch_size=2
+                ) as batch_op:
+                    batch_op.alter_column("b", type_=String(30))
+
     def test_ix_existing(self):
         self._table_w_index_fixture()
 
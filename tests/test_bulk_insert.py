@@ -9,10 +9,12 @@ from sqlalchemy.sql import table
 from sqlalchemy.types import TypeEngine
 
 from alembic import op
+from alembic import testing
 from alembic.migration import MigrationContext
 from alembic.testing import assert_raises_message
 from alembic.testing import config
 from alembic.testing import eq_
+from alembic.testing import mock
 from alembic.testing.fixtures import op_fixture
 from alembic.testing.fixtures import TestBase
 
@@ -217,10 +219,168 @@ class BulkInsertTest(TestBase):
             "(2, 'row v2', 'row v6')",
         )
 
+    def test_bulk_insert_generator(self):
+        context, t1 = self._table_fixture("default", False)
+
+        op.bulk_insert(
+            t1, ({"id": i, "v1": "v1", "v2": "v2"} for i in range(4))
+        )
+        context.assert_(
+            "INSERT INTO ins_table (id, v1, v2) VALUES (:id, :v1, :v2)"
+        )
+
+    def test_bulk_insert_chunk_size(self):
+        context, t1 = self._table_fixture("default", False)
+
+        op.bulk_insert(
+            t1,
+            ({"id": i, "v1": "v1", "v2": "v2"} for i in range(7)),
+            chunk_size=3,
+        )
+        context.assert_(
+            "INSERT INTO ins_table (id, v1, v2) VALUES (:id, :v1, :v2)",
+            "INSERT INTO ins_table (id, v1, v2) VALUES (:id, :v1, :v2)",
+            "INSERT INTO ins_table (id, v1, v2) VALUES (:id, :v1, :v2)",
+        )
+
+    def test_bulk_insert_generator_no_rows(self):
+        context, t1 = self._table_fixture("default", False)
+
+        op.bulk_insert(t1, iter([]), chunk_size=3)
+        context.assert_()
+
+    def test_bulk_insert_generator_as_sql(self):
+        context, t1 = self._table_fixture("default", True)
+
+        op.bulk_insert(
+            t1,
+            (
+                {"id": i, "v1": "row v%d" % i, "v2": "row v%d" % (i + 4)}
+                for i in range(1, 3)
+            ),
+            chunk_size=1,
+        )
+        context.assert_(
+            "INSERT INTO ins_table (id, v1, v2) "
+            "VALUES (1, 'row v1', 'row v5')",
+            "INSERT INTO ins_table (id, v1, v2) "
+            "VALUES (2, 'row v2', 'row v6')",
+        )
+
+    @testing.combinations("postgresql", "mysql", "sqlite", "mssql")
+    def test_bulk_insert_as_sql_multirow(self, dialect):
+        context, t1 = self._table_fixture(dialect, True)
+
+        op.bulk_insert(
+            t1,
+            [
+                {"id": 1, "v1": "row v1", "v2": "row v5"},
+                {"id": 2, "v1": "row v2", "v2": "row v6"},
+                {"id": 3, "v1": "row v3", "v2": "row v7"},
+                {"id": 4, "v1": "row v4"},
+                {"id": 5, "v1": "row v5"},
+            ],
+            chunk_size=2,
+            multirow_values=True,
+        )
+        expected = [
+            "INSERT INTO ins_table (id, v1, v2) "
+            "VALUES (1, 'row v1', 'row v5'), (2, 'row v2', 'row v6')",
+            "INSERT INTO ins_table (id, v1, v2) "
+            "VALUES (3, 'row v3', 'row v7')",
+            "INSERT INTO ins_table (id, v1) "
+            "VALUES (4, 'row v4'), (5, 'row v5')",
+        ]
+        if dialect == "mssql":
+            expected = (
+                ["SET IDENTITY_INSERT ins_table ON", "GO"]
+                + [elem for stmt in expected for elem in (stmt, "GO")]
+                + ["SET IDENTITY_INSERT ins_table OFF", "GO"]
+            )
+        context.assert_(*expected)
+
+    def test_bulk_insert_as_sql_multirow_mssql_limit(self):
+        context, t1 = self._table_fixture("mssql", True)
+        eq_(context.impl.max_insert_values_rows, 1000)
+
+        with mock.patch.object(context.impl, "max_insert_values_rows", 2):
+            op.bulk_insert(
+                t1,
+                [{"id": i, "v1": "v1", "v2": "v2"} for i in range(1, 4)],
+                chunk_size=5,
+                multirow_values=True,
+            )
+        context.assert_(
+            "SET IDENTITY_INSERT ins_table ON",
+            "GO",
+            "INSERT INTO ins_table (id, v1, v2) "
+            "VALUES (1, 'v1', 'v2'), (2, 'v1', 'v2')",
+            "GO",
+            "INSERT INTO ins_table (id, v1, v2) VALUES (3, 'v1', 'v2')",
+            "GO",
+            "SET IDENTITY_INSERT ins_table OFF",
+            "GO",
+        )
+
+    def test_bulk_insert_as_sql_multirow_not_supported(self):
+        context, t1 = self._table_fixture("default", True)
+
+        op.bulk_insert(
+            t1,
+            [{"id": i, "v1": "v1", "v2": "v2"} for i in range(1, 3)],
+            chunk_size=2,
+            multirow_values=True,
+        )
+        context.assert_(
+            "INSERT INTO ins_table (id, v1, v2) VALUES (1, 'v1', 'v2')",
+            "INSERT INTO ins_table (id, v1, v2) VALUES (2, 'v1', 'v2')",
+        )
+
+    def test_bulk_insert_as_sql_multirow_no_chunk_size(self):
+        context, t1 = self._table_fixture("sqlite", True)
+
+        op.bulk_insert(
+            t1,
+            [{"id": i, "v1": "v1", "v2": "v2"} for i in range(1, 4)],
+            multirow_values=True,
+        )
+        context.assert_(
+            "INSERT INTO ins_table (id, v1, v2) "
+            "VALUES (1, 'v1', 'v2'), (2, 'v1', 'v2'), (3, 'v1', 'v2')",
+        )
+
+    def test_bulk_insert_as_sql_chunk_size_single_row(self):
+        context, t1 = self._table_fixture("sqlite", True)
+
+        op.bulk_insert(
+            t1,
+            [{"id": i, "v1": "v1", "v2": "v2"} for i in range(1, 3)],
+            chunk_size=2,
+        )
+        context.assert_(
+            "INSERT INTO ins_table (id, v1, v2) VALUES (1, 'v1', 'v2')",
+            "INSERT INTO ins_table (id, v1, v2) VALUES (2, 'v1', 'v2')",
+        )
+
+    def test_invalid_chunk_size(self):
+        context, t1 = self._table_fixture("sqlite", False)
+        assert_raises_message(
+            ValueError,
+            "chunk_size must be a positive integer",
+            op.bulk_insert,
+            t1,
+            [{"id": 5}],
+            chunk_size=0,
+        )
+
     def test_invalid_format(self):
         context, t1 = self._table_fixture("sqlite", False)
         assert_raises_message(
-            TypeError, "List expected", op.bulk_insert, t1, {"id": 5}
+            TypeError,
+            "List or other iterable of dictionaries expected",
+            op.bulk_insert,
+            t1,
+            {"id": 5},
         )
 
         assert_raises_message(
@@ -280,6 +440,31 @@ class RoundTripTest(TestBase):
             [(1, "d1", "x1"), (2, "d2", "x2"), (3, "d3", "x3")],
         )
 
+    def test_bulk_insert_chunk_size_round_trip(self):
+        produced = []
+
+        def rows():
+            for i in range(1, 8):
+                produced.append(i)
+                yield {"data": "d%d" % i, "x": "x%d" % i}
+
+        executed = []
+        exec_ = self.op.impl._exec
+
+        def track(construct, *arg, **kw):
+            executed.append((len(kw["multiparams"]), len(produced)))
+            return exec_(construct, *arg, **kw)
+
+        with mock.patch.object(self.op.impl, "_exec", track):
+            self.op.bulk_insert(self.t1, rows(), chunk_size=3)
+
+        # each chunk is executed before the next one is consumed
+        eq_(executed, [(3, 3), (3, 6), (1, 7)])
+        eq_(
+            self.conn.execute(text("select id, data, x from foo")).fetchall(),
+            [(i, "d%d" % i, "x%d" % i) for i in range(1, 8)],
+        )
+
     def test_bulk_insert_inline_literal(self):
         class MyType(TypeEngine):
             pass
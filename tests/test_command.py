@@ -4,6 +4,7 @@ import inspect
 from io import BytesIO
 from io import StringIO
 from io import TextIOWrapper
+import json
 import os
 import pathlib
 import re
@@ -11,6 +12,9 @@ import shutil
 from typing import cast
 
 from sqlalchemy import exc as sqla_exc
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Table
 from sqlalchemy import text
 from sqlalchemy import VARCHAR
 from sqlalchemy.engine import Engine
@@ -21,6 +25,8 @@ from alembic import command
 from alembic import config
 from alembic import testing
 from alembic import util
+from alembic.autogenerate.fingerprint import fingerprint_path
+from alembic.autogenerate.fingerprint import read_fingerprints
 from alembic.script import ScriptDirectory
 from alembic.testing import assert_raises
 from alembic.testing import assert_raises_message
@@ -769,6 +775,458 @@ for db_name in re.split(r",\\s*", db_names):
 """)
 
 
+class CheckSnapshotTest(TestBase):
+    __requires__ = ("sqlalchemy_2",)
+
+    def setUp(self):
+        self.env = staging_env()
+        self.cfg = _sqlite_testing_config()
+        self.snapshot_file = os.path.join(
+            _get_staging_directory(), "snapshot.json"
+        )
+        self.cfg.set_main_option(
+            "autogenerate_snapshot_file", self.snapshot_file
+        )
+        self.bind = _sqlite_file_db()
+        with self.bind.begin() as conn:
+            conn.execute(
+                text("create table foo (id integer not null primary key)")
+            )
+        env_file_fixture("""
+
+from sqlalchemy import Column, Integer, MetaData, Table, engine_from_config
+target_metadata = MetaData()
+Table("foo", target_metadata, Column("id", Integer, primary_key=True))
+
+engine = engine_from_config(
+    config.get_section(config.config_ini_section),
+    prefix='sqlalchemy.'
+)
+
+with engine.connect() as connection:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+engine.dispose()
+
+""")
+
+    def tearDown(self):
+        self.bind.dispose()
+        clear_staging_env()
+
+    @contextmanager
+    def _track_reflection(self):
+        from sqlalchemy.engine.reflection import Inspector
+
+        with mock.patch.object(
+            Inspector,
+            "get_table_names",
+            autospec=True,
+            side_effect=Inspector.get_table_names,
+        ) as get_table_names:
+            yield get_table_names
+
+    def test_snapshot_written_and_reused(self):
+        with self._track_reflection() as reflected:
+            command.check(self.cfg)
+        eq_(reflected.call_count, 1)
+        is_true(os.path.exists(self.snapshot_file))
+
+        with self.bind.begin() as conn:
+            conn.execute(text("create table bar (id integer primary key)"))
+
+        # database is assumed to be unchanged while its heads are
+        with self._track_reflection() as reflected:
+            command.check(self.cfg)
+        eq_(reflected.call_count, 0)
+
+        with self._track_reflection() as reflected:
+            with expect_raises_message(
+                util.AutogenerateDiffsDetected, r"\('remove_table'"
+            ):
+                command.check(self.cfg, refresh_snapshot=True)
+        eq_(reflected.call_count, 1)
+
+        # the refreshed snapshot is now in use
+        with self._track_reflection() as reflected:
+            with expect_raises_message(
+                util.AutogenerateDiffsDetected, r"\('remove_table'"
+            ):
+                command.check(self.cfg)
+        eq_(reflected.call_count, 0)
+
+    def test_snapshot_not_reused_for_new_heads(self):
+        command.check(self.cfg)
+
+        rev = command.revision(self.cfg, message="r1")
+        command.stamp(self.cfg, rev.revision)
+
+        with self._track_reflection() as reflected:
+            command.check(self.cfg)
+        eq_(reflected.call_count, 1)
+
+        with self._track_reflection() as reflected:
+            command.check(self.cfg)
+        eq_(reflected.call_count, 0)
+
+    def test_unreadable_snapshot(self):
+        with open(self.snapshot_file, "wb") as file_:
+            file_.write(b"not a snapshot")
+
+        with testing.expect_warnings("Could not read reflection snapshot"):
+            command.check(self.cfg)
+
+        with self._track_reflection() as reflected:
+            command.check(self.cfg)
+        eq_(reflected.call_count, 0)
+
+    def test_revision_uses_snapshot(self):
+        command.check(self.cfg)
+
+        with self._track_reflection() as reflected:
+            command.revision(self.cfg, message="r1", autogenerate=True)
+        eq_(reflected.call_count, 0)
+
+    def test_revision_refresh_snapshot(self):
+        command.check(self.cfg)
+
+        with self._track_reflection() as reflected:
+            command.revision(
+                self.cfg,
+                message="r1",
+                autogenerate=True,
+                refresh_snapshot=True,
+            )
+        eq_(reflected.call_count, 1)
+
+    def test_refresh_snapshot_command_line(self):
+        cmd = config.CommandLine()
+        options = cmd.parser.parse_args(["check", "--refresh-snapshot"])
+        is_true(options.refresh_snapshot)
+        options = cmd.parser.parse_args(["revision", "--refresh-snapshot"])
+        is_true(options.refresh_snapshot)
+
+
+class ProfileTest(_BufMixin, TestBase):
+    def setUp(self):
+        self.env = staging_env()
+        self.cfg = _sqlite_testing_config()
+        self.bind = _sqlite_file_db()
+        with self.bind.begin() as conn:
+            conn.execute(
+                text("create table foo (id integer not null primary key)")
+            )
+        env_file_fixture("""
+
+from sqlalchemy import Column, Integer, MetaData, Table, engine_from_config
+target_metadata = MetaData()
+Table("foo", target_metadata, Column("id", Integer, primary_key=True))
+
+engine = engine_from_config(
+    config.get_section(config.config_ini_section),
+    prefix='sqlalchemy.'
+)
+
+with engine.connect() as connection:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+engine.dispose()
+
+""")
+
+    def tearDown(self):
+        self.bind.dispose()
+        clear_staging_env()
+
+    def test_check_profile_summary(self):
+        self.cfg.stdout = buf = self._buf_fixture()
+        command.check(self.cfg, profile=True)
+        output = buf.getvalue().decode("ascii")
+        assert "Autogenerate completed in" in output
+        assert "[column] alembic.autogenerate.compare.types" in output
+        assert re.search(r"sec  foo\n", output)
+        assert "No new upgrade operations detected." in output
+
+    def test_check_profile_json(self):
+        path = os.path.join(_get_staging_directory(), "profile.json")
+        self.cfg.stdout = self._buf_fixture()
+        command.check(self.cfg, profile=path)
+
+        with open(path) as file_:
+            report = json.load(file_)
+        is_true(report["round_trips"]["count"] > 0)
+        eq_(
+            [(t["schema"], t["name"]) for t in report["tables"]],
+            [(None, "foo")],
+        )
+        column_types = [
+            c
+            for c in report["comparators"]
+            if c["name"].endswith("types._dialect_impl_compare_type")
+        ]
+        eq_(len(column_types), 1)
+        eq_(column_types[0]["target"], "column")
+        eq_(column_types[0]["calls"], 1)
+
+    def test_revision_profile(self):
+        self.cfg.stdout = buf = self._buf_fixture()
+        command.revision(self.cfg, autogenerate=True, profile=True)
+        assert "Autogenerate completed in" in buf.getvalue().decode("ascii")
+
+    def test_revision_profile_requires_autogenerate(self):
+        assert_raises_message(
+            util.CommandError,
+            "Using --profile without --autogenerate does not make any sense",
+            command.revision,
+            self.cfg,
+            profile=True,
+        )
+
+    def test_no_profile(self):
+        self.cfg.stdout = buf = self._buf_fixture()
+        command.check(self.cfg)
+        assert "Autogenerate completed" not in buf.getvalue().decode("ascii")
+
+    def test_profile_command_line(self):
+        cmd = config.CommandLine()
+        options = cmd.parser.parse_args(["check", "--profile"])
+        is_true(options.profile)
+        options = cmd.parser.parse_args(["check"])
+        is_false(options.profile)
+        options = cmd.parser.parse_args(
+            ["revision", "--autogenerate", "--profile", "out.json"]
+        )
+        eq_(options.profile, "out.json")
+
+
+class StreamedRevisionTest(TestBase):
+    def setUp(self):
+        self.env = staging_env()
+        self.cfg = _sqlite_testing_config()
+        self.bind = _sqlite_file_db()
+        with self.bind.begin() as conn:
+            conn.execute(
+                text(
+                    "create table mod (id integer not null primary key, "
+                    "x integer, old_col varchar(20))"
+                )
+            )
+            conn.execute(text("create table old (id integer, y integer)"))
+            conn.execute(text("create index ix_old_y on old (y)"))
+        self.cfg.attributes["render_as_batch"] = False
+        env_file_fixture("""
+
+from sqlalchemy import Column, ForeignKey, Index, Integer, MetaData, String
+from sqlalchemy import Table, engine_from_config
+target_metadata = MetaData()
+Table(
+    "mod",
+    target_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("x", String(50), nullable=False),
+    Column("new_col", Integer, comment="d\u00e9j\u00e0 vu"),
+    Index("ix_mod_x", "x"),
+)
+Table(
+    "new",
+    target_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("mod_id", ForeignKey("mod.id")),
+    Index("ix_new_mod_id", "mod_id"),
+)
+
+engine = engine_from_config(
+    config.get_section(config.config_ini_section),
+    prefix='sqlalchemy.'
+)
+
+with engine.connect() as connection:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        render_as_batch=config.attributes["render_as_batch"],
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+engine.dispose()
+
+""")
+
+    def tearDown(self):
+        self.bind.dispose()
+        clear_staging_env()
+
+    def _revision_text(self, rev_id, **kw):
+        script = command.revision(
+            self.cfg, message="m", autogenerate=True, rev_id=rev_id, **kw
+        )
+        with open(script.path, encoding="utf-8") as file_:
+            content = file_.read()
+        os.remove(script.path)
+        return re.sub(r"Create Date: .*", "", content.replace(rev_id, "REV"))
+
+    @testing.combinations((False,), (True,), argnames="render_as_batch")
+    def test_streamed_matches_collected(self, render_as_batch):
+        self.cfg.attributes["render_as_batch"] = render_as_batch
+        collected = self._revision_text("aaa")
+        streamed = self._revision_text("bbb", stream=True)
+        eq_(streamed, collected)
+        assert "op.create_table('new'" in streamed
+        assert "op.drop_table('old')" in streamed
+        assert "ix_mod_x" in streamed
+
+    def test_streamed_no_changes(self):
+        self.cfg.attributes["render_as_batch"] = True
+        command.revision(self.cfg, autogenerate=True, stream=True)
+        command.upgrade(self.cfg, "head")
+
+        collected = self._revision_text("aaa")
+        streamed = self._revision_text("bbb", stream=True)
+        eq_(streamed, collected)
+        assert "pass" in streamed
+
+    def test_streamed_with_process_revision_directives(self):
+        def process_revision_directives(context, rev, directives):
+            pass
+
+        with expect_raises_message(
+            util.CommandError,
+            "Streamed autogenerate can't be used with "
+            "process_revision_directives",
+        ):
+            command.revision(
+                self.cfg,
+                autogenerate=True,
+                stream=True,
+                process_revision_directives=process_revision_directives,
+            )
+
+    def test_stream_command_line(self):
+        cmd = config.CommandLine()
+        options = cmd.parser.parse_args(
+            ["revision", "--autogenerate", "--stream"]
+        )
+        is_true(options.stream)
+
+
+class IncrementalAutogenTest(TestBase):
+    def setUp(self):
+        self.env = staging_env()
+        self.cfg = _sqlite_testing_config()
+        self.cfg.set_main_option("autogenerate_incremental", "true")
+        self.bind = _sqlite_file_db()
+        self.metadata = MetaData()
+        Table("foo", self.metadata, Column("id", Integer, primary_key=True))
+        Table("bar", self.metadata, Column("id", Integer, primary_key=True))
+        self.cfg.attributes["target_metadata"] = self.metadata
+        env_file_fixture("""
+
+from sqlalchemy import engine_from_config
+
+engine = engine_from_config(
+    config.get_section(config.config_ini_section),
+    prefix='sqlalchemy.'
+)
+
+with engine.connect() as connection:
+    context.configure(
+        connection=connection,
+        target_metadata=config.attributes["target_metadata"],
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+engine.dispose()
+
+""")
+
+    def tearDown(self):
+        self.bind.dispose()
+        clear_staging_env()
+
+    @contextmanager
+    def _track_reflection(self):
+        from sqlalchemy.engine.reflection import Inspector
+
+        reflected = []
+        with mock.patch.object(
+            Inspector,
+            "reflect_table",
+            autospec=True,
+            side_effect=Inspector.reflect_table,
+        ) as patched:
+            yield reflected
+        reflected.extend(call[0][1].name for call in patched.call_args_list)
+
+    def _revision(self, message):
+        collected = []
+
+        def process_revision_directives(context, rev, directives):
+            collected.extend(directives[0].upgrade_ops.ops)
+
+        script = command.revision(
+            self.cfg,
+            message=message,
+            autogenerate=True,
+            process_revision_directives=process_revision_directives,
+        )
+        command.upgrade(self.cfg, "head")
+        return script, collected
+
+    def test_fingerprints_written(self):
+        script, _ = self._revision("r1")
+        path = fingerprint_path(script.path)
+        is_true(os.path.exists(path))
+        eq_(set(read_fingerprints(script.path)["upgrades"]), {"foo", "bar"})
+
+    def test_only_changed_tables_compared(self):
+        self._revision("r1")
+
+        self.metadata.tables["bar"].append_column(Column("data", Integer))
+        Table("bat", self.metadata, Column("id", Integer, primary_key=True))
+        with self.bind.begin() as conn:
+            conn.execute(
+                text("create table extra (id integer not null primary key)")
+            )
+
+        with self._track_reflection() as reflected:
+            _, upgrade_ops = self._revision("r2")
+        eq_(sorted(reflected), ["bar", "extra"])
+        eq_(
+            sorted(
+                (op.__class__.__name__, getattr(op, "table_name", None))
+                for op in upgrade_ops
+            ),
+            [
+                ("CreateTableOp", "bat"),
+                ("DropTableOp", "extra"),
+                ("ModifyTableOps", "bar"),
+            ],
+        )
+
+        # the fingerprints of the new revision reflect the changes
+        with self._track_reflection() as reflected:
+            _, upgrade_ops = self._revision("r3")
+        eq_(reflected, [])
+        eq_(upgrade_ops, [])
+
+    def test_not_incremental(self):
+        self._revision("r1")
+        self.cfg.set_main_option("autogenerate_incremental", "false")
+
+        with self._track_reflection() as reflected:
+            script, _ = self._revision("r2")
+        eq_(sorted(reflected), ["bar", "foo"])
+        is_false(os.path.exists(fingerprint_path(script.path)))
+
+
 class _StampTest:
     def _assert_sql(self, emitted_sql, origin, destinations):
         ins_expr = (
@@ -864,7 +1322,7 @@ class StampMultipleHeadsTest(TestBase, _StampTest):
         self._assert_sql(buf.getvalue(), None, {self.a, self.e, self.f})
 
     def test_online_stamp_multi_rev_nonsensical(self):
-        with capture_engine_context_buffer() as buf:
+        with capture_engine_context_buffer(render_bind_params=True) as buf:
             command.stamp(self.cfg, [self.a, self.e, self.f])
 
         # TODO: this shouldn't be possible, because e/f require b as a
@@ -873,14 +1331,14 @@ class StampMultipleHeadsTest(TestBase, _StampTest):
 
     def test_online_stamp_multi_rev_from_real_ancestor(self):
         command.stamp(self.cfg, [self.a])
-        with capture_engine_context_buffer() as buf:
+        with capture_engine_context_buffer(render_bind_params=True) as buf:
             command.stamp(self.cfg, [self.e, self.f])
 
         self._assert_sql(buf.getvalue(), self.a, {self.e, self.f})
 
     def test_online_stamp_version_already_there(self):
         command.stamp(self.cfg, [self.c, self.e])
-        with capture_engine_context_buffer() as buf:
+        with capture_engine_context_buffer(render_bind_params=True) as buf:
             command.stamp(self.cfg, [self.c, self.e])
         self._assert_sql(buf.getvalue(), None, {})
 
@@ -925,7 +1383,7 @@ class StampMultipleHeadsTest(TestBase, _StampTest):
             )
             eq_(result.rowcount, 1)
 
-        with capture_engine_context_buffer() as buf:
+        with capture_engine_context_buffer(render_bind_params=True) as buf:
             command.stamp(self.cfg, [self.a, self.e, self.f], purge=True)
 
         self._assert_sql(buf.getvalue(), None, {self.a, self.e, self.f})
@@ -402,3 +402,64 @@ class PriorityDispatcherTest(TestBase):
         fn = dispatcher.dispatch("target1")
         fn()
         eq_(results, ["none", "other"])
+
+    def test_qualifier_order_within_priority(self):
+        """Test that priority takes precedence over qualifier."""
+        dispatcher = PriorityDispatcher()
+        results = []
+
+        @dispatcher.dispatch_for("target1", priority=DispatchPriority.LAST)
+        def handler_default_last():
+            results.append("default_last")
+
+        @dispatcher.dispatch_for(
+            "target1", priority=DispatchPriority.LAST, qualifier="sqlite"
+        )
+        def handler_sqlite_last():
+            results.append("sqlite_last")
+
+        @dispatcher.dispatch_for("target1", priority=DispatchPriority.FIRST)
+        def handler_default_first():
+            results.append("default_first")
+
+        dispatcher.dispatch("target1", qualifier="sqlite")()
+        eq_(results, ["default_first", "sqlite_last", "default_last"])
+
+    def test_registration_after_dispatch(self):
+        """Test that a function registered after the dispatch plan was
+        built is invoked, including by a previously returned callable."""
+        dispatcher = PriorityDispatcher()
+        results = []
+
+        @dispatcher.dispatch_for("target1")
+        def handler1():
+            results.append("handler1")
+
+        fn = dispatcher.dispatch("target1")
+        fn()
+        eq_(results, ["handler1"])
+
+        @dispatcher.dispatch_for("target1", priority=DispatchPriority.FIRST)
+        def handler2():
+            results.append("handler2")
+
+        fn()
+        eq_(results, ["handler1", "handler2", "handler1"])
+
+    def test_populate_with_after_dispatch(self):
+        """Test that populate_with invalidates the dispatch plan."""
+        dispatcher1 = PriorityDispatcher()
+        results = []
+
+        @dispatcher1.dispatch_for("target1")
+        def handler1():
+            results.append("handler1")
+
+        dispatcher2 = PriorityDispatcher()
+        fn = dispatcher2.dispatch("target1")
+        fn()
+        eq_(results, [])
+
+        dispatcher2.populate_with(dispatcher1)
+        fn()
+        eq_(results, ["handler1"])
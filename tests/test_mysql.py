@@ -558,6 +558,188 @@ class MySQLOpTest(TestBase):
             existing_server_default=esd(),
         )
 
+    def test_coalesce_alter_table(self):
+        context = op_fixture("mysql", coalesce_alter_table=True)
+        op.add_column("t", Column("q", Integer))
+        op.alter_column("t", "c1", nullable=False, existing_type=Integer)
+        op.alter_column("t", "c2", new_column_name="c3", existing_type=Integer)
+        op.drop_column("t", "c4")
+        op.create_foreign_key("fk_q", "t", "t2", ["q"], ["id"])
+        context.assert_()
+
+        context.impl.flush_alter_table()
+        context.assert_(
+            "ALTER TABLE t ADD COLUMN q INTEGER, "
+            "MODIFY c1 INTEGER NOT NULL, "
+            "CHANGE c2 c3 INTEGER NULL, "
+            "DROP COLUMN c4, "
+            "ADD CONSTRAINT fk_q FOREIGN KEY(q) REFERENCES t2 (id)"
+        )
+
+    def test_coalesce_alter_table_flushed_per_table(self):
+        context = op_fixture("mysql", coalesce_alter_table=True)
+        op.add_column("t", Column("q", Integer))
+        op.drop_column("t", "c4")
+        op.add_column("t2", Column("q", Integer))
+        op.execute("UPDATE t2 SET q=1")
+        op.drop_column("t2", "c4")
+        context.impl.flush_alter_table()
+        context.assert_(
+            "ALTER TABLE t ADD COLUMN q INTEGER, DROP COLUMN c4",
+            "ALTER TABLE t2 ADD COLUMN q INTEGER",
+            "UPDATE t2 SET q=1",
+            "ALTER TABLE t2 DROP COLUMN c4",
+        )
+
+    def test_coalesce_alter_table_same_column(self):
+        context = op_fixture("mysql", coalesce_alter_table=True)
+        op.add_column("t", Column("q", Integer))
+        op.alter_column("t", "q", nullable=False, existing_type=Integer)
+        op.drop_constraint("fk_q", "t", type_="foreignkey")
+        op.create_foreign_key("fk_q", "t", "t2", ["q"], ["id"])
+        context.impl.flush_alter_table()
+        context.assert_(
+            "ALTER TABLE t ADD COLUMN q INTEGER",
+            "ALTER TABLE t MODIFY q INTEGER NOT NULL, "
+            "DROP FOREIGN KEY fk_q",
+            "ALTER TABLE t ADD CONSTRAINT fk_q FOREIGN KEY(q) "
+            "REFERENCES t2 (id)",
+        )
+
+    def test_no_coalesce_alter_table(self):
+        context = op_fixture("mysql")
+        op.add_column("t", Column("q", Integer))
+        op.drop_column("t", "c4")
+        context.assert_(
+            "ALTER TABLE t ADD COLUMN q INTEGER",
+            "ALTER TABLE t DROP COLUMN c4",
+        )
+
+    @combinations(
+        (
+            lambda: op.add_column("t", Column("q", Integer)),
+            "ALTER TABLE t ADD COLUMN q INTEGER, ALGORITHM=INSTANT",
+        ),
+        (
+            lambda: op.drop_column("t", "q"),
+            "ALTER TABLE t DROP COLUMN q, ALGORITHM=INSTANT",
+        ),
+        (
+            lambda: op.alter_column("t", "q", server_default="5"),
+            "ALTER TABLE t ALTER COLUMN q SET DEFAULT '5', "
+            "ALGORITHM=INSTANT",
+        ),
+        (
+            lambda: op.alter_column(
+                "t", "q", new_column_name="r", existing_type=Integer
+            ),
+            "ALTER TABLE t CHANGE q r INTEGER NULL, ALGORITHM=INSTANT",
+        ),
+        (
+            lambda: op.alter_column(
+                "t", "q", nullable=False, existing_type=Integer
+            ),
+            "ALTER TABLE t MODIFY q INTEGER NOT NULL, "
+            "ALGORITHM=INPLACE, LOCK=NONE",
+        ),
+        (
+            lambda: op.create_index("ix_q", "t", ["q"]),
+            "CREATE INDEX ix_q ON t (q) ALGORITHM=INPLACE LOCK=NONE",
+        ),
+        (
+            lambda: op.drop_index("ix_q", "t"),
+            "DROP INDEX ix_q ON t ALGORITHM=INPLACE LOCK=NONE",
+        ),
+        (
+            lambda: op.drop_constraint("fk_q", "t", type_="foreignkey"),
+            "ALTER TABLE t DROP FOREIGN KEY fk_q, "
+            "ALGORITHM=INPLACE, LOCK=NONE",
+        ),
+        (
+            lambda: op.create_table("t2", Column("q", Integer)),
+            "CREATE TABLE t2 (q INTEGER)",
+        ),
+        argnames="fn, expected",
+    )
+    def test_online_ddl(self, fn, expected):
+        context = op_fixture(
+            "mysql", context_opts={"mysql_online_ddl": "instant"}
+        )
+        fn()
+        context.assert_(expected)
+
+    def test_online_ddl_inplace(self):
+        context = op_fixture(
+            "mysql", context_opts={"mysql_online_ddl": "inplace"}
+        )
+        op.add_column("t", Column("q", Integer))
+        context.assert_(
+            "ALTER TABLE t ADD COLUMN q INTEGER, ALGORITHM=INPLACE, LOCK=NONE"
+        )
+
+    @combinations(((8, 0, 28), "INPLACE, LOCK=NONE"), ((8, 0, 29), "INSTANT"))
+    def test_online_ddl_server_version(self, version, algorithm):
+        context = op_fixture(
+            "mysql", context_opts={"mysql_online_ddl": "instant"}
+        )
+        context.dialect.server_version_info = version
+        op.drop_column("t", "q")
+        context.assert_(
+            "ALTER TABLE t DROP COLUMN q, ALGORITHM=%s" % algorithm
+        )
+
+    def test_online_ddl_copy_raises(self):
+        op_fixture("mysql", context_opts={"mysql_online_ddl": "instant"})
+        assert_raises_message(
+            util.CommandError,
+            "Statement can't be performed with ALGORITHM=INSTANT or "
+            "ALGORITHM=INPLACE, LOCK=NONE, as it requires the table to be "
+            "copied or locked: ALTER TABLE t MODIFY q VARCHAR",
+            op.alter_column,
+            "t",
+            "q",
+            type_=String(20),
+            existing_type=Integer,
+        )
+
+    def test_online_ddl_copy_fallback(self):
+        context = op_fixture(
+            "mysql",
+            context_opts={
+                "mysql_online_ddl": "instant",
+                "mysql_online_ddl_fallback": True,
+            },
+        )
+        op.create_foreign_key("fk_q", "t", "t2", ["q"], ["id"])
+        context.assert_(
+            "ALTER TABLE t ADD CONSTRAINT fk_q FOREIGN KEY(q) "
+            "REFERENCES t2 (id)"
+        )
+
+    def test_online_ddl_coalesced(self):
+        context = op_fixture(
+            "mysql",
+            coalesce_alter_table=True,
+            context_opts={"mysql_online_ddl": "instant"},
+        )
+        op.add_column("t", Column("q", Integer))
+        op.alter_column("t", "c1", nullable=False, existing_type=Integer)
+        context.impl.flush_alter_table()
+        context.assert_(
+            "ALTER TABLE t ADD COLUMN q INTEGER, MODIFY c1 INTEGER NOT NULL, "
+            "ALGORITHM=INPLACE, LOCK=NONE"
+        )
+
+    def test_online_ddl_invalid(self):
+        assert_raises_message(
+            util.CommandError,
+            "mysql_online_ddl must be one of 'instant' or 'inplace'; "
+            "got 'nonblocking'",
+            op_fixture,
+            "mysql",
+            context_opts={"mysql_online_ddl": "nonblocking"},
+        )
+
 
 class MySQLBackendOpTest(AlterColRoundTripFixture, TestBase):
     __only_on__ = "mysql", "mariadb"
@@ -1,14 +1,18 @@
+import io
 import re
 
 from alembic import command
 from alembic import util
+from alembic.script import ScriptDirectory
 from alembic.testing import assert_raises_message
+from alembic.testing import eq_
 from alembic.testing.env import _no_sql_testing_config
 from alembic.testing.env import clear_staging_env
 from alembic.testing.env import env_file_fixture
 from alembic.testing.env import multi_heads_fixture
 from alembic.testing.env import staging_env
 from alembic.testing.env import three_rev_fixture
+from alembic.testing.env import write_script
 from alembic.testing.fixtures import capture_context_buffer
 from alembic.testing.fixtures import TestBase
 
@@ -256,3 +260,46 @@ context.run_migrations()
         command.upgrade(self.cfg, "%s:%s" % (a, b[0:4]), sql=True)
         command.stamp(self.cfg, b[0:4], sql=True)
         command.downgrade(self.cfg, "%s:%s" % (c, b[0:4]), sql=True)
+
+    def test_coalesced_alter_table_flushed_per_migration(self):
+        env_file_fixture("""
+context.configure(
+    dialect_name='postgresql',
+    coalesce_alter_table=True,
+    output_buffer=config.attributes["buf"],
+)
+context.run_migrations()
+""")
+        d = command.revision(self.cfg, message="d", head=c)
+        write_script(
+            ScriptDirectory.from_config(self.cfg),
+            d.revision,
+            f"""\
+revision = '{d.revision}'
+down_revision = '{c}'
+
+from alembic import op
+import sqlalchemy as sa
+
+
+def upgrade():
+    op.add_column("t", sa.Column("x", sa.Integer))
+    op.add_column("t", sa.Column("y", sa.Integer))
+
+
+def downgrade():
+    pass
+
+""",
+        )
+        self.cfg.attributes["buf"] = buf = io.StringIO()
+        command.upgrade(self.cfg, "%s:%s" % (c, d.revision), sql=True)
+        eq_(
+            re.findall(
+                r"ALTER TABLE.*|UPDATE alembic_version", buf.getvalue()
+            ),
+            [
+                "ALTER TABLE t ADD COLUMN x INTEGER, ADD COLUMN y INTEGER;",
+                "UPDATE alembic_version",
+            ],
+        )
@@ -5,6 +5,7 @@ from sqlalchemy import Boolean
 from sqlalchemy import Column
 from sqlalchemy import Computed
 from sqlalchemy import DateTime
+from sqlalchemy import event
 from sqlalchemy import exc
 from sqlalchemy import Float
 from sqlalchemy import func
@@ -42,6 +43,7 @@ from alembic import util
 from alembic.autogenerate import api
 from alembic.autogenerate.compare.tables import _compare_tables
 from alembic.migration import MigrationContext
+from alembic.operations import Operations
 from alembic.operations import ops
 from alembic.script import ScriptDirectory
 from alembic.testing import assert_raises_message
@@ -49,6 +51,7 @@ from alembic.testing import combinations
 from alembic.testing import config
 from alembic.testing import eq_
 from alembic.testing import eq_ignore_whitespace
+from alembic.testing import mock
 from alembic.testing import provide_metadata
 from alembic.testing import resolve_lambda
 from alembic.testing import schemacompare
@@ -495,6 +498,167 @@ class PostgresqlOpTest(TestBase):
         )
         context.assert_("ALTER TABLE t1 ALTER COLUMN some_column %s" % text)
 
+    def test_coalesce_alter_table(self):
+        context = op_fixture("postgresql", coalesce_alter_table=True)
+        op.add_column("t", Column("q", Integer, comment="q comment"))
+        op.alter_column("t", "c1", type_=Integer, nullable=False)
+        op.alter_column("t", "c2", server_default="5")
+        op.drop_column("t", "c3")
+        op.create_foreign_key("fk_q", "t", "t2", ["q"], ["id"])
+        op.alter_column("t", "c4", new_column_name="c5")
+        context.assert_(
+            "ALTER TABLE t ADD COLUMN q INTEGER",
+            "COMMENT ON COLUMN t.q IS 'q comment'",
+            "ALTER TABLE t ALTER COLUMN c1 TYPE INTEGER",
+            "ALTER TABLE t ALTER COLUMN c1 SET NOT NULL, "
+            "ALTER COLUMN c2 SET DEFAULT '5', DROP COLUMN c3, "
+            "ADD CONSTRAINT fk_q FOREIGN KEY(q) REFERENCES t2 (id)",
+            "ALTER TABLE t RENAME c4 TO c5",
+        )
+
+    def test_create_indexes_concurrently_as_sql(self):
+        context = op_fixture("postgresql", as_sql=True)
+        op.create_indexes_concurrently(
+            [
+                ops.CreateIndexOp("ix_t1_x", "t1", ["x"]),
+                ops.CreateIndexOp(
+                    "ix_t2_y", "t2", ["y"], schema="s", unique=True
+                ),
+            ],
+            workers=2,
+        )
+        context.assert_(
+            "COMMIT",
+            "CREATE INDEX CONCURRENTLY ix_t1_x ON t1 (x)",
+            "CREATE UNIQUE INDEX CONCURRENTLY ix_t2_y ON s.t2 (y)",
+            "BEGIN",
+        )
+
+    def test_create_indexes_concurrently_not_postgresql(self):
+        op_fixture("sqlite")
+        assert_raises_message(
+            NotImplementedError,
+            "create_indexes_concurrently is only supported on PostgreSQL",
+            op.create_indexes_concurrently,
+            [ops.CreateIndexOp("ix_t1_x", "t1", ["x"])],
+        )
+
+
+class PGConcurrentIndexTest(TestBase):
+    __only_on__ = "postgresql"
+    __backend__ = True
+
+    def setUp(self):
+        self.conn = conn = config.db.connect()
+
+        with conn.begin():
+            conn.execute(text("CREATE TABLE ci_t (x INTEGER, y INTEGER)"))
+            conn.execute(text("INSERT INTO ci_t (x, y) VALUES (1, 1), (1, 2)"))
+
+    def tearDown(self):
+        with self.conn.begin():
+            self.conn.execute(text("DROP TABLE ci_t"))
+        self.conn.close()
+
+    def _index_valid(self):
+        with self.conn.begin():
+            return dict(
+                self.conn.execute(
+                    text(
+                        "SELECT c.relname, i.indisvalid FROM pg_index i "
+                        "JOIN pg_class c ON c.oid = i.indexrelid "
+                        "WHERE i.indrelid = 'ci_t'::regclass"
+                    )
+                ).all()
+            )
+
+    def test_create_indexes(self, migration_context):
+        with migration_context.begin_transaction(_per_migration=True):
+            Operations(migration_context).create_indexes_concurrently(
+                [
+                    ops.CreateIndexOp("ix_ci_x", "ci_t", ["x"]),
+                    ops.CreateIndexOp("ix_ci_y", "ci_t", ["y"]),
+                ],
+                workers=2,
+            )
+        eq_(self._index_valid(), {"ix_ci_x": True, "ix_ci_y": True})
+
+    def test_resume_skips_valid_index(self, migration_context):
+        with self.conn.begin():
+            self.conn.execute(text("CREATE INDEX ix_ci_x ON ci_t (x, y)"))
+
+        with migration_context.begin_transaction(_per_migration=True):
+            Operations(migration_context).create_indexes_concurrently(
+                [
+                    ops.CreateIndexOp("ix_ci_x", "ci_t", ["x"]),
+                    ops.CreateIndexOp("ix_ci_y", "ci_t", ["y"]),
+                ]
+            )
+        eq_(self._index_valid(), {"ix_ci_x": True, "ix_ci_y": True})
+
+    def test_invalid_index_raises(self, migration_context):
+        with migration_context.begin_transaction(_per_migration=True):
+            assert_raises_message(
+                exc.IntegrityError,
+                "could not create unique index",
+                Operations(migration_context).create_indexes_concurrently,
+                [ops.CreateIndexOp("ix_ci_x", "ci_t", ["x"], unique=True)],
+            )
+
+        # the invalid index left behind is dropped before each attempt
+        eq_(self._index_valid(), {"ix_ci_x": False})
+        with self.conn.begin():
+            self.conn.execute(text("DELETE FROM ci_t WHERE y = 2"))
+
+        with migration_context.begin_transaction(_per_migration=True):
+            Operations(migration_context).create_indexes_concurrently(
+                [ops.CreateIndexOp("ix_ci_x", "ci_t", ["x"], unique=True)],
+            )
+        eq_(self._index_valid(), {"ix_ci_x": True})
+
+    def test_search_path(self, connection):
+        with self.conn.begin():
+            self.conn.execute(text("CREATE SCHEMA ci_s"))
+            self.conn.execute(text("CREATE TABLE ci_s.ci_s_t (x INTEGER)"))
+
+        try:
+            connection.execute(text("SET search_path TO ci_s, public"))
+            connection.commit()
+            context = MigrationContext.configure(
+                connection, opts=dict(transaction_per_migration=True)
+            )
+            with context.begin_transaction(_per_migration=True):
+                Operations(context).create_indexes_concurrently(
+                    [ops.CreateIndexOp("ix_ci_s_x", "ci_s_t", ["x"])]
+                )
+            with self.conn.begin():
+                eq_(
+                    self.conn.scalar(
+                        text(
+                            "SELECT i.indisvalid FROM pg_index i "
+                            "JOIN pg_class c ON c.oid = i.indexrelid "
+                            "JOIN pg_namespace n "
+                            "ON n.oid = c.relnamespace "
+                            "WHERE c.relname = 'ix_ci_s_x' "
+                            "AND n.nspname = 'ci_s'"
+                        )
+                    ),
+                    True,
+                )
+
+            # the worker connections are returned to the pool with their
+            # own search_path
+            with config.db.connect() as conn:
+                assert "ci_s" not in conn.scalar(
+                    text("SELECT current_setting('search_path')")
+                )
+        finally:
+            connection.rollback()
+            connection.execute(text("RESET search_path"))
+            connection.commit()
+            with self.conn.begin():
+                self.conn.execute(text("DROP SCHEMA ci_s CASCADE"))
+
 
 class PGAutocommitBlockTest(TestBase):
     __only_on__ = "postgresql"
@@ -659,6 +823,76 @@ class PostgresqlInlineLiteralTest(TablesTest):
         )
 
 
+class PostgresqlOfflineDefaultCompareTest(TestBase):
+    def _compare_default(self, type_, metadata_default, inspector_default):
+        t1 = Table(
+            "t1",
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("x", type_, server_default=metadata_default),
+        )
+        ctx = MigrationContext.configure(dialect_name="postgresql")
+        with mock.patch("alembic.ddl.postgresql.log") as log:
+            result = ctx.impl.compare_server_default(
+                Column("x", type_),
+                t1.c.x,
+                metadata_default,
+                inspector_default,
+            )
+        return result, log.mock_calls
+
+    def test_typed_literal_not_different(self):
+        result, log_calls = self._compare_default(Integer, "0", "'0'::integer")
+        eq_(result, False)
+        eq_(len(log_calls), 1)
+        eq_(
+            log_calls[0][1][0] % log_calls[0][1][1:],
+            "Skipping comparison of server default \"'0'::integer\" to '0' "
+            "on column 't1.x' as there is no database connection",
+        )
+
+    def test_equal_not_logged(self):
+        result, log_calls = self._compare_default(
+            String(8), "'hi'::character varying", "'hi'::character varying"
+        )
+        eq_(result, False)
+        eq_(log_calls, [])
+
+    def test_missing_default_different(self):
+        result, log_calls = self._compare_default(Integer, "0", None)
+        eq_(result, True)
+        eq_(log_calls, [])
+
+
+class PostgresqlPrepareDefaultCompareTest(TestBase):
+    @testing.combinations(True, False, argnames="in_transaction")
+    def test_batched_only_in_transaction(self, in_transaction):
+        t1 = Table(
+            "t1",
+            MetaData(),
+            Column("x", Integer, server_default="5"),
+            Column("y", Integer, server_default="6"),
+        )
+        ctx = MigrationContext.configure(dialect_name="postgresql")
+        conn = ctx.impl.connection = mock.MagicMock()
+        conn.in_transaction.return_value = in_transaction
+        conn.execute.return_value.one.return_value = (True, False)
+
+        ctx.impl.prepare_server_default_comparisons(
+            [
+                (Column("x", Integer), t1.c.x, "5", "'7'::integer"),
+                (Column("y", Integer), t1.c.y, "6", "'8'::integer"),
+            ]
+        )
+
+        eq_(conn.begin_nested.called, in_transaction)
+        eq_(conn.execute.called, in_transaction)
+        eq_(
+            sorted(ctx.impl._server_default_results.values()),
+            [False, True] if in_transaction else [],
+        )
+
+
 class PostgresqlDefaultCompareTest(TestBase):
     __only_on__ = "postgresql"
     __backend__ = True
@@ -749,6 +983,51 @@ class PostgresqlDefaultCompareTest(TestBase):
     def test_compare_string_nonblank_default(self):
         self._compare_default_roundtrip(String(8), "hi")
 
+    def test_compare_defaults_in_one_statement(self):
+        Table(
+            "test",
+            self.metadata,
+            Column("a", Integer, server_default=text("5")),
+            Column("b", String(10), server_default="x"),
+            Column("c", String(10), server_default="y"),
+            Column("d", Interval, server_default="14 days"),
+        )
+        self.metadata.create_all(self.bind)
+
+        m2 = MetaData()
+        Table(
+            "test",
+            m2,
+            Column("a", Integer, server_default=text("5")),
+            Column("b", String(10), server_default="x"),
+            Column("c", String(10), server_default="z"),
+            Column("d", Interval, server_default="14 days"),
+        )
+
+        statements = []
+
+        @event.listens_for(self.migration_context.connection, "before_execute")
+        def before_execute(conn, clauseelement, *arg):
+            statements.append(clauseelement)
+
+        diffs = [
+            diff
+            for diff in api.compare_metadata(self.migration_context, m2)
+            if diff[0][0] == "modify_default"
+        ]
+        eq_([diff[0][3] for diff in diffs], ["c"])
+
+        default_selects = [
+            stmt
+            for stmt in statements
+            if any(
+                getattr(col, "name", "").startswith("default_")
+                for col in getattr(stmt, "selected_columns", ())
+            )
+        ]
+        eq_(len(default_selects), 1)
+        eq_(len(default_selects[0].selected_columns), 3)
+
     def test_compare_interval_str(self):
         # this form shouldn't be used but testing here
         # for compatibility
@@ -1,5 +1,6 @@
 from sqlalchemy.testing import util as sqla_testing_util
 
+from alembic import testing
 from alembic.script.revision import CycleDetected
 from alembic.script.revision import DependencyCycleDetected
 from alembic.script.revision import DependencyLoopDetected
@@ -11,6 +12,10 @@ from alembic.script.revision import RevisionMap
 from alembic.testing import assert_raises_message
 from alembic.testing import eq_
 from alembic.testing import expect_raises_message
+from alembic.testing import is_
+from alembic.testing import is_false
+from alembic.testing import is_true
+from alembic.testing import mock
 from alembic.testing.fixtures import TestBase
 from . import _large_map
 
@@ -75,6 +80,75 @@ class APITest(TestBase):
         map_.add_revision(Revision("d1", ("c1",)))
         eq_(map_.heads, ("c2", "d1"))
 
+    def test_ancestor_index_only_for_tested_revisions(self):
+        map_ = RevisionMap(
+            lambda: [
+                Revision("a", ()),
+                Revision("b", ("a",)),
+                Revision("c1", ("b",)),
+                Revision("c2", ("b",)),
+                Revision("d", ("c1",)),
+            ]
+        )
+        is_true(
+            map_._is_ancestor_of(
+                map_.get_revision("a"), map_.get_revision("c1")
+            )
+        )
+        is_false(
+            map_._is_ancestor_of(
+                map_.get_revision("c2"), map_.get_revision("d")
+            )
+        )
+        eq_(set(map_._ancestor_index.ancestors), {"c1", "d"})
+        eq_(set(map_._ancestor_index.ordinals), {"a", "b", "c1", "d"})
+
+    def test_add_revision_resets_ancestor_index(self):
+        map_ = RevisionMap(
+            lambda: [
+                Revision("a", ()),
+                Revision("b", ("a",)),
+                Revision("c1", ("b",)),
+                Revision("c2", ("b",)),
+            ]
+        )
+        eq_(map_.filter_for_lineage(["c1", "c2"], "c1"), ("c1",))
+
+        map_.add_revision(Revision("d", ("c1", "c2")))
+        eq_(map_.filter_for_lineage(["c1", "c2"], "d"), ("c1", "c2"))
+        is_true(
+            map_._is_ancestor_of(
+                map_.get_revision("a"), map_.get_revision("d")
+            )
+        )
+
+    def test_revision_ids_interned(self):
+        a = Revision("".join(["a", "bc"]), ())
+        b = Revision("b", ("".join(["a", "bc"]),))
+        c = Revision("c", "b", dependencies="".join(["a", "bc"]))
+
+        is_(b.down_revision, a.revision)
+        is_(c.dependencies, a.revision)
+        assert not hasattr(a, "__dict__")
+
+    def test_nextrev_shared_with_all_nextrev(self):
+        map_ = RevisionMap(
+            lambda: [
+                Revision("a", ()),
+                Revision("b1", ("a",)),
+                Revision("b2", ("a",)),
+                Revision("c", ("b1",), dependencies="b2"),
+            ]
+        )
+        a, b1, b2 = map_.get_revisions(["a", "b1", "b2"])
+
+        eq_(a.nextrev, {"b1", "b2"})
+        is_(a.nextrev, a._all_nextrev)
+        eq_(b1.nextrev, {"c"})
+        is_(b1.nextrev, b1._all_nextrev)
+        eq_(b2.nextrev, frozenset())
+        eq_(b2._all_nextrev, {"c"})
+
     def test_get_revision_head_single(self):
         map_ = RevisionMap(
             lambda: [
@@ -203,6 +277,44 @@ class APITest(TestBase):
         eq_(repr(c), "Revision('c', None, dependencies=('a', 'b'))")
 
 
+class AncestorIndexTest:
+    @testing.combinations((True,), (False,), argnames="include_dependencies")
+    def test_ancestor_index(self, include_dependencies):
+        revs = [r for r in self.map._revision_map.values() if r is not None]
+
+        for rev in revs:
+            ancestors = set(
+                self.map._get_ancestor_nodes(
+                    [rev], include_dependencies=include_dependencies
+                )
+            )
+            descendants = set(
+                self.map._get_descendant_nodes(
+                    [rev], include_dependencies=include_dependencies
+                )
+            )
+            eq_(
+                {
+                    other
+                    for other in revs
+                    if self.map._is_ancestor_of(
+                        other, rev, include_dependencies
+                    )
+                },
+                ancestors,
+            )
+            eq_(
+                {
+                    other
+                    for other in revs
+                    if self.map._is_ancestor_of(
+                        rev, other, include_dependencies
+                    )
+                },
+                descendants,
+            )
+
+
 class DownIterateTest(TestBase):
     def _assert_iteration(
         self,
@@ -983,7 +1095,7 @@ class MultipleBaseTest(DownIterateTest):
         )
 
 
-class MultipleBaseCrossDependencyTestOne(DownIterateTest):
+class MultipleBaseCrossDependencyTestOne(AncestorIndexTest, DownIterateTest):
     def setUp(self):
         """
         Structure::
@@ -1277,7 +1389,7 @@ class MultipleBaseCrossDependencyTestThree(DownIterateTest):
         )
 
 
-class LargeMapTest(DownIterateTest):
+class LargeMapTest(AncestorIndexTest, DownIterateTest):
     def setUp(self):
         self.map = _large_map.map_
 
@@ -1302,6 +1414,24 @@ class LargeMapTest(DownIterateTest):
             if remaining:
                 assert remaining.intersection(ancestors)
 
+    def test_sort_walks_ancestors_once(self):
+        revisions, heads = self.map._collect_upgrade_revisions(
+            "heads",
+            None,
+            inclusive=False,
+            implicit_base=False,
+            assert_relative_length=True,
+        )
+        with mock.patch.object(
+            self.map,
+            "_get_ancestor_nodes",
+            wraps=self.map._get_ancestor_nodes,
+        ) as get_ancestor_nodes:
+            output = self.map._topological_sort(revisions, heads)
+
+        eq_(len(output), len(revisions))
+        eq_(get_ancestor_nodes.call_count, 1)
+
 
 class DepResolutionFailedTest(DownIterateTest):
     def setUp(self):
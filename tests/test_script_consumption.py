@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+import json
 import os
 import re
 import shutil
 import textwrap
+import threading
 
 import sqlalchemy as sa
 from sqlalchemy import pool
@@ -15,11 +17,14 @@ from alembic import util
 from alembic.config import Config
 from alembic.environment import EnvironmentContext
 from alembic.script import Script
+from alembic.script import _headers
 from alembic.script import ScriptDirectory
 from alembic.testing import assert_raises_message
 from alembic.testing import assertions
 from alembic.testing import eq_
 from alembic.testing import expect_raises_message
+from alembic.testing import expect_warnings
+from alembic.testing import is_
 from alembic.testing import mock
 from alembic.testing.env import _get_staging_directory
 from alembic.testing.env import _multi_dir_testing_config
@@ -1367,3 +1372,326 @@ class ScriptDirectoryMethodsTest(TestBase):
             depends_on_fixture.get_heads(consider_depends_on=False),
             depends_on_fixture.get_heads(),
         )
+
+
+class RevisionCacheFileTest(TestBase):
+    def setUp(self):
+        self.env = staging_env()
+        self.cfg = _sqlite_testing_config()
+        self.cache_file = os.path.join(
+            _get_staging_directory(), "revision_cache.json"
+        )
+        self.cfg.set_main_option("revision_cache_file", self.cache_file)
+        self.a, self.b, self.c = three_rev_fixture(self.cfg)
+
+    def tearDown(self):
+        clear_staging_env()
+
+    def _script_directory(self):
+        script = ScriptDirectory.from_config(self.cfg)
+        script.revision_map.heads
+        return script
+
+    def test_cache_written(self):
+        eq_(os.path.exists(self.cache_file), False)
+        self._script_directory()
+        eq_(os.path.exists(self.cache_file), True)
+
+    def test_no_modules_loaded_from_cache(self):
+        def _summary(script):
+            return [
+                (rev.revision, rev.down_revision, rev.longdoc)
+                for rev in script.walk_revisions()
+            ]
+
+        uncached = ScriptDirectory.from_config(
+            Config(self.cfg.config_file_name)
+        )
+        assert uncached.revision_cache_file is None
+        expected = _summary(uncached)
+
+        self._script_directory()
+
+        with (
+            mock.patch(
+                "alembic.util.load_python_file",
+                side_effect=AssertionError("module was loaded"),
+            ),
+            mock.patch(
+                "alembic.script._headers.parse_header",
+                side_effect=AssertionError("file was parsed"),
+            ),
+        ):
+            script = self._script_directory()
+            eq_(script.get_heads(), [self.c])
+            eq_(_summary(script), expected)
+
+    def test_module_loaded_on_access(self):
+        self._script_directory()
+        script = self._script_directory()
+        rev = script.get_revision(self.b)
+        assert rev._module is None
+        assert callable(rev.module.upgrade)
+        eq_(rev.module.revision, self.b)
+
+    def test_upgrade_from_cache(self):
+        self._script_directory()
+        with capture_context_buffer() as buf:
+            command.upgrade(self.cfg, self.c, sql=True)
+        assert "CREATE STEP 3" in buf.getvalue()
+
+    def test_changed_file_is_reloaded(self):
+        script = self._script_directory()
+        write_script(
+            script,
+            self.c,
+            f"""\
+"Rev C, changed"
+revision = '{self.c}'
+down_revision = '{self.b}'
+""",
+        )
+        script = self._script_directory()
+        eq_(script.get_revision(self.c).doc, "Rev C, changed")
+
+        with open(self.cache_file) as file_:
+            entries = json.load(file_)["entries"]
+        eq_(entries[script.get_revision(self.c).path]["doc"], "Rev C, changed")
+
+    def test_removed_file_is_pruned(self):
+        script = self._script_directory()
+        os.unlink(script.get_revision(self.c).path)
+        script = self._script_directory()
+        eq_(script.get_heads(), [self.b])
+
+        with open(self.cache_file) as file_:
+            entries = json.load(file_)["entries"]
+        eq_(
+            sorted(entry["revision"] for entry in entries.values()),
+            sorted([self.a, self.b]),
+        )
+
+    def test_corrupt_cache_file(self):
+        with open(self.cache_file, "w") as file_:
+            file_.write("not json")
+        with expect_warnings("Could not read revision cache file"):
+            script = self._script_directory()
+        eq_(script.get_heads(), [self.c])
+        script = self._script_directory()
+        eq_(script.get_heads(), [self.c])
+
+
+class RevisionHeaderParseTest(TestBase):
+    def setUp(self):
+        self.env = staging_env()
+        self.cfg = _sqlite_testing_config()
+
+    def tearDown(self):
+        clear_staging_env()
+
+    def _write(self, content, name="rev.py"):
+        path = os.path.join(self.env.versions, name)
+        with open(path, "w", encoding="utf-8") as file_:
+            file_.write(textwrap.dedent(content))
+        return path
+
+    def test_literal_header(self):
+        path = self._write('''\
+            """Some message
+
+            Revision ID: abc
+            """
+            from typing import Sequence, Union
+
+            revision: str = "abc"
+            down_revision: Union[str, Sequence[str], None] = ("x", "y")
+            branch_labels: Union[str, Sequence[str], None] = ["lbl"]
+            depends_on = None
+            ''')
+        eq_(
+            _headers.parse_header(path),
+            _headers.RevisionHeader(
+                "abc",
+                ("x", "y"),
+                ("lbl",),
+                None,
+                "Some message\n\nRevision ID: abc",
+            ),
+        )
+
+    def test_doc_matches_module(self):
+        a, b, c = three_rev_fixture(self.cfg)
+        script = ScriptDirectory.from_config(self.cfg)
+        for rev in script.walk_revisions():
+            eq_(
+                _headers.parse_header(rev.path).doc,
+                _headers._module_doc(rev.module),
+            )
+
+    @testing.combinations(
+        ("down_revision = compute()",),
+        ("if True:\n    down_revision = 'q'",),
+        ("from elsewhere import depends_on",),
+        ("for revision in ['a']:\n    pass",),
+        ("def f():\n    global branch_labels",),
+        ("revision = 'b'\nrevision += 'c'",),
+        ("del revision",),
+        ("down_revision = {[]: 1}",),
+    )
+    def test_non_literal_header(self, extra):
+        path = self._write(
+            "revision = 'abc'\ndown_revision = None\n%s\n" % extra
+        )
+        is_(_headers.parse_header(path), None)
+
+    @testing.combinations(
+        ("revision = 'abc'\n",),
+        ("down_revision = None\n",),
+        ("revision = 5\ndown_revision = None\n",),
+        ("revision = 'abc'\ndown_revision = None\nfoo bar\n",),
+    )
+    def test_incomplete_header(self, content):
+        path = self._write(content)
+        is_(_headers.parse_header(path), None)
+
+    def test_local_names_are_ignored(self):
+        path = self._write("""\
+            revision = 'abc'
+            down_revision = None
+
+            def upgrade():
+                revision = 'local'
+                for depends_on in []:
+                    pass
+            """)
+        eq_(_headers.parse_header(path).revision, "abc")
+
+    def test_revisions_not_imported(self):
+        a, b, c = three_rev_fixture(self.cfg)
+        with mock.patch(
+            "alembic.util.load_python_file",
+            side_effect=AssertionError("module was loaded"),
+        ):
+            script = ScriptDirectory.from_config(self.cfg)
+            eq_(script.get_heads(), [c])
+            eq_(script.get_revision(b).doc, "Rev B, méil, %3")
+        assert script.get_revision(b)._module is None
+        eq_(script.get_revision(b).module.down_revision, a)
+
+    def test_non_literal_revision_imported(self):
+        a, b, c = three_rev_fixture(self.cfg)
+        script = ScriptDirectory.from_config(self.cfg)
+        write_script(
+            script,
+            c,
+            f"""\
+            "Rev C"
+            revision = '{c}'
+            down_revision = '{b[0:4]}' + '{b[4:]}'
+            """,
+        )
+        script = ScriptDirectory.from_config(self.cfg)
+        rev = script.get_revision(c)
+        assert rev._module is not None
+        eq_(rev.down_revision, b)
+        eq_(script.get_heads(), [c])
+
+
+class RevisionLoadWorkersTest(TestBase):
+    def setUp(self):
+        self.env = staging_env()
+        self.cfg = _sqlite_testing_config()
+        a, b, c = three_rev_fixture(self.cfg)
+        multi_heads_fixture(self.cfg, a, b, c)
+
+    def tearDown(self):
+        clear_staging_env()
+
+    def _load(self, workers):
+        if workers is not None:
+            self.cfg.set_main_option("revision_load_workers", str(workers))
+        script = ScriptDirectory.from_config(self.cfg)
+        return script, list(script.revision_map._revision_map)
+
+    def test_default(self):
+        script, _ = self._load(None)
+        eq_(script.revision_load_workers, 1)
+
+    @testing.combinations("0", "-2", "two", "1.5", argnames="workers")
+    def test_invalid(self, workers):
+        assert_raises_message(
+            util.CommandError,
+            "revision_load_workers must be an integer of 1 or greater; "
+            "got '%s'" % workers,
+            self._load,
+            workers,
+        )
+
+    def test_same_ordering(self):
+        _, serial = self._load(1)
+        script, parallel = self._load(4)
+        eq_(script.revision_load_workers, 4)
+        eq_(parallel, serial)
+        eq_(
+            [rev.revision for rev in script.walk_revisions()],
+            [
+                rev.revision
+                for rev in ScriptDirectory.from_config(
+                    Config(self.cfg.config_file_name)
+                ).walk_revisions()
+            ],
+        )
+
+    def test_headers_read_in_worker_threads(self):
+        threads = set()
+        parse_header = _headers.parse_header
+
+        def track(path):
+            threads.add(threading.current_thread())
+            return parse_header(path)
+
+        with mock.patch("alembic.script._headers.parse_header", track):
+            self._load(4)
+        assert threading.main_thread() not in threads
+
+    def test_cache_shared_by_worker_threads(self):
+        cache_file = os.path.join(
+            _get_staging_directory(), "revision_cache.json"
+        )
+        self.cfg.set_main_option("revision_cache_file", cache_file)
+
+        created = []
+        cache_cls = _headers.RevisionHeaderCache
+
+        def create(path):
+            created.append(cache_cls(path))
+            return created[-1]
+
+        with mock.patch("alembic.script._headers.RevisionHeaderCache", create):
+            script, _ = self._load(4)
+
+        eq_(len(created), 1)
+        with open(cache_file, encoding="utf-8") as file_:
+            entries = json.load(file_)["entries"]
+        eq_(
+            sorted(header["revision"] for header in entries.values()),
+            sorted(rev.revision for rev in script.walk_revisions()),
+        )
+
+
+class ScriptSlotsTest(TestBase):
+    def setUp(self):
+        self.env = staging_env()
+        self.cfg = _sqlite_testing_config()
+        self.a, self.b, self.c = three_rev_fixture(self.cfg)
+
+    def tearDown(self):
+        clear_staging_env()
+
+    def test_no_instance_dict(self):
+        script = ScriptDirectory.from_config(self.cfg)
+        for rev in script.walk_revisions():
+            assert not hasattr(rev, "__dict__")
+            assert_raises_message(
+                AttributeError, "foo", setattr, rev, "foo", "bar"
+            )
@@ -9,7 +9,9 @@ from sqlalchemy.dialects import registry
 from sqlalchemy.engine import default
 
 from alembic import migration
+from alembic import testing
 from alembic.ddl import impl
+from alembic.script.revision import RevisionMap
 from alembic.testing import assert_raises
 from alembic.testing import assert_raises_message
 from alembic.testing import config
@@ -271,6 +273,23 @@ class UpdateRevTest(TestBase):
             self.updater.update_to_step(_down("d2", "c2"))
             self._assert_heads(("c2", "d1"))
 
+    def test_statements_cached(self):
+        compiled_cache = {}
+        self.connection.execution_options(compiled_cache=compiled_cache)
+        with self.connection.begin():
+            self.updater.update_to_step(_up(None, "a", True))
+            self.updater.update_to_step(_up("a", "b"))
+            self.updater.update_to_step(_up(None, "x", True))
+            self.updater.update_to_step(_down("x", None, True))
+            size = len(compiled_cache)
+
+            for from_, to_ in [("b", "c"), ("c", "d"), ("d", "e")]:
+                self.updater.update_to_step(_up(from_, to_))
+            self.updater.update_to_step(_up(None, "y", True))
+            self.updater.update_to_step(_down("y", None, True))
+            eq_(len(compiled_cache), size)
+            self._assert_heads(("e",))
+
     def test_update_no_match(self):
         with self.connection.begin():
             self.updater.update_to_step(_up(None, "a", True))
@@ -382,6 +401,234 @@ class UpdateRevTest(TestBase):
                 self.updater.update_to_step(_down("a", None, True))
 
 
+class DeferredUpdateRevTest(TestBase):
+    __backend__ = True
+
+    @classmethod
+    def setup_class(cls):
+        cls.bind = config.db
+
+    def setUp(self):
+        self.connection = self.bind.connect()
+        with self.connection.begin():
+            version_table.create(self.connection)
+
+    def tearDown(self):
+        in_t = getattr(self.connection, "in_transaction", lambda: False)
+        if in_t():
+            self.connection.rollback()
+        with self.connection.begin():
+            version_table.drop(self.connection, checkfirst=True)
+        self.connection.close()
+
+    def _updater(self, heads=()):
+        self.context = migration.MigrationContext.configure(
+            connection=self.connection, opts={"version_table": "version_table"}
+        )
+        for head in heads:
+            self.connection.execute(
+                version_table.insert(), dict(version_num=head)
+            )
+        self.updater = migration.HeadMaintainer(
+            self.context, heads, defer_writes=True
+        )
+        self.statements = []
+        exec_ = self.context.impl._exec
+
+        def track(construct, *arg, **kw):
+            self.statements.append(construct)
+            return exec_(construct, *arg, **kw)
+
+        self.context.impl._exec = track
+
+    def _assert_heads(self, heads):
+        eq_(set(self.context.get_current_heads()), set(heads))
+        eq_(self.updater.heads, set(heads))
+
+    def test_linear_writes_single_insert(self):
+        with self.connection.begin():
+            self._updater()
+            self.updater.update_to_step(_up(None, "a", True))
+            self.updater.update_to_step(_up("a", "b"))
+            self.updater.update_to_step(_up("b", "c"))
+            eq_(self.statements, [])
+            eq_(self.context.get_current_heads(), ())
+
+            self.updater.flush()
+            eq_(len(self.statements), 1)
+            self._assert_heads(("c",))
+
+    def test_linear_writes_single_update(self):
+        with self.connection.begin():
+            self._updater(("a",))
+            self.updater.update_to_step(_up("a", "b"))
+            self.updater.update_to_step(_up("b", "c"))
+            self.updater.flush()
+            eq_(len(self.statements), 1)
+            self._assert_heads(("c",))
+
+            # nothing further to write
+            self.updater.flush()
+            eq_(len(self.statements), 1)
+
+    def test_no_net_change(self):
+        with self.connection.begin():
+            self._updater(("a",))
+            self.updater.update_to_step(_up("a", "b"))
+            self.updater.update_to_step(_down("b", "a"))
+            self.updater.flush()
+            eq_(self.statements, [])
+            self._assert_heads(("a",))
+
+    def test_branches(self):
+        with self.connection.begin():
+            self._updater(("d1", "d2"))
+            self.updater.update_to_step(_down("d1", "c"))
+            self.updater.update_to_step(_down("d2", "c", True))
+            self.updater.update_to_step(_up("c", "x1"))
+            self.updater.update_to_step(_up("c", "x2", True))
+            self.updater.update_to_step(_up(None, "y", True))
+            self.updater.flush()
+            eq_(len(self.statements), 3)
+            self._assert_heads(("x1", "x2", "y"))
+
+            self.updater.update_to_step(_up(("x1", "x2"), "z"))
+            self.updater.update_to_step(_down("y", None, True))
+            self.updater.flush()
+            eq_(len(self.statements), 6)
+            self._assert_heads(("z",))
+
+    def test_update_no_match(self):
+        with self.connection.begin():
+            self._updater(("a",))
+            self.updater.heads.add("x")
+            self.updater._written_heads.add("x")
+            self.updater.update_to_step(_up("x", "b"))
+            assert_raises_message(
+                CommandError,
+                "Online migration expected to match one row when updating "
+                "'x' to 'b' in 'version_table'; 0 found",
+                self.updater.flush,
+            )
+
+    def test_delete_no_match(self):
+        with self.connection.begin():
+            self._updater(("a",))
+            self.updater.heads.add("x")
+            self.updater._written_heads.add("x")
+            self.updater.update_to_step(_down("x", None, True))
+            assert_raises_message(
+                CommandError,
+                "Online migration expected to match one row when "
+                "deleting 'x' in 'version_table'; 0 found",
+                self.updater.flush,
+            )
+
+    @testing.combinations(
+        (True, False, []),
+        (False, False, ["a", "b", "c"]),
+        (True, True, ["a", "b", "c"]),
+        argnames="transactional_ddl,per_migration,expected",
+    )
+    def test_run_migrations(self, transactional_ddl, per_migration, expected):
+        revision_map = RevisionMap(lambda: [])
+        steps = [
+            migration.StampStep(None, "a", True, True, revision_map),
+            migration.StampStep("a", "b", True, False, revision_map),
+            migration.StampStep("b", "c", True, False, revision_map),
+        ]
+        written = []
+
+        def on_version_apply(ctx, step, heads, run_args):
+            written.extend(ctx.get_current_heads())
+
+        context = migration.MigrationContext.configure(
+            connection=self.connection,
+            opts={
+                "version_table": "version_table",
+                "defer_version_updates": True,
+                "transactional_ddl": transactional_ddl,
+                "transaction_per_migration": per_migration,
+                "on_version_apply": (on_version_apply,),
+                "fn": lambda heads, context: steps,
+            },
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+            eq_(context.get_current_heads(), ("c",))
+
+        eq_(written, expected)
+
+    @testing.combinations(
+        (True, []),
+        (False, ["a", "b", "c"]),
+        argnames="transactional_ddl,expected",
+    )
+    def test_run_migrations_external_transaction(
+        self, transactional_ddl, expected
+    ):
+        revision_map = RevisionMap(lambda: [])
+        steps = [
+            migration.StampStep(None, "a", True, True, revision_map),
+            migration.StampStep("a", "b", True, False, revision_map),
+            migration.StampStep("b", "c", True, False, revision_map),
+        ]
+        written = []
+
+        def on_version_apply(ctx, step, heads, run_args):
+            written.extend(ctx.get_current_heads())
+
+        with self.connection.begin():
+            context = migration.MigrationContext.configure(
+                connection=self.connection,
+                opts={
+                    "version_table": "version_table",
+                    "defer_version_updates": True,
+                    "transactional_ddl": transactional_ddl,
+                    "on_version_apply": (on_version_apply,),
+                    "fn": lambda heads, context: steps,
+                },
+            )
+            with context.begin_transaction():
+                context.run_migrations()
+                eq_(context.get_current_heads(), ("c",))
+
+        eq_(written, expected)
+
+    def test_autocommit_block_flushes(self):
+        revision_map = RevisionMap(lambda: [])
+        steps = [
+            migration.StampStep(None, "a", True, True, revision_map),
+            migration.StampStep("a", "b", True, False, revision_map),
+            migration.StampStep("b", "c", True, False, revision_map),
+        ]
+        written = []
+
+        def migration_fn(**kw):
+            with context.autocommit_block():
+                written.extend(context.get_current_heads())
+            steps[2].stamp_revision(**kw)
+
+        steps[2].migration_fn = migration_fn
+
+        context = migration.MigrationContext.configure(
+            connection=self.connection,
+            opts={
+                "version_table": "version_table",
+                "defer_version_updates": True,
+                "transactional_ddl": True,
+                "fn": lambda heads, context: steps,
+            },
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+            eq_(context.get_current_heads(), ("c",))
+
+        # the heads for the migrations preceding the block are committed
+        # along with them
+        eq_(written, ["b"])
+
+
 registry.register("custom_version", __name__, "CustomVersionDialect")
 
 
@@ -0,0 +1,148 @@
+"""Benchmark of the comparator dispatch performed by autogenerate.
+
+Scales up the ``ModelOne`` fixture of the autogenerate test suite to the
+given number of copies of each of its tables, creates the database side
+of the fixture in a SQLite database, and compares the model side against
+it.  The comparison is run using the :class:`.PriorityDispatcher` and
+also using the dispatch loop in use prior to Alembic 1.19.2, which looked
+up the registered functions for each priority and qualifier on every
+call, for comparison.
+
+The database is reflected before timing starts so that only the
+comparison itself is measured.
+
+Run from the root of the source tree::
+
+    python tools/bench_autogen_dispatch.py --copies 1000
+
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from pathlib import Path
+import sys
+import time
+from typing import Any
+from typing import Callable
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+if True:  # avoid flake/zimports messing with the order
+    from sqlalchemy import create_engine
+    from sqlalchemy import MetaData
+    from sqlalchemy.testing import config
+
+    from tests.requirements import DefaultRequirements
+
+    # the test suite modules imported along with the fixtures refer to the
+    # requirements of the test suite when they're declared
+    config.requirements = DefaultRequirements()
+
+    from alembic.autogenerate import compare
+    from alembic.autogenerate.api import AutogenContext
+    from alembic.autogenerate.compare.util import _InspectorConv
+    from alembic.operations import ops
+    from alembic.runtime.migration import MigrationContext
+    from alembic.testing.suite._autogen_fixtures import ModelOne
+    from alembic.util import DispatchPriority
+    from alembic.util import PriorityDispatcher
+    from alembic.util import PriorityDispatchResult
+
+
+class LegacyPriorityDispatcher(PriorityDispatcher):
+    """Looks up the registered functions for each priority and qualifier
+    on every call."""
+
+    def dispatch(
+        self, target: str, *, qualifier: str = "default"
+    ) -> Callable[..., None]:
+        if qualifier != "default":
+            qualifiers = [qualifier, "default"]
+        else:
+            qualifiers = ["default"]
+
+        def go(*arg: Any, **kw: Any) -> Any:
+            results_by_subgroup: dict[str, PriorityDispatchResult] = {}
+            for priority in DispatchPriority:
+                for qualifier in qualifiers:
+                    for fn, subgroup in self._registry.get(
+                        (target, qualifier, priority), ()
+                    ):
+                        if (
+                            results_by_subgroup.get(
+                                subgroup, PriorityDispatchResult.CONTINUE
+                            )
+                            is PriorityDispatchResult.STOP
+                        ):
+                            continue
+
+                        result = fn(*arg, **kw)
+                        results_by_subgroup[subgroup] = result
+
+        return go
+
+
+def scale(metadata: MetaData, copies: int) -> MetaData:
+    scaled = MetaData()
+    for table in metadata.tables.values():
+        table.to_metadata(scaled)
+        for num in range(1, copies):
+            copy = table.to_metadata(scaled, name=f"{table.name}_{num}")
+            # index and constraint names are unique within the database
+            for obj in [*copy.indexes, *copy.constraints]:
+                if isinstance(obj.name, str):
+                    obj.name = f"{obj.name}_{num}"
+    return scaled
+
+
+def run(
+    dispatcher_cls: type[PriorityDispatcher], conn: Any, model: MetaData
+) -> tuple[float, int]:
+    context = MigrationContext.configure(
+        conn, opts={"compare_type": True, "compare_server_default": True}
+    )
+    autogen_context = AutogenContext(context, model)
+    comparators = dispatcher_cls()
+    comparators.populate_with(autogen_context.comparators)
+    autogen_context.comparators = comparators
+
+    # reflect every table up front, so that only the comparison is timed
+    insp = _InspectorConv(autogen_context.inspector)
+    tablenames = insp.get_table_names(None)
+    insp.pre_cache_tables(None, tablenames, tablenames)
+
+    upgrade_ops = ops.UpgradeOps([])
+    now = time.perf_counter()
+    compare._produce_net_changes(autogen_context, upgrade_ops)
+    elapsed = time.perf_counter() - now
+    return elapsed, len(upgrade_ops.ops)
+
+
+def main(copies: int) -> None:
+    engine = create_engine("sqlite://")
+    scale(ModelOne._get_db_schema(), copies).create_all(engine)
+    model = scale(ModelOne._get_model_schema(), copies)
+
+    print(f"{len(model.tables)} tables")
+    with engine.connect() as conn:
+        for label, dispatcher_cls in [
+            ("precompiled dispatch plan", PriorityDispatcher),
+            ("legacy dispatch", LegacyPriorityDispatcher),
+        ]:
+            elapsed, num_ops = run(dispatcher_cls, conn, model)
+            print(f"{label}: {elapsed:.3f} sec, {num_ops} ops")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--copies",
+        type=int,
+        default=1000,
+        help="number of copies of each table of the fixture",
+    )
+    args = parser.parse_args()
+    main(args.copies)
@@ -0,0 +1,117 @@
+"""Benchmark of a batch mode "move and copy" operation on SQLite.
+
+Creates a table with the given number of rows and two indexes in a SQLite
+database file, then recreates it using :meth:`.Operations.batch_alter_table`,
+reporting the time spent.  The operation is run with the connection's
+default settings, and again with the ``sqlite_fast_batch_copy`` option
+which adjusts PRAGMA settings for the duration of the copy, for
+comparison.
+
+Run from the root of the source tree::
+
+    python tools/bench_batch_sqlite.py --rows 1000000
+
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from pathlib import Path
+import sys
+import tempfile
+import time
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+if True:  # avoid flake/zimports messing with the order
+    from sqlalchemy import Column
+    from sqlalchemy import create_engine
+    from sqlalchemy import Index
+    from sqlalchemy import Integer
+    from sqlalchemy import MetaData
+    from sqlalchemy import String
+    from sqlalchemy import Table
+    from sqlalchemy import text
+
+    from alembic.operations import Operations
+    from alembic.runtime.migration import MigrationContext
+
+
+def setup(url: str, rows: int) -> None:
+    engine = create_engine(url)
+    metadata = MetaData()
+    table = Table(
+        "account",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("name", String(50)),
+        Column("email", String(100)),
+        Column("balance", Integer),
+        Index("ix_account_name", "name"),
+        Index("ix_account_email", "email"),
+    )
+    with engine.begin() as conn:
+        metadata.create_all(conn)
+        chunk = 10000
+        for start in range(0, rows, chunk):
+            conn.execute(
+                table.insert(),
+                [
+                    {
+                        "id": num,
+                        "name": "name %d" % num,
+                        "email": "user%d@example.com" % num,
+                        "balance": num % 1000,
+                    }
+                    for num in range(start + 1, min(start + chunk, rows) + 1)
+                ],
+            )
+    engine.dispose()
+
+
+def run(url: str, rows: int, fast: bool) -> float:
+    engine = create_engine(url)
+    with engine.connect() as conn:
+        context = MigrationContext.configure(
+            conn, opts={"sqlite_fast_batch_copy": fast}
+        )
+        now = time.perf_counter()
+        with context.begin_transaction(_per_migration=True):
+            with Operations(context).batch_alter_table(
+                "account", recreate="always"
+            ) as batch_op:
+                batch_op.alter_column("name", type_=String(100))
+        elapsed = time.perf_counter() - now
+
+        count = conn.scalar(text("SELECT count(*) FROM account"))
+        assert count == rows, count
+    engine.dispose()
+    return elapsed
+
+
+def main(rows: int) -> None:
+    for label, fast in [
+        ("default settings", False),
+        ("sqlite_fast_batch_copy", True),
+    ]:
+        with tempfile.TemporaryDirectory() as tempdir:
+            url = "sqlite:///%s" % Path(tempdir, "bench.db")
+            setup(url, rows)
+            elapsed = run(url, rows, fast)
+        print(
+            f"{rows} rows, {label:<25} {elapsed:8.4f} sec "
+            f"({rows / elapsed:10.0f} rows / sec)"
+        )
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=1000000,
+        help="Number of rows in the table to be recreated",
+    )
+    args = parser.parse_args()
+    main(args.rows)
@@ -0,0 +1,264 @@
+"""Benchmarks for :class:`.RevisionMap` operations on large revision graphs.
+
+The graph is produced by chaining together copies of the revision map in
+``tests/_large_map.py``; the bases of each copy are made to descend from
+the heads of the previous copy, producing a graph with many merge points
+and branch points.
+
+Run from the root of the source tree::
+
+    python tools/bench_revision_map.py --copies 20
+
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+from typing import Any
+from typing import Callable
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+if True:  # avoid flake/zimports messing with the order
+    from alembic.script import _headers
+    from alembic.script.base import Script
+    from alembic.script.revision import Revision
+    from alembic.script.revision import RevisionMap
+    from tests import _large_map
+
+
+def large_graph(copies: int) -> list[Revision]:
+    template = _large_map.data
+    bases = [rev.revision for rev in template if not rev.down_revision]
+    heads = list(_large_map.map_.heads)
+
+    revisions: list[Revision] = []
+    for copy in range(copies):
+
+        def ident(rev_id: str, copy: int = copy) -> str:
+            return f"{rev_id}_{copy}"
+
+        for rev in template:
+            if rev.revision in bases:
+                if copy == 0:
+                    down_revision: Any = None
+                else:
+                    down_revision = tuple(ident(h, copy - 1) for h in heads)
+            else:
+                down_revision = tuple(
+                    ident(down) for down in rev._versioned_down_revisions
+                )
+            revisions.append(Revision(ident(rev.revision), down_revision))
+    return revisions
+
+
+def legacy_topological_sort(
+    revmap: RevisionMap, revisions: Any, heads: Any
+) -> list[str]:
+    """The implementation of RevisionMap._topological_sort() prior to
+    Alembic 1.19.2, used to verify that the current implementation
+    produces the same ordering and to compare timings."""
+
+    id_to_rev = revmap._revision_map
+
+    def get_ancestors(rev_id: str) -> set[str]:
+        return {
+            r.revision for r in revmap._get_ancestor_nodes([id_to_rev[rev_id]])
+        }
+
+    todo = {d.revision for d in revisions}
+    inserted_order = list(revmap._revision_map)
+    current_heads = list(
+        sorted(
+            {d.revision for d in heads if d.revision in todo},
+            key=inserted_order.index,
+        )
+    )
+    ancestors_by_idx = [get_ancestors(rev_id) for rev_id in current_heads]
+    output = []
+    current_candidate_idx = 0
+    while current_heads:
+        candidate = current_heads[current_candidate_idx]
+        for check_head_index, ancestors in enumerate(ancestors_by_idx):
+            if (
+                check_head_index != current_candidate_idx
+                and candidate in ancestors
+            ):
+                current_candidate_idx = check_head_index
+                break
+        else:
+            if candidate in todo:
+                output.append(candidate)
+                todo.remove(candidate)
+            candidate_rev = id_to_rev[candidate]
+            assert candidate_rev is not None
+            heads_to_add = [
+                r
+                for r in candidate_rev._normalized_down_revisions
+                if r in todo and r not in current_heads
+            ]
+            if not heads_to_add:
+                del current_heads[current_candidate_idx]
+                del ancestors_by_idx[current_candidate_idx]
+                current_candidate_idx = max(current_candidate_idx - 1, 0)
+            elif (
+                not candidate_rev._normalized_resolved_dependencies
+                and len(candidate_rev._versioned_down_revisions) == 1
+            ):
+                current_heads[current_candidate_idx] = heads_to_add[0]
+                ancestors_by_idx[current_candidate_idx].discard(candidate)
+            else:
+                current_heads[current_candidate_idx] = heads_to_add[0]
+                current_heads.extend(heads_to_add[1:])
+                ancestors_by_idx[current_candidate_idx] = get_ancestors(
+                    heads_to_add[0]
+                )
+                ancestors_by_idx.extend(
+                    get_ancestors(head) for head in heads_to_add[1:]
+                )
+    assert not todo
+    return output
+
+
+def legacy_shares_lineage(
+    revmap: RevisionMap, target: Revision, test_against_rev: Revision
+) -> bool:
+    """Lineage test as performed prior to Alembic 1.19.2, by walking the
+    full set of ancestors and descendants of the target."""
+
+    return test_against_rev in set(
+        revmap._get_descendant_nodes([target], include_dependencies=False)
+    ).union(revmap._get_ancestor_nodes([target], include_dependencies=False))
+
+
+def scripts(revisions: list[Revision]) -> list[Script]:
+    """Produce :class:`.Script` objects from the given revisions as
+    they'd be read from a revision cache file, without any modules."""
+
+    return [
+        Script(
+            None,
+            rev.revision,
+            f"/path/to/versions/{rev.revision}_some_message.py",
+            header=_headers.RevisionHeader(
+                rev.revision,
+                rev.down_revision,
+                (),
+                None,
+                f"some message for {rev.revision}",
+            ),
+        )
+        for rev in revisions
+    ]
+
+
+def measure_memory(
+    label: str,
+    copies: int,
+    factory: Callable[[list[Revision]], list[Any]],
+) -> None:
+    """Report the memory retained per revision by a fully initialized
+    :class:`.RevisionMap` of the revisions produced by the given factory.
+
+    The revision identifiers themselves are generated outside of the
+    measurement.
+
+    """
+    revisions = large_graph(copies)
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        produced = factory(revisions)
+        revmap = RevisionMap(lambda: produced)
+        revmap.heads
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    print(
+        f"{label:<40} {(after - before) / len(revisions):10.1f} "
+        "bytes / revision"
+    )
+
+
+def timed(label: str, fn: Callable[[], Any]) -> Any:
+    now = time.perf_counter()
+    result = fn()
+    print(f"{label:<40} {time.perf_counter() - now:10.4f} sec")
+    return result
+
+
+def main(copies: int) -> None:
+    revisions = large_graph(copies)
+    revmap = RevisionMap(lambda: revisions)
+    timed("build revision map", lambda: revmap.heads)
+    print(
+        f"{len(revisions)} revisions, "
+        f"{sum(1 for r in revisions if r.is_merge_point)} merge points, "
+        f"{len(revmap.heads)} heads"
+    )
+
+    collected, heads = revmap._collect_upgrade_revisions(
+        "heads",
+        None,
+        inclusive=False,
+        implicit_base=False,
+        assert_relative_length=True,
+    )
+    current = timed(
+        "_topological_sort()",
+        lambda: revmap._topological_sort(collected, heads),
+    )
+    legacy = timed(
+        "legacy _topological_sort()",
+        lambda: legacy_topological_sort(revmap, collected, heads),
+    )
+    assert current == legacy, "ordering differs from legacy implementation"
+
+    # lineage tests, as used by filter_for_lineage() when resolving
+    # upgrade / downgrade targets
+    all_revs = [revmap._revision_map[rev.revision] for rev in revisions]
+    targets = all_revs[:: max(len(all_revs) // 20, 1)]
+    others = all_revs[:: max(len(all_revs) // 100, 1)]
+    pairs = [(target, other) for target in targets for other in others]
+
+    timed("build ancestor index", lambda: revmap._versioned_ancestor_index)
+    current = timed(
+        f"{len(pairs)} _shares_lineage() tests",
+        lambda: [
+            revmap._shares_lineage(target, [other]) for target, other in pairs
+        ],
+    )
+    legacy = timed(
+        f"{len(pairs)} legacy _shares_lineage() tests",
+        lambda: [
+            legacy_shares_lineage(revmap, target, other)
+            for target, other in pairs
+        ],
+    )
+    assert current == legacy, "lineage differs from legacy implementation"
+
+    measure_memory(
+        "Revision memory",
+        copies,
+        lambda revs: [
+            Revision(rev.revision, rev.down_revision) for rev in revs
+        ],
+    )
+    measure_memory("Script memory", copies, scripts)
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--copies",
+        type=int,
+        default=20,
+        help="Number of copies of tests/_large_map.py to chain together",
+    )
+    args = parser.parse_args()
+    main(args.copies)
@@ -0,0 +1,98 @@
+"""Benchmark of the version table bookkeeping performed for each
+migration step.
+
+Runs a series of stamp steps, each moving a single head up by one
+revision, against an in-memory SQLite database and reports the time
+spent per step.  The same steps are also run using statements which
+render each revision identifier inline, as was done prior to Alembic
+1.19.2, for comparison.
+
+Run from the root of the source tree::
+
+    python tools/bench_version_table.py --steps 1000
+
+"""
+
+from __future__ import annotations
+
+from argparse import ArgumentParser
+from pathlib import Path
+import sys
+import time
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+if True:  # avoid flake/zimports messing with the order
+    from sqlalchemy import create_engine
+    from sqlalchemy import literal_column
+
+    from alembic.runtime.migration import HeadMaintainer
+    from alembic.runtime.migration import MigrationContext
+    from alembic.runtime.migration import StampStep
+
+
+class LegacyHeadMaintainer(HeadMaintainer):
+    """Emits version table statements with the revision identifiers
+    rendered inline, producing a new statement for each step."""
+
+    def _write_insert(self, version: str) -> None:
+        self.context.impl._exec(
+            self.context._version.insert().values(
+                version_num=literal_column("'%s'" % version)
+            )
+        )
+
+    def _write_update(self, from_: str, to_: str) -> None:
+        self.context.impl._exec(
+            self.context._version.update()
+            .values(version_num=literal_column("'%s'" % to_))
+            .where(
+                self.context._version.c.version_num
+                == literal_column("'%s'" % from_)
+            )
+        )
+
+
+def run(maintainer_cls: type[HeadMaintainer], steps: int) -> float:
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        context = MigrationContext.configure(conn)
+        context._ensure_version_table()
+        maintainer = maintainer_cls(context, ())
+
+        revisions = ["rev%06d" % num for num in range(steps + 1)]
+        maintainer.update_to_step(StampStep(None, revisions[0], True, True))
+
+        now = time.perf_counter()
+        for from_, to_ in zip(revisions, revisions[1:]):
+            maintainer.update_to_step(StampStep(from_, to_, True, False))
+        elapsed = time.perf_counter() - now
+
+        assert context.get_current_heads() == (revisions[-1],)
+    engine.dispose()
+    return elapsed
+
+
+def main(steps: int) -> None:
+    for label, maintainer_cls in [
+        ("bound parameters", HeadMaintainer),
+        ("legacy inline literals", LegacyHeadMaintainer),
+    ]:
+        elapsed = run(maintainer_cls, steps)
+        print(
+            f"{steps} steps, {label:<25} {elapsed:8.4f} sec "
+            f"({elapsed / steps * 1000000:8.1f} usec / step)"
+        )
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--steps",
+        type=int,
+        default=1000,
+        help="Number of stamp steps to run",
+    )
+    args = parser.parse_args()
+    main(args.steps)